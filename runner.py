@@ -3,14 +3,282 @@
 # Before running this script, please read the README.md file for instructions and explanations.
 import argparse
 import datetime
+import errno
+import filecmp
+import io
+import itertools
 import json
+import multiprocessing
+import multiprocessing.connection
 import os
-import re
 import shutil
-import subprocess
+import signal
+import stat
 import sys
+import tempfile
+import threading
+import time
 
 CONFIRMATION_FILE = ".readme_confirmed"
+TEST_OUTCOMES = ("passed", "failed", "error", "skipped", "xfailed", "xpassed")
+# Modules imported once by the verifier forkserver and inherited by every worker.
+VERIFIER_PRELOAD_MODULES = ["__main__", "pytest", "json", "subprocess", "unittest.mock"]
+
+VERIFIER_CACHE_DIR = ".verifier_cache"
+VERIFIER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+VERIFIER_CACHE_IGNORED_DIRS = {"__pycache__", ".pytest_cache"}
+# Isolated per-candidate workspaces of 'evaluate --candidates', one directory per run.
+RUNS_DIR = ".runs"
+# Helper scripts shared by the verifiers of several tasks, at ../../../verifier_support from each verifier.
+VERIFIER_SUPPORT_DIR = "verifier_support"
+# Per-task directory where verifiers cache generated inputs; isolated workspaces link to the task's own.
+GENERATED_DATA_DIR = ".generated"
+# Content-addressed store of evaluated solutions: one object per distinct file
+# content under objects/, and one manifest per distinct solution under manifests/.
+SNAPSHOT_DIR = ".snapshots"
+SNAPSHOT_DIR_MAX_BYTES = 1024 * 1024 * 1024
+# Distinct snapshots that 'reverify' restores at a time, per parallel job.
+REVERIFY_BATCH_PER_JOB = 4
+
+# Verifier output streams to the console and into one gzip-compressed log per
+# run; outcomes and results.json keep only its tail and the log's path.
+VERIFIER_LOG_DIR = ".verifier_logs"
+# Default for RUNNER_VERIFIER_LOG_MAX_BYTES, the uncompressed size at which a log is cut off.
+VERIFIER_LOG_MAX_BYTES = 16 * 1024 * 1024
+VERIFIER_LOG_DIR_MAX_BYTES = 256 * 1024 * 1024
+VERIFIER_OUTPUT_TAIL_LINES = 40
+VERIFIER_OUTPUT_TAIL_CHARS = 8 * 1024
+VERIFIER_OUTPUT_CHUNK_CHARS = 8 * 1024
+
+PROFILE_SUMMARY = "profile.json"
+PROFILE_STACKS = "profile.collapsed"
+PROFILE_SAMPLE_INTERVAL = 0.005
+PROFILE_TOP_ENTRIES = 20
+PROFILE_REPORT_HOTSPOTS = 3
+# Installed as sitecustomize.py for the processes a profiled verifier starts.
+PROFILE_HOOK_SOURCE = """\
+import importlib.machinery
+import importlib.util
+import os
+import sys
+
+def _load(name, spec):
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Run any sitecustomize module that this one shadows.
+_hook_dir = os.path.dirname(os.path.abspath(__file__))
+_spec = importlib.machinery.PathFinder.find_spec("sitecustomize", [p for p in sys.path if os.path.abspath(p or ".") != _hook_dir])
+if _spec is not None:
+    _load("_shadowed_sitecustomize", _spec)
+_runner = _load("_runner_profiler", importlib.util.spec_from_file_location("_runner_profiler", os.environ["RUNNER_PROFILE_RUNNER"]))
+_runner.ProcessProfiler.profile_until_exit(os.environ["RUNNER_PROFILE_DIR"])
+"""
+
+IMPACT_MAP = ".test_impact.json"
+IMPACT_MAP_FORMAT = 1
+# Tests that ended otherwise are re-run even if nothing they call changed.
+IMPACT_REUSABLE_OUTCOMES = ("passed", "skipped", "xfailed", "xpassed")
+
+# 'evaluate --watch' reacts to changes in these task subdirectories and task.json.
+WATCHED_TREES = ("solution", "verifier")
+WATCH_LOG = ".watch_log.jsonl"
+WATCH_DEBOUNCE_SECONDS = 0.2
+WATCH_MAX_DEBOUNCE_SECONDS = 2.0
+WATCH_POLL_INTERVAL = 0.5
+
+# inotify event bits, from <sys/inotify.h>.
+INOTIFY_MODIFY = 0x2
+INOTIFY_CLOSE_WRITE = 0x8
+INOTIFY_MOVED_FROM = 0x40
+INOTIFY_MOVED_TO = 0x80
+INOTIFY_CREATE = 0x100
+INOTIFY_DELETE = 0x200
+INOTIFY_Q_OVERFLOW = 0x4000
+INOTIFY_IGNORED = 0x8000
+INOTIFY_ISDIR = 0x40000000
+INOTIFY_MASK = INOTIFY_MODIFY | INOTIFY_CLOSE_WRITE | INOTIFY_MOVED_FROM | INOTIFY_MOVED_TO | INOTIFY_CREATE | INOTIFY_DELETE
+
+# Files in each task directory that 'reset' removes; task.json can add more under "reset_paths".
+RESET_PATHS = [".start_time", "solution", "results.json", WATCH_LOG, IMPACT_MAP, PROFILE_SUMMARY, PROFILE_STACKS]
+
+# Manifest of the task registry, rebuilt when the 'tasks' directory changes.
+TASK_REGISTRY = ".task_registry.json"
+TASK_REGISTRY_FORMAT = 1
+
+# Unix socket of the 'serve' daemon; commands are routed through it while it is running.
+DAEMON_SOCKET = ".runner.sock"
+# Commands the daemon runs; 'serve' itself always runs locally.
+DAEMON_COMMANDS = {"list", "start", "evaluate", "report", "export", "merge", "reverify", "reset"}
+# Verifier outcomes kept in memory on top of the on-disk verification cache.
+OUTCOME_MEMORY_CACHE_SIZE = 256
+
+RESULTS_DB = "results.db"
+# Schema migrations for the run history database, applied in order and tracked via PRAGMA user_version.
+RESULTS_DB_MIGRATIONS = [
+    """
+    CREATE TABLE sessions (
+        session_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        started_at TEXT NOT NULL
+    );
+    CREATE TABLE runs (
+        run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id INTEGER NOT NULL REFERENCES sessions (session_id),
+        task_name TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        correctness REAL NOT NULL,
+        task_completion REAL NOT NULL,
+        final_score REAL NOT NULL,
+        execution_time REAL,
+        verifier_duration REAL,
+        pytest_exit_code INTEGER,
+        passed INTEGER NOT NULL,
+        failed INTEGER NOT NULL,
+        errors INTEGER NOT NULL,
+        skipped INTEGER NOT NULL,
+        xfailed INTEGER NOT NULL,
+        xpassed INTEGER NOT NULL,
+        verifier_cache TEXT
+    );
+    CREATE INDEX runs_by_session_task ON runs (session_id, task_name, run_id);
+    CREATE INDEX runs_by_task ON runs (task_name, run_id);
+    CREATE TABLE test_results (
+        run_id INTEGER NOT NULL REFERENCES runs (run_id),
+        nodeid TEXT NOT NULL,
+        outcome TEXT NOT NULL,
+        duration REAL NOT NULL,
+        message TEXT
+    );
+    CREATE INDEX test_results_by_run ON test_results (run_id);
+    """,
+    """
+    CREATE TABLE run_timings (
+        run_id INTEGER NOT NULL REFERENCES runs (run_id),
+        phase TEXT NOT NULL,
+        seconds REAL NOT NULL
+    );
+    CREATE INDEX run_timings_by_run ON run_timings (run_id);
+    """,
+    """
+    ALTER TABLE runs ADD COLUMN timed_out INTEGER NOT NULL DEFAULT 0;
+    ALTER TABLE runs ADD COLUMN user_cpu REAL;
+    ALTER TABLE runs ADD COLUMN system_cpu REAL;
+    ALTER TABLE runs ADD COLUMN max_rss_kb INTEGER;
+    ALTER TABLE runs ADD COLUMN voluntary_context_switches INTEGER;
+    ALTER TABLE runs ADD COLUMN involuntary_context_switches INTEGER;
+    """,
+    """
+    ALTER TABLE runs ADD COLUMN performance REAL;
+    ALTER TABLE runs ADD COLUMN max_score REAL NOT NULL DEFAULT 80;
+    CREATE TABLE run_metrics (
+        run_id INTEGER NOT NULL REFERENCES runs (run_id),
+        name TEXT NOT NULL,
+        value REAL NOT NULL
+    );
+    CREATE INDEX run_metrics_by_run ON run_metrics (run_id);
+    """,
+    """
+    ALTER TABLE runs ADD COLUMN flaky_tests INTEGER NOT NULL DEFAULT 0;
+    CREATE TABLE run_trials (
+        run_id INTEGER NOT NULL REFERENCES runs (run_id),
+        trial INTEGER NOT NULL,
+        verifier_duration REAL,
+        passed INTEGER NOT NULL,
+        failed INTEGER NOT NULL,
+        errors INTEGER NOT NULL
+    );
+    CREATE INDEX run_trials_by_run ON run_trials (run_id);
+    """,
+    """
+    ALTER TABLE runs ADD COLUMN test_workers INTEGER NOT NULL DEFAULT 1;
+    """,
+    """
+    ALTER TABLE runs ADD COLUMN started_at TEXT;
+    ALTER TABLE runs ADD COLUMN attempt INTEGER;
+    ALTER TABLE runs ADD COLUMN attempt_verifier_seconds REAL;
+    ALTER TABLE runs ADD COLUMN attempt_flips INTEGER;
+    ALTER TABLE runs ADD COLUMN first_pass_attempt INTEGER;
+    ALTER TABLE runs ADD COLUMN first_pass_offset REAL;
+    CREATE INDEX runs_by_task_start ON runs (task_name, started_at, run_id);
+    CREATE TABLE run_flips (
+        run_id INTEGER NOT NULL REFERENCES runs (run_id),
+        nodeid TEXT NOT NULL,
+        previous TEXT NOT NULL,
+        outcome TEXT NOT NULL
+    );
+    CREATE INDEX run_flips_by_run ON run_flips (run_id);
+    """,
+    """
+    ALTER TABLE runs ADD COLUMN snapshot TEXT;
+    ALTER TABLE runs ADD COLUMN reverified_from INTEGER REFERENCES runs (run_id);
+    """,
+    """
+    ALTER TABLE runs ADD COLUMN run_verifier_seconds REAL;
+    """,
+    """
+    ALTER TABLE sessions ADD COLUMN reverify INTEGER NOT NULL DEFAULT 0;
+    UPDATE sessions SET reverify = 1
+        WHERE session_id IN (SELECT session_id FROM runs WHERE reverified_from IS NOT NULL);
+    """,
+]
+
+# Points available for the optional performance axis of tasks that declare budgets.
+PERFORMANCE_POINTS = 20
+# Prefix of the record_property names that verifiers use to emit performance metrics.
+METRIC_PREFIX = "metric:"
+# Defaults for the "limits" section of a task's task.json; None disables a limit.
+DEFAULT_TASK_LIMITS = {"timeout_seconds": 600, "cpu_seconds": None, "memory_mb": None}
+# Linux ioctl that clones a file's extents into another file (copy-on-write).
+FICLONE = 0x40049409
+# Two-sided 95% Student's t critical values for 1 to 30 degrees of freedom; larger samples use 1.96.
+T_CRITICAL_95 = [
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+]
+# Version of the bundle format written by 'export' and read by 'merge'.
+EXPORT_FORMAT = 1
+
+# The latest run of each task in a session (bound to the session id).
+LATEST_RUNS_SQL = "SELECT MAX(run_id) AS run_id FROM runs WHERE session_id = ? GROUP BY task_name"
+# The latest run of each task in a session that was an attempt since 'start'.
+LATEST_ATTEMPTS_SQL = "SELECT MAX(run_id) AS run_id FROM runs WHERE session_id = ? AND started_at IS NOT NULL GROUP BY task_name"
+# Outcomes that count towards the correctness score, and so can flip between passing and failing.
+SCORED_OUTCOMES = ("passed", "failed", "error")
+# Phases recorded in results.json "timings", with their report column labels.
+TIMING_PHASES = [
+    ("workspace_prep", "Prep"),
+    ("prompt_display", "Prompt"),
+    ("agent_think", "Think"),
+    ("solution_snapshot", "Snapshot"),
+    ("cache_lookup", "Cache"),
+    ("verifier_spawn", "Spawn"),
+    ("pytest_startup", "Startup"),
+    ("pytest_collection", "Collect"),
+    ("test_execution", "Tests"),
+    ("result_persistence", "Persist"),
+]
+
+_verifier_context = None
+_reflink_supported = True
+# In-memory task registry and outcome cache, mostly of use to a long-running 'serve' process.
+_task_registry = None
+_outcome_memory_cache = None
+# Per-thread output sinks and client environments of the 'serve' daemon, created when it starts.
+_output_sinks = None
+_job_environs = None
+# Guards the task registry against concurrent 'serve' jobs updating and saving it.
+_task_registry_lock = threading.RLock()
+
+def get_environ():
+    """Returns the environment of the command being run: its client's in a 'serve' job, else the process's."""
+    environ = getattr(_job_environs, "environ", None) if _job_environs is not None else None
+    return os.environ if environ is None else environ
+
+def verifier_log_max_bytes():
+    """Returns the uncompressed size at which a verifier output log is cut off."""
+    return int(get_environ().get("RUNNER_VERIFIER_LOG_MAX_BYTES", VERIFIER_LOG_MAX_BYTES))
 
 def get_task_dir(task_name):
     """Get the directory for a given task."""
@@ -20,25 +288,438 @@ def get_task_dir(task_name):
         sys.exit(1)
     return task_dir
 
+def _read_task_json(task_dir):
+    """Returns the mtime and settings of a task's optional task.json, or (None, {}) without one."""
+    config_path = os.path.join(task_dir, "task.json")
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+        with open(config_path, 'r') as f:
+            return mtime, json.load(f)
+    except FileNotFoundError:
+        return None, {}
+
+def _save_task_registry(registry):
+    """Writes the task registry manifest; a read-only checkout simply goes without."""
+    try:
+        write_json_atomic(TASK_REGISTRY, registry)
+    except OSError:
+        pass
+
+def load_task_registry():
+    """
+    Returns the task registry, {task name: entry} in name order, where each
+    entry holds the task directory's mtime and its task.json settings with
+    their mtime. The registry is kept in the TASK_REGISTRY manifest and only
+    rebuilt when the tasks directory's mtime shows that tasks were added or
+    removed, and then only tasks whose own directory changed are re-read, so
+    commands do not rescan a large catalogue. Edits to a task.json are picked
+    up by load_task_config.
+    """
+    with _task_registry_lock:
+        return _load_task_registry()
+
+def _load_task_registry():
+    """Does the work of load_task_registry, with _task_registry_lock held."""
+    global _task_registry
+    try:
+        mtime = os.stat("tasks").st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    if _task_registry is not None and _task_registry["tasks_mtime"] == mtime:
+        return _task_registry["tasks"]
+    registry = None
+    try:
+        with open(TASK_REGISTRY, 'r') as f:
+            registry = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        pass
+    if registry is None or registry.get("format") != TASK_REGISTRY_FORMAT or registry["tasks_mtime"] != mtime:
+        previous = registry["tasks"] if registry and registry.get("format") == TASK_REGISTRY_FORMAT else {}
+        tasks = {}
+        with os.scandir("tasks") as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                task_mtime = entry.stat().st_mtime_ns
+                known = previous.get(entry.name)
+                if known is not None and known["mtime"] == task_mtime:
+                    tasks[entry.name] = known
+                else:
+                    config_mtime, config = _read_task_json(entry.path)
+                    tasks[entry.name] = {"mtime": task_mtime, "config_mtime": config_mtime, "config": config}
+        # The mtime from before the scan: a change during it triggers another rebuild.
+        registry = {"format": TASK_REGISTRY_FORMAT, "tasks_mtime": mtime, "tasks": dict(sorted(tasks.items()))}
+        _save_task_registry(registry)
+    _task_registry = registry
+    return registry["tasks"]
+
+def load_task_config(task_name):
+    """Loads a task's optional task.json, filling in defaults for missing settings."""
+    task_dir = get_task_dir(task_name)
+    try:
+        mtime = os.stat(os.path.join(task_dir, "task.json")).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    with _task_registry_lock:
+        entry = load_task_registry().get(task_name)
+        if entry is None or entry["config_mtime"] != mtime:
+            config_mtime, config = _read_task_json(task_dir)
+            if entry is None:
+                entry = {"config": config}
+            else:
+                entry.update(config_mtime=config_mtime, config=config)
+                _save_task_registry(_task_registry)
+        # Callers adjust the returned settings, so each gets its own copy.
+        config = json.loads(json.dumps(entry["config"]))
+    config["limits"] = dict(DEFAULT_TASK_LIMITS, **config.get("limits", {}))
+    _validate_performance_budgets(task_name, config.get("performance", {}))
+    return config
+
+def _validate_performance_budgets(task_name, budgets):
+    """Exits with an error if a task.json performance budget is not a positive number compared higher or lower."""
+    for name, budget in budgets.items():
+        value = budget.get("budget") if isinstance(budget, dict) else None
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            print(f"Error: The performance budget '{name}' of '{task_name}' must be a positive number.")
+            sys.exit(1)
+        if budget.get("better", "higher") not in ("higher", "lower"):
+            print(f"Error: The performance budget '{name}' of '{task_name}' must be better 'higher' or 'lower'.")
+            sys.exit(1)
+
+def measures_performance(task_name, pytest_args=None):
+    """
+    Returns True if a verifier run measures performance that is scored: a run
+    of a task with budgets other than a test collection. Such runs are timed
+    alone, since other verifiers running alongside distort their metrics.
+    """
+    return bool(load_task_config(task_name).get("performance")) and "--collect-only" not in (pytest_args or [])
+
+def _reflink_file(src, dst):
+    """Clones src to dst with a copy-on-write reflink; returns False if unsupported."""
+    global _reflink_supported
+    if not _reflink_supported:
+        return False
+    try:
+        import fcntl
+    except ImportError:
+        _reflink_supported = False
+        return False
+    try:
+        with open(src, 'rb') as s, open(dst, 'wb') as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+    except OSError as e:
+        if os.path.exists(dst):
+            os.remove(dst)
+        if e.errno in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EXDEV, errno.ENOSYS):
+            _reflink_supported = False
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+def _remove_path(path):
+    """Removes a file, symlink or directory tree."""
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
+
+def _files_match(src, dst, src_stat):
+    """Returns True if dst already holds the same content as src."""
+    try:
+        dst_stat = os.lstat(dst)
+    except FileNotFoundError:
+        return False
+    if not stat.S_ISREG(dst_stat.st_mode):
+        return False
+    if (dst_stat.st_dev, dst_stat.st_ino) == (src_stat.st_dev, src_stat.st_ino):
+        # A hardlink left by an older runner: replace it, so edits cannot reach the source.
+        return False
+    if dst_stat.st_size != src_stat.st_size:
+        return False
+    if dst_stat.st_mtime_ns == src_stat.st_mtime_ns:
+        return True
+    if filecmp.cmp(src, dst, shallow=False):
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        return True
+    return False
+
+def sync_tree(src_dir, dst_dir, stats):
+    """
+    Makes dst_dir an exact copy of src_dir, touching only entries that differ.
+
+    Changed files are cloned with a reflink where the filesystem supports it,
+    and copied otherwise. Files are never hardlinked: making a shared file
+    writable and editing it would change the source too. The file and byte
+    counts of each strategy are accumulated into stats (new_sync_stats).
+    """
+    if os.path.lexists(dst_dir) and (os.path.islink(dst_dir) or not os.path.isdir(dst_dir)):
+        os.remove(dst_dir)
+    os.makedirs(dst_dir, exist_ok=True)
+
+    src_names = set(os.listdir(src_dir))
+    for name in os.listdir(dst_dir):
+        if name not in src_names:
+            _remove_path(os.path.join(dst_dir, name))
+
+    for name in sorted(src_names):
+        s = os.path.join(src_dir, name)
+        d = os.path.join(dst_dir, name)
+        src_stat = os.lstat(s)
+        if stat.S_ISLNK(src_stat.st_mode):
+            target = os.readlink(s)
+            if os.path.islink(d) and os.readlink(d) == target:
+                continue
+            if os.path.lexists(d):
+                _remove_path(d)
+            os.symlink(target, d)
+        elif stat.S_ISDIR(src_stat.st_mode):
+            sync_tree(s, d, stats)
+        else:
+            if _files_match(s, d, src_stat):
+                strategy = "unchanged"
+            else:
+                if os.path.lexists(d):
+                    _remove_path(d)
+                if _reflink_file(s, d):
+                    strategy = "cloned"
+                else:
+                    shutil.copy2(s, d)
+                    strategy = "copied"
+            stats[strategy]["files"] += 1
+            stats[strategy]["bytes"] += src_stat.st_size
+    return stats
+
+def new_sync_stats():
+    """Returns empty sync_tree stats: the files and bytes copied, cloned and left unchanged."""
+    return {strategy: {"files": 0, "bytes": 0} for strategy in ("copied", "cloned", "unchanged")}
+
+def format_bytes(size):
+    """Formats a byte count for display."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
 def prepare_workspace(task_name):
-    """Prepares the workspace for a task by cleaning and copying initial code."""
+    """Prepares the workspace for a task by syncing the initial code into the solution directory."""
     task_dir = get_task_dir(task_name)
     initial_code_dir = os.path.join(task_dir, "initial_code")
     solution_dir = os.path.join(task_dir, "solution")
 
     if os.path.exists(initial_code_dir):
-        if os.path.exists(solution_dir):
-            shutil.rmtree(solution_dir)
-        os.makedirs(solution_dir)
-        
-        for item in os.listdir(initial_code_dir):
-            s = os.path.join(initial_code_dir, item)
-            d = os.path.join(solution_dir, item)
-            if os.path.isdir(s):
-                shutil.copytree(s, d, symlinks=True)
-            else:
-                shutil.copy2(s, d)
-        print(f"Workspace prepared: '{initial_code_dir}' copied to '{solution_dir}'.")
+        stats = sync_tree(initial_code_dir, solution_dir, new_sync_stats())
+        print(f"Workspace prepared: '{initial_code_dir}' synced to '{solution_dir}'.")
+        print(
+            f"{stats['copied']['files']} files copied ({format_bytes(stats['copied']['bytes'])}), "
+            f"{stats['cloned']['files']} reflinked ({format_bytes(stats['cloned']['bytes'])}), "
+            f"{stats['unchanged']['files']} already up to date ({format_bytes(stats['unchanged']['bytes'])})."
+        )
+
+def prepare_run_workspace(task_name, workspace_root, solution_source):
+    """
+    Builds an isolated copy of a task at workspace_root/tasks/<task>/, laid out
+    like the repository so that verifiers find everything at the usual relative
+    paths: the task's verifier, initial code and task.json, the shared verifier
+    support scripts, plus a solution directory synced from solution_source,
+    unless that is None and the caller fills it in. The task's .generated
+    directory is linked rather than copied, so inputs that a verifier generates
+    once are reused by every workspace. Returns the sync stats.
+    """
+    task_dir = get_task_dir(task_name)
+    run_task_dir = os.path.join(workspace_root, "tasks", task_name)
+    os.makedirs(run_task_dir, exist_ok=True)
+    stats = new_sync_stats()
+    for name in ("verifier", "initial_code"):
+        if os.path.isdir(os.path.join(task_dir, name)):
+            sync_tree(os.path.join(task_dir, name), os.path.join(run_task_dir, name), stats)
+    for name in ("task.json", "prompt.md"):
+        if os.path.exists(os.path.join(task_dir, name)):
+            shutil.copy2(os.path.join(task_dir, name), os.path.join(run_task_dir, name))
+    if os.path.isdir(VERIFIER_SUPPORT_DIR):
+        sync_tree(VERIFIER_SUPPORT_DIR, os.path.join(workspace_root, VERIFIER_SUPPORT_DIR), stats)
+    generated_dir = os.path.abspath(os.path.join(task_dir, GENERATED_DATA_DIR))
+    os.makedirs(generated_dir, exist_ok=True)
+    generated_link = os.path.join(run_task_dir, GENERATED_DATA_DIR)
+    if not os.path.islink(generated_link):
+        if os.path.lexists(generated_link):
+            _remove_path(generated_link)
+        os.symlink(generated_dir, generated_link)
+    if solution_source is not None:
+        sync_tree(solution_source, os.path.join(run_task_dir, "solution"), stats)
+    return stats
+
+def _snapshot_object_path(digest):
+    """Returns the path of the snapshot store object holding the content with the given SHA-256."""
+    return os.path.join(SNAPSHOT_DIR, "objects", digest[:2], digest)
+
+def _hash_file(path):
+    """Returns the SHA-256 of a file's content."""
+    import hashlib
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _store_snapshot_object(path):
+    """
+    Adds a file's content to the snapshot store unless an identical object is
+    already there, and returns its SHA-256. New objects are cloned with a
+    reflink where supported, never hardlinked, so later edits to the file
+    cannot reach the store.
+    """
+    digest = _hash_file(path)
+    object_path = _snapshot_object_path(digest)
+    if os.path.exists(object_path):
+        return digest
+    os.makedirs(os.path.dirname(object_path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=os.path.dirname(object_path))
+    os.close(fd)
+    try:
+        if not _reflink_file(path, tmp_path):
+            shutil.copyfile(path, tmp_path)
+        # The file may have changed since it was hashed; store what was copied.
+        copied_digest = _hash_file(tmp_path)
+        if copied_digest != digest:
+            digest, object_path = copied_digest, _snapshot_object_path(copied_digest)
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        os.chmod(tmp_path, 0o444)
+        os.replace(tmp_path, object_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return digest
+
+def snapshot_solution(task_name, timings=None):
+    """
+    Stores a task's solution directory in the snapshot store and returns the
+    snapshot id, the SHA-256 of its manifest. Each distinct file content is
+    stored once, so snapshots of near-identical solutions cost little more than
+    their manifests. Symlinks are followed and stored as the content they
+    point to, so a snapshot never depends on files outside the store; broken
+    links are left out. Bytecode and pytest caches are left out, as in the
+    verifier cache key. Returns None if there is no solution or it cannot be
+    stored. The time taken is recorded in timings, if given.
+    """
+    import hashlib
+
+    started = time.monotonic()
+    solution_dir = os.path.join(get_task_dir(task_name), "solution")
+    if not os.path.isdir(solution_dir):
+        return None
+    files = {}
+    visited = set()
+    try:
+        for dirpath, dirnames, filenames in os.walk(solution_dir, followlinks=True):
+            # A symlink to one of the directory's ancestors would otherwise be walked forever.
+            real_dirpath = os.path.realpath(dirpath)
+            if real_dirpath in visited:
+                dirnames[:] = []
+                continue
+            visited.add(real_dirpath)
+            dirnames[:] = sorted(d for d in dirnames if d not in VERIFIER_CACHE_IGNORED_DIRS)
+            for name in sorted(filenames):
+                if name.endswith((".pyc", ".pyo")):
+                    continue
+                path = os.path.join(dirpath, name)
+                if not os.path.isfile(path):
+                    print(f"Warning: Leaving '{path}' out of the snapshot: it is not a file or a link to one.")
+                    continue
+                rel_path = os.path.relpath(path, solution_dir).replace(os.sep, "/")
+                files[rel_path] = {"sha256": _store_snapshot_object(path), "mode": stat.S_IMODE(os.stat(path).st_mode)}
+        manifest = {"task_name": task_name, "files": files}
+        snapshot_id = hashlib.sha256(json.dumps(manifest, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+        manifest_path = os.path.join(SNAPSHOT_DIR, "manifests", f"{snapshot_id}.json")
+        if os.path.exists(manifest_path):
+            # Mark the snapshot as recently used, so pruning keeps it.
+            os.utime(manifest_path)
+        else:
+            os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+            write_json_atomic(manifest_path, manifest)
+            prune_snapshots()
+    except OSError as e:
+        print(f"Warning: Could not snapshot the solution of '{task_name}': {e}")
+        return None
+    if timings is not None:
+        timings["solution_snapshot"] = round(time.monotonic() - started, 6)
+    return snapshot_id
+
+def prune_snapshots():
+    """
+    Removes the least recently used snapshots once the snapshot store exceeds
+    SNAPSHOT_DIR_MAX_BYTES, together with the objects no remaining snapshot uses.
+    """
+    objects_dir = os.path.join(SNAPSHOT_DIR, "objects")
+    manifests_dir = os.path.join(SNAPSHOT_DIR, "manifests")
+    object_sizes = {}
+    for dirpath, _, filenames in os.walk(objects_dir):
+        for name in filenames:
+            try:
+                object_sizes[name] = os.stat(os.path.join(dirpath, name)).st_size
+            except OSError:
+                continue
+    manifests = []
+    for name in os.listdir(manifests_dir) if os.path.isdir(manifests_dir) else []:
+        try:
+            entry_stat = os.stat(os.path.join(manifests_dir, name))
+        except OSError:
+            continue
+        manifests.append((entry_stat.st_mtime, entry_stat.st_size, name))
+    total_size = sum(object_sizes.values()) + sum(size for _, size, _ in manifests)
+    if total_size <= SNAPSHOT_DIR_MAX_BYTES:
+        return
+
+    uses = {}
+    digests = {}
+    for _, _, name in manifests:
+        manifest = load_snapshot_manifest(name[:-len(".json")]) or {"files": {}}
+        digests[name] = {entry["sha256"] for entry in manifest["files"].values()}
+        for digest in digests[name]:
+            uses[digest] = uses.get(digest, 0) + 1
+    for _, size, name in sorted(manifests):
+        if total_size <= SNAPSHOT_DIR_MAX_BYTES:
+            break
+        try:
+            os.remove(os.path.join(manifests_dir, name))
+        except OSError:
+            continue
+        total_size -= size
+        for digest in digests[name]:
+            uses[digest] -= 1
+            if uses[digest] == 0 and digest in object_sizes:
+                try:
+                    os.remove(_snapshot_object_path(digest))
+                except OSError:
+                    continue
+                total_size -= object_sizes[digest]
+
+def load_snapshot_manifest(snapshot_id):
+    """Returns the manifest of a stored snapshot, or None if it is not in the store."""
+    try:
+        with open(os.path.join(SNAPSHOT_DIR, "manifests", f"{snapshot_id}.json"), 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+def restore_snapshot(manifest, dest_dir):
+    """
+    Recreates a snapshot's solution at dest_dir, replacing whatever is there.
+    Files are cloned from the store with a reflink where supported, else copied,
+    and get back their recorded permissions. Raises FileNotFoundError if an
+    object is missing from the store.
+    """
+    if os.path.lexists(dest_dir):
+        _remove_path(dest_dir)
+    os.makedirs(dest_dir)
+    for rel_path, entry in sorted(manifest["files"].items()):
+        path = os.path.join(dest_dir, *rel_path.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        object_path = _snapshot_object_path(entry["sha256"])
+        if not _reflink_file(object_path, path):
+            shutil.copyfile(object_path, path)
+        os.chmod(path, entry["mode"])
 
 def display_prompt(task_name):
     """Displays the prompt for a given task."""
@@ -60,103 +741,2870 @@ def display_prompt(task_name):
     print("For more information on the benchmark, see the README.md file.")
     print("="*80 + "\n")
 
-def run_verifier(task_name):
-    """Runs the verifier for a task and returns the pytest output."""
+class ResultCollector:
+    """
+    Pytest plugin that records the outcome of every test as plain data.
+    nodeid_prefix turns node ids relative to pytest's rootdir into ones
+    relative to the repository.
+    """
+
+    def __init__(self, nodeid_prefix=""):
+        self.nodeid_prefix = nodeid_prefix
+        self.counts = {outcome: 0 for outcome in TEST_OUTCOMES}
+        self.tests = {}
+        self.timestamps = {}
+        self.collected = []
+
+    def _nodeid(self, nodeid):
+        return self.nodeid_prefix + nodeid if nodeid else "."
+
+    def _record(self, nodeid, outcome, duration, report=None):
+        nodeid = self._nodeid(nodeid)
+        record = self.tests.setdefault(nodeid, {"nodeid": nodeid, "outcome": None, "duration": 0.0})
+        record["duration"] = round(record["duration"] + duration, 6)
+        if outcome is None:
+            return
+        self.counts[outcome] += 1
+        # An error during teardown outranks an earlier pass.
+        if record["outcome"] is None or outcome == "error":
+            record["outcome"] = outcome
+        if report is not None and report.failed:
+            crash = getattr(report.longrepr, "reprcrash", None)
+            record["message"] = crash.message if crash is not None else str(report.longrepr).strip().splitlines()[-1]
+
+    def pytest_sessionstart(self, session):
+        self.timestamps["session_start"] = time.monotonic()
+
+    def pytest_collection_finish(self, session):
+        self.timestamps["collection_finish"] = time.monotonic()
+        self.collected = [self._nodeid(item.nodeid) for item in session.items]
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.timestamps["session_finish"] = time.monotonic()
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self._record(report.nodeid, "error", 0.0, report)
+
+    def pytest_runtest_logreport(self, report):
+        xfail = hasattr(report, "wasxfail")
+        if report.when == "call":
+            if xfail:
+                outcome = "xfailed" if report.skipped else "xpassed"
+            else:
+                outcome = report.outcome
+        elif report.failed:
+            outcome = "error"
+        elif report.skipped:
+            outcome = "xfailed" if xfail else "skipped"
+        else:
+            outcome = None
+        self._record(report.nodeid, outcome, report.duration, report)
+        if report.when == "teardown":
+            # Metrics are emitted with pytest's record_property fixture as "metric:<name>".
+            metrics = {
+                name[len(METRIC_PREFIX):]: float(value)
+                for name, value in report.user_properties
+                if name.startswith(METRIC_PREFIX) and isinstance(value, (int, float))
+            }
+            if metrics:
+                self.tests[self._nodeid(report.nodeid)]["metrics"] = metrics
+
+def _source_scopes(path):
+    """
+    Returns (first line, last line, qualified name, is a class) for every
+    function and class defined in a Python source file, each before those
+    nested in it. The first line is that of the first decorator, as in a code
+    object's co_firstlineno. Returns [] if the file cannot be read or parsed.
+    """
+    import ast
+
+    try:
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read())
+    except (OSError, SyntaxError, ValueError):
+        return []
+    scopes = []
+
+    def visit(node, prefix):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                qualname = prefix + child.name
+                first_line = min([child.lineno] + [decorator.lineno for decorator in child.decorator_list])
+                is_class = isinstance(child, ast.ClassDef)
+                scopes.append((first_line, child.end_lineno, qualname, is_class))
+                visit(child, qualname + ("." if is_class else ".<locals>."))
+            else:
+                visit(child, prefix)
+
+    visit(tree, "")
+    return scopes
+
+def _qualname_from_scopes(code, scopes):
+    """
+    Rebuilds the co_qualname of a code object, which Python before 3.11 lacks,
+    from the _source_scopes of its file: the scope that starts on its first
+    line, or else its name within the innermost scope around that line.
+    """
+    if code.co_name == "<module>":
+        return code.co_name
+    enclosing = None
+    for first_line, last_line, qualname, is_class in scopes:
+        if first_line == code.co_firstlineno and qualname.rsplit(".", 1)[-1] == code.co_name:
+            return qualname
+        if first_line <= code.co_firstlineno <= last_line:
+            enclosing = (qualname, is_class)
+    if enclosing is None:
+        return code.co_name
+    qualname, is_class = enclosing
+    return f"{qualname}.{code.co_name}" if is_class else f"{qualname}.<locals>.{code.co_name}"
+
+class ImpactTracer:
+    """
+    Pytest plugin that records, for every test, the solution functions it
+    calls (from setup to teardown) and whether it starts other processes,
+    whose calls cannot be traced. Node ids get nodeid_prefix, as in
+    ResultCollector.
+    """
+
+    def __init__(self, solution_dir, nodeid_prefix=""):
+        self.nodeid_prefix = nodeid_prefix
+        self.solution_dir = os.path.realpath(solution_dir) + os.sep
+        self.dependencies = {}
+        self._current = None
+        self._paths = {}
+        self._scopes = {}
+        self._spawn_functions = {
+            getattr(os, name)
+            for name in ("fork", "forkpty", "system", "posix_spawn", "posix_spawnp", "execv", "execve")
+            if hasattr(os, name)
+        }
+        try:
+            import _posixsubprocess
+            self._spawn_functions.add(_posixsubprocess.fork_exec)
+        except ImportError:
+            pass
+
+    def _profile(self, frame, event, arg):
+        if event == "call":
+            code = frame.f_code
+            path = self._paths.get(code.co_filename)
+            if path is None:
+                real_path = os.path.realpath(code.co_filename)
+                path = real_path[len(self.solution_dir):].replace(os.sep, "/") if real_path.startswith(self.solution_dir) else ""
+                self._paths[code.co_filename] = path
+            if path:
+                self._current["files"].setdefault(path, set()).add(self._qualname(code))
+        elif event == "c_call" and arg in self._spawn_functions:
+            self._current["spawns"] = True
+
+    def _qualname(self, code):
+        qualname = getattr(code, "co_qualname", None)
+        if qualname is None:
+            if code.co_filename not in self._scopes:
+                self._scopes[code.co_filename] = _source_scopes(code.co_filename)
+            qualname = _qualname_from_scopes(code, self._scopes[code.co_filename])
+        return qualname
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        self._current = {"files": {}, "spawns": False}
+        threading.setprofile(self._profile)
+        sys.setprofile(self._profile)
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        sys.setprofile(None)
+        threading.setprofile(None)
+        self.dependencies[self.nodeid_prefix + nodeid] = {
+            "files": {path: sorted(names) for path, names in self._current["files"].items()},
+            "spawns": self._current["spawns"],
+        }
+
+class ProcessProfiler:
+    """
+    Profiles the current process for 'evaluate --profile': cProfile times
+    every function, a sampling thread records collapsed call stacks, and
+    tracemalloc keeps a snapshot of the allocations live near peak memory.
+    """
+
+    def __init__(self, label):
+        import collections
+
+        self.label = label
+        self.samples = collections.Counter()
+        self._snapshot = None
+        self._snapshot_size = 0
+
+    def start(self):
+        import cProfile
+        import tracemalloc
+
+        tracemalloc.start()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+        self._sampler.start()
+        # Function timings count CPU time, so that waiting, say on a subprocess,
+        # does not crowd out the hotspots; the sampled stacks show wall time.
+        self._profile = cProfile.Profile(time.process_time)
+        self._profile.enable()
+
+    def _sample(self):
+        import tracemalloc
+
+        while not self._stop.wait(PROFILE_SAMPLE_INTERVAL):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == self._sampler.ident:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self.samples[";".join(stack[::-1])] += 1
+            current = tracemalloc.get_traced_memory()[0]
+            # Snapshots are costly, so only take a new one once memory has grown by a quarter.
+            if current > max(self._snapshot_size * 1.25, 1 << 20):
+                self._snapshot = tracemalloc.take_snapshot()
+                self._snapshot_size = current
+
+    def stop(self, output_prefix):
+        """Stops profiling and writes output_prefix.prof (pstats) and output_prefix.json."""
+        import tracemalloc
+
+        self._profile.disable()
+        self._stop.set()
+        self._sampler.join()
+        self._profile.dump_stats(output_prefix + ".prof")
+        peak = tracemalloc.get_traced_memory()[1]
+        snapshot = self._snapshot or tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        allocations = [
+            {"location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", "bytes": stat.size, "blocks": stat.count}
+            for stat in snapshot.statistics("lineno")[:PROFILE_TOP_ENTRIES]
+        ]
+        with open(output_prefix + ".json", 'w') as f:
+            json.dump({
+                "label": self.label,
+                "peak_traced_bytes": peak,
+                "samples": {f"{self.label};{stack}": count for stack, count in self.samples.items()},
+                "allocations": allocations,
+            }, f)
+
+    @classmethod
+    def profile_until_exit(cls, output_dir):
+        """Profiles the rest of this process's life; used by the sitecustomize hook of 'evaluate --profile'."""
+        import atexit
+
+        profiler = cls("?")
+
+        def finish():
+            profiler.label = os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else "python"
+            profiler.stop(os.path.join(output_dir, f"process-{os.getpid()}"))
+
+        profiler.start()
+        atexit.register(finish)
+
+def _apply_resource_limits(limits):
+    """
+    Puts the current worker in its own process group and applies the CPU time
+    and memory limits, which every process the verifier spawns inherits.
+    """
+    if hasattr(os, "setsid"):
+        os.setsid()
+    try:
+        import resource
+    except ImportError:
+        return
+    if limits.get("cpu_seconds"):
+        cpu_seconds = int(limits["cpu_seconds"])
+        # The soft limit sends SIGXCPU, the hard limit a second later SIGKILL.
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+    if limits.get("memory_mb"):
+        memory_bytes = int(limits["memory_mb"] * 1024 * 1024)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+
+def collect_resource_usage():
+    """Returns the CPU time, peak memory and context switches of this process and its children."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    usages = [resource.getrusage(resource.RUSAGE_SELF), resource.getrusage(resource.RUSAGE_CHILDREN)]
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+    rss_scale = 1024 if sys.platform == "darwin" else 1
+    return {
+        "user_cpu_seconds": round(sum(usage.ru_utime for usage in usages), 6),
+        "system_cpu_seconds": round(sum(usage.ru_stime for usage in usages), 6),
+        "max_rss_kb": max(usage.ru_maxrss for usage in usages) // rss_scale,
+        "voluntary_context_switches": sum(usage.ru_nvcsw for usage in usages),
+        "involuntary_context_switches": sum(usage.ru_nivcsw for usage in usages),
+    }
+
+def _install_profile_hook(profile_dir):
+    """Makes every Python process started from now on profile itself into profile_dir."""
+    hook_dir = os.path.join(profile_dir, "hook")
+    os.makedirs(hook_dir, exist_ok=True)
+    with open(os.path.join(hook_dir, "sitecustomize.py"), 'w') as f:
+        f.write(PROFILE_HOOK_SOURCE)
+    os.environ["PYTHONPATH"] = os.pathsep.join(filter(None, [hook_dir, os.environ.get("PYTHONPATH")]))
+    os.environ["RUNNER_PROFILE_DIR"] = profile_dir
+    os.environ["RUNNER_PROFILE_RUNNER"] = os.path.abspath(__file__)
+
+class _PipeOutput(io.TextIOBase):
+    """
+    A text stream that sends what a verifier worker writes to the parent
+    process as ("output", stream, text) messages, a line or a chunk at a time.
+    """
+
+    def __init__(self, conn, stream, lock):
+        super().__init__()
+        self.conn = conn
+        self.stream = stream
+        self.lock = lock
+        self._buffer = []
+        self._size = 0
+
+    def write(self, text):
+        self._buffer.append(text)
+        self._size += len(text)
+        if "\n" in text or self._size >= VERIFIER_OUTPUT_CHUNK_CHARS:
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        if not self._buffer:
+            return
+        text = "".join(self._buffer)
+        self._buffer, self._size = [], 0
+        with self.lock:
+            for start in range(0, len(text), VERIFIER_OUTPUT_CHUNK_CHARS):
+                self.conn.send(("output", self.stream, text[start:start + VERIFIER_OUTPUT_CHUNK_CHARS]))
+
+    def writable(self):
+        return True
+
+    @property
+    def encoding(self):
+        return "utf-8"
+
+def _output_tail(text):
+    """Returns the last lines of some output, at most VERIFIER_OUTPUT_TAIL_CHARS of them."""
+    lines = text.splitlines(keepends=True)[-VERIFIER_OUTPUT_TAIL_LINES:]
+    return "".join(lines)[-VERIFIER_OUTPUT_TAIL_CHARS:]
+
+class VerifierOutputLog:
+    """
+    Takes in the output of one verifier run as it streams from the worker:
+    passes it to echo(stream, text) if given, keeps a short tail of stdout and
+    stderr, and spills all of it to a gzip-compressed log in VERIFIER_LOG_DIR,
+    up to verifier_log_max_bytes() of uncompressed output.
+    """
+
+    def __init__(self, task_name, echo=None):
+        self.task_name = task_name
+        self.echo = echo
+        self.max_bytes = verifier_log_max_bytes()
+        self.path = None
+        self.bytes = 0
+        self.truncated = False
+        self._file = None
+        self._written = 0
+        self._tails = {"stdout": "", "stderr": ""}
+
+    def write(self, stream, text):
+        if self.echo is not None:
+            self.echo(stream, text)
+        tail = self._tails[stream] + text
+        # Trim lazily, keeping enough for the tail however long its lines are.
+        self._tails[stream] = tail[-2 * VERIFIER_OUTPUT_TAIL_CHARS:] if len(tail) > 4 * VERIFIER_OUTPUT_TAIL_CHARS else tail
+        data = text.encode("utf-8", "replace")
+        self.bytes += len(data)
+        if self.truncated:
+            return
+        if self._file is None:
+            import gzip
+
+            os.makedirs(VERIFIER_LOG_DIR, exist_ok=True)
+            stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%S")
+            fd, self.path = tempfile.mkstemp(prefix=f"{self.task_name}-{stamp}-", suffix=".log.gz", dir=VERIFIER_LOG_DIR)
+            self._file = gzip.GzipFile(fileobj=os.fdopen(fd, 'wb'), mode='wb', compresslevel=6)
+        room = self.max_bytes - self._written
+        if len(data) > room:
+            data = data[:room] + f"\n[runner: log truncated at {self.max_bytes} bytes]\n".encode()
+            self.truncated = True
+        self._file.write(data)
+        self._written += len(data)
+
+    def close(self):
+        """Closes the log and returns the stdout and stderr tails and a summary of the log."""
+        if self._file is not None:
+            fileobj = self._file.fileobj
+            self._file.close()
+            fileobj.close()
+        summary = {
+            "logs": [os.path.relpath(self.path)] if self.path else [],
+            "bytes": self.bytes,
+            "truncated": self.truncated,
+        }
+        return _output_tail(self._tails["stdout"]), _output_tail(self._tails["stderr"]), summary
+
+def prune_verifier_logs():
+    """Removes the oldest verifier output logs once together they exceed VERIFIER_LOG_DIR_MAX_BYTES."""
+    try:
+        names = os.listdir(VERIFIER_LOG_DIR)
+    except OSError:
+        return
+    entries = []
+    for name in names:
+        try:
+            entry_stat = os.stat(os.path.join(VERIFIER_LOG_DIR, name))
+        except OSError:
+            continue
+        entries.append((entry_stat.st_mtime, entry_stat.st_size, name))
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total_size <= VERIFIER_LOG_DIR_MAX_BYTES:
+            break
+        try:
+            os.remove(os.path.join(VERIFIER_LOG_DIR, name))
+        except OSError:
+            pass
+        total_size -= size
+
+def _verifier_worker(verifier_path, limits, conn, workspace=None, pytest_args=None, trace=False, profile_dir=None, environ=None):
+    """
+    Runs pytest on a verifier inside a worker process, streaming its output
+    back over conn as it is written, and then sends back the outcome.
+    With a workspace, the verifier runs from that isolated copy of the repository.
+    pytest_args, such as a selection of test node ids, replace the verifier path.
+    With trace, the outcome also holds the solution functions each test called.
+    With profile_dir, the run and the Python processes it starts are profiled there.
+    The verifier sees environ, if given, as its environment.
+    """
+    import contextlib
+
+    if environ is not None:
+        os.environ.clear()
+        os.environ.update(environ)
+    _apply_resource_limits(limits)
+    if profile_dir is not None:
+        _install_profile_hook(profile_dir)
+    import pytest
+
+    args = list(pytest_args or [verifier_path])
+    if workspace is not None:
+        os.chdir(workspace)
+    # Root pytest at the task, not the repository: collecting from the repository
+    # root lists every sibling task. Node ids stay relative to the repository.
+    task_dir = os.path.dirname(os.path.normpath(verifier_path))
+    args += ["--rootdir", os.path.abspath(task_dir)]
+    nodeid_prefix = os.path.relpath(task_dir).replace(os.sep, "/") + "/"
+
+    collector = ResultCollector(nodeid_prefix)
+    plugins = [collector]
+    if trace:
+        tracer = ImpactTracer(os.path.join(os.path.abspath(task_dir), "solution"), nodeid_prefix)
+        plugins.append(tracer)
+    lock = threading.Lock()
+    stdout, stderr = _PipeOutput(conn, "stdout", lock), _PipeOutput(conn, "stderr", lock)
+    started = time.monotonic()
+    if profile_dir is not None:
+        profiler = ProcessProfiler("verifier")
+        profiler.start()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        exit_code = int(pytest.main(args, plugins=plugins))
+    stdout.flush()
+    stderr.flush()
+    if profile_dir is not None:
+        profiler.stop(os.path.join(profile_dir, "verifier"))
+    outcome = {
+        "exit_code": exit_code,
+        "duration": round(time.monotonic() - started, 6),
+        "counts": collector.counts,
+        "tests": list(collector.tests.values()),
+        "timestamps": dict(collector.timestamps, worker_start=started),
+        "collected": collector.collected,
+        "resources": collect_resource_usage(),
+    }
+    if trace:
+        outcome["test_dependencies"] = tracer.dependencies
+    with lock:
+        conn.send(("outcome", outcome))
+    conn.close()
+
+def get_verifier_context():
+    """
+    Returns the multiprocessing context used to start verifier workers.
+
+    Where available this is a forkserver with pytest preloaded, so every job
+    starts from a warm, pristine copy of the server: imports are already done,
+    and anything a verifier adds to sys.path or sys.modules (such as a task's
+    solution modules) disappears with the worker when the job ends.
+    """
+    global _verifier_context
+    if _verifier_context is None:
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            _verifier_context = multiprocessing.get_context("forkserver")
+            _verifier_context.set_forkserver_preload(VERIFIER_PRELOAD_MODULES)
+        else:
+            _verifier_context = multiprocessing.get_context("spawn")
+    return _verifier_context
+
+def _start_verifier_process(task_name, limits, workspace=None, pytest_args=None, trace=False, profile_dir=None):
+    """
+    Starts a worker process running a task's verifier in the environment of
+    the command being run, and returns it with its result pipe.
+    """
     task_dir = get_task_dir(task_name)
     verifier_path = os.path.join(task_dir, "verifier")
-    
+    context = get_verifier_context()
+    reader, writer = context.Pipe(duplex=False)
+    # Flush so that a forked worker does not inherit and re-emit buffered output.
+    sys.stdout.flush()
+    sys.stderr.flush()
+    process = context.Process(target=_verifier_worker, args=(verifier_path, limits, writer, workspace, pytest_args, trace, profile_dir, dict(get_environ())), daemon=True)
+    process.start()
+    writer.close()
+    return process, reader
+
+def _kill_verifier_process(process):
+    """Kills a verifier worker together with every process it started."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (AttributeError, OSError):
+        # The worker may not have become a process group leader yet.
+        process.kill()
+    process.join()
+
+def _failed_outcome(exit_code, message, limits):
+    """Builds the outcome of a verifier run that produced no results, scored as one error."""
+    return {
+        "exit_code": exit_code,
+        "duration": None,
+        "counts": dict({outcome: 0 for outcome in TEST_OUTCOMES}, error=1),
+        "tests": [],
+        "stdout": "",
+        "stderr": message,
+        "resources": None,
+        "limits": limits,
+        "timed_out": False,
+    }
+
+def verifier_phase_timings(spawned_at, timestamps):
+    """Converts the monotonic timestamps of a verifier run into per-phase durations."""
+    marks = [
+        ("verifier_spawn", spawned_at, timestamps.get("worker_start")),
+        ("pytest_startup", timestamps.get("worker_start"), timestamps.get("session_start")),
+        ("pytest_collection", timestamps.get("session_start"), timestamps.get("collection_finish")),
+        ("test_execution", timestamps.get("collection_finish"), timestamps.get("session_finish")),
+    ]
+    return {
+        phase: round(end - begin, 6)
+        for phase, begin, end in marks
+        if begin is not None and end is not None
+    }
+
+def iter_verifier_runs(task_names, jobs, timeout=None, workspaces=None, pytest_args=None, trace=False, profile_dirs=None, echo=None):
+    """
+    Runs task verifiers in isolated worker processes, at most 'jobs' at a time,
+    and yields (task_name, outcome) pairs as each one finishes. A verifier that
+    exceeds its wall-clock timeout is killed and reported as a single error.
+    Output streams into a VerifierOutputLog per run, and to echo(stream, text)
+    if given; outcomes keep its tails as "stdout" and "stderr" and its log
+    summary as "output".
+    If given, workspaces holds the isolated workspace to run each task from;
+    the outcome of such a run records it under "workspace". Likewise,
+    pytest_args holds the arguments for each run in place of the verifier path.
+    With trace, outcomes record each test's "test_dependencies" (ImpactTracer),
+    and profile_dirs holds the directory to profile each run into, if any.
+    Runs that measure performance never overlap with any other run, so their
+    metrics do not depend on 'jobs' or on what else is being verified.
+    """
+    pending = [
+        (task_name, workspace, args, profile_dir, profile_dir is None and measures_performance(task_name, args))
+        for task_name, workspace, args, profile_dir in zip(
+            task_names,
+            workspaces or [None] * len(task_names),
+            pytest_args or [None] * len(task_names),
+            profile_dirs or [None] * len(task_names),
+        )
+    ]
+    running = {}
+    exclusive = set()
+    prune_verifier_logs()
+    while pending or running:
+        while pending and len(running) < jobs and not exclusive:
+            # Once other runs are under way, only those that do not measure performance may join them.
+            index = 0 if not running else next((i for i, run in enumerate(pending) if not run[-1]), None)
+            if index is None:
+                break
+            task_name, workspace, args, profile_dir, measured = pending.pop(index)
+            limits = load_task_config(task_name)["limits"]
+            if timeout is not None:
+                limits["timeout_seconds"] = timeout
+            spawned_at = time.monotonic()
+            process, reader = _start_verifier_process(task_name, limits, workspace, args, trace, profile_dir)
+            running[reader] = (task_name, process, spawned_at, limits, workspace, VerifierOutputLog(task_name, echo))
+            if measured:
+                exclusive.add(reader)
+
+        deadlines = {
+            reader: spawned_at + limits["timeout_seconds"]
+            for reader, (_, _, spawned_at, limits, _, _) in running.items()
+            if limits["timeout_seconds"]
+        }
+        wait_timeout = max(0, min(deadlines.values()) - time.monotonic()) if deadlines else None
+        ready = multiprocessing.connection.wait(list(running), timeout=wait_timeout)
+        # Check deadlines on every pass: a worker that writes output nonstop is never idle.
+        now = time.monotonic()
+        for reader, deadline in deadlines.items():
+            if deadline > now:
+                continue
+            task_name, process, spawned_at, limits, workspace, output = running.pop(reader)
+            exclusive.discard(reader)
+            _kill_verifier_process(process)
+            reader.close()
+            outcome = _failed_outcome(
+                process.exitcode,
+                f"Verifier timed out after {limits['timeout_seconds']} seconds and was killed.",
+                limits,
+            )
+            _attach_output(outcome, output)
+            outcome["timed_out"] = True
+            outcome["timings"] = {}
+            if workspace is not None:
+                outcome["workspace"] = workspace
+            yield task_name, outcome
+
+        for reader in ready:
+            if reader not in running:
+                continue
+            task_name, process, spawned_at, limits, workspace, output = running[reader]
+            try:
+                kind, *payload = reader.recv()
+            except EOFError:
+                kind, payload = "exit", None
+            if kind == "output":
+                output.write(*payload)
+                continue
+            outcome = payload[0] if kind == "outcome" else None
+            del running[reader]
+            exclusive.discard(reader)
+            reader.close()
+            process.join()
+            if outcome is None:
+                if hasattr(signal, "SIGXCPU") and process.exitcode in (-signal.SIGXCPU, -signal.SIGKILL) and limits.get("cpu_seconds"):
+                    message = f"Verifier exceeded its CPU time limit of {limits['cpu_seconds']} seconds."
+                else:
+                    message = f"Verifier process exited unexpectedly with code {process.exitcode}."
+                outcome = _failed_outcome(process.exitcode, message, limits)
+            else:
+                outcome["limits"] = limits
+                outcome["timed_out"] = False
+            _attach_output(outcome, output)
+            outcome["timings"] = verifier_phase_timings(spawned_at, outcome.pop("timestamps", {}))
+            if workspace is not None:
+                outcome["workspace"] = workspace
+            yield task_name, outcome
+
+def _attach_output(outcome, output):
+    """Closes a run's output log and records its tails and summary in the outcome."""
+    if outcome.get("stderr"):
+        # The runner's explanation of a failed run follows the run's own output.
+        output.write("stderr", f"\n{outcome['stderr']}\n")
+    outcome["stdout"], outcome["stderr"], outcome["output"] = output.close()
+
+def print_verifier_output(outcome, streamed=False):
+    """
+    Prints the tail of a verifier run's stdout and stderr, unless it was
+    streamed to the console as it ran, and where its full output is logged.
+    """
+    if not streamed:
+        print("\n--- Pytest Output ---")
+        print(outcome["stdout"])
+        if outcome["stderr"]:
+            print("\n--- Pytest Errors ---")
+            print(outcome["stderr"])
+    print("-----------------------\n")
+    output = outcome.get("output")
+    shown = len(outcome["stdout"].encode()) + len(outcome["stderr"].encode())
+    if not streamed and output and output["logs"] and output["bytes"] > shown:
+        truncated = f", truncated at {verifier_log_max_bytes()} bytes" if output["truncated"] else ""
+        print(f"Only the end of the output is shown; the full {output['bytes']} bytes{truncated} are in {', '.join(output['logs'])}")
+    parallelism = outcome.get("test_parallelism")
+    if parallelism:
+        print(
+            f"Tests ran on {parallelism['workers']} workers in {parallelism['wall_seconds']:.2f}s; "
+            f"serially they take {parallelism['serial_seconds']:.2f}s ({parallelism['serial_source']}), "
+            f"a {parallelism['speedup']:.2f}x speedup."
+        )
+    impact = outcome.get("test_impact")
+    if impact:
+        print(f"Test impact analysis: re-ran {impact['rerun']} tests and reused {impact['reused']} earlier outcomes ({impact['reason']}).")
+
+def previous_test_durations(task_name):
+    """Returns the per-test durations of a task's latest serial run, whose timings are free of contention."""
+    conn = open_results_store()
+    try:
+        rows = conn.execute(
+            """SELECT nodeid, duration FROM test_results
+               WHERE run_id = (SELECT MAX(run_id) FROM runs WHERE task_name = ? AND test_workers = 1)""",
+            (task_name,)
+        ).fetchall()
+    finally:
+        conn.close()
+    return {row["nodeid"]: row["duration"] for row in rows}
+
+def latest_verifier_durations(task_name):
+    """Returns the verifier durations of a task's latest serial run and latest split run, each None if there is none."""
+    conn = open_results_store()
+    try:
+        serial, split = (
+            conn.execute(
+                f"SELECT verifier_duration FROM runs WHERE task_name = ? AND test_workers {condition} ORDER BY run_id DESC LIMIT 1",
+                (task_name,)
+            ).fetchone()
+            for condition in ("= 1", "> 1")
+        )
+    finally:
+        conn.close()
+    return (serial[0] if serial else None), (split[0] if split else None)
+
+def plan_test_workers(task_name, nodeids, test_workers, durations):
+    """
+    Returns how many workers to split a verifier's tests across, at most
+    test_workers, and the reason if that is 1. Every worker repeats the
+    verifier's setup, estimated as the latest serial run's duration beyond its
+    tests', and competes for the CPUs, so a split only goes ahead if the time
+    it saves exceeds that setup for every extra worker. Tasks that measure
+    performance run whole, and so does a task whose latest split run was no
+    faster than its latest serial run.
+    """
+    if measures_performance(task_name):
+        return 1, "its performance metrics are measured alone"
+    serial_duration, split_duration = latest_verifier_durations(task_name)
+    if serial_duration is not None and split_duration is not None and split_duration >= serial_duration:
+        return 1, f"its latest split run took {split_duration:.2f}s, no faster than {serial_duration:.2f}s serially"
+    cpus = os.cpu_count() or 1
+    limit = min(test_workers, len(nodeids), cpus)
+    if limit < 2:
+        return 1, f"there is only {cpus} CPU" if cpus < 2 else "it has a single test"
+    serial_tests = sum(durations[nodeid] for nodeid in nodeids)
+    setup = max(0.0, serial_duration - serial_tests) if serial_duration is not None else 0.0
+    for workers in range(limit, 1, -1):
+        groups = partition_by_duration(nodeids, durations, workers)
+        longest = max(sum(durations[nodeid] for nodeid in group) for group in groups)
+        if serial_tests - longest > setup * (workers - 1):
+            return workers, None
+    return 1, f"splitting would save less than the {setup:.2f}s setup of each extra worker"
+
+def merge_split_outcomes(outcomes, collected, wall_seconds, serial_durations):
+    """
+    Combines the outcomes of the workers that each ran part of one verifier
+    into a single outcome, as if the tests had run in one session in their
+    collected order, and records the speedup over running them serially.
+    The serial time is the sum of the tests' durations in serial_durations
+    (the latest serial run) if it covers them all, else in this run.
+    """
+    position = {nodeid: i for i, nodeid in enumerate(collected)}
+    tests = sorted(
+        (test for outcome in outcomes for test in outcome["tests"]),
+        key=lambda test: position.get(test["nodeid"], len(position)),
+    )
+    exit_codes = [outcome["exit_code"] for outcome in outcomes]
+    resources = [outcome["resources"] for outcome in outcomes]
+    if all(resources):
+        merged_resources = {
+            name: round(sum(usage[name] for usage in resources), 6)
+            for name in resources[0] if name != "max_rss_kb"
+        }
+        merged_resources["max_rss_kb"] = max(usage["max_rss_kb"] for usage in resources)
+    else:
+        merged_resources = None
+    slowest = max(outcomes, key=lambda outcome: outcome["duration"] or float("inf"))
+    if collected and all(nodeid in serial_durations for nodeid in collected):
+        serial_seconds, serial_source = sum(serial_durations[nodeid] for nodeid in collected), "latest serial run"
+    else:
+        serial_seconds, serial_source = sum(test["duration"] for test in tests), "this run"
+    serial_seconds = round(serial_seconds, 6)
+    return {
+        # pytest's "no tests collected" (5) only applies if no worker ran anything.
+        "exit_code": max((code for code in exit_codes if code != 5), default=5),
+        "duration": round(wall_seconds, 6),
+        "counts": {name: sum(outcome["counts"][name] for outcome in outcomes) for name in TEST_OUTCOMES},
+        "tests": tests,
+        "stdout": "\n".join(
+            f"--- Worker {number} ({len(outcome['tests'])} tests) ---\n{outcome['stdout']}"
+            for number, outcome in enumerate(outcomes, 1)
+        ),
+        "stderr": "\n".join(outcome["stderr"] for outcome in outcomes if outcome["stderr"]),
+        "output": {
+            "logs": [log for outcome in outcomes for log in outcome["output"]["logs"]],
+            "bytes": sum(outcome["output"]["bytes"] for outcome in outcomes),
+            "truncated": any(outcome["output"]["truncated"] for outcome in outcomes),
+        },
+        "resources": merged_resources,
+        "limits": outcomes[0]["limits"],
+        "timed_out": any(outcome.get("timed_out") for outcome in outcomes),
+        "timings": slowest["timings"],
+        "test_parallelism": {
+            "workers": len(outcomes),
+            "wall_seconds": round(wall_seconds, 6),
+            "serial_seconds": serial_seconds,
+            "serial_source": serial_source,
+            "speedup": round(serial_seconds / wall_seconds, 2) if wall_seconds else None,
+            "worker_durations": [outcome["duration"] for outcome in outcomes],
+        },
+    }
+
+def iter_split_verifier_runs(task_names, jobs, test_workers, timeout=None):
+    """
+    Like iter_verifier_runs, but splits each verifier's tests across up to
+    test_workers workers. Every worker runs from its own isolated copy of the
+    task, including the solution directory and any data files in it, so tests
+    that share state through files cannot interfere with each other. Tests are
+    balanced across workers by their durations in the task's latest run.
+    A verifier whose collection fails is run whole, to report its errors, and
+    so is one that plan_test_workers finds is not worth splitting.
+    """
+    collect_args = [["--collect-only", "-q", os.path.join(get_task_dir(task_name), "verifier")] for task_name in task_names]
+    collected = {
+        task_name: outcome.get("collected") if outcome["exit_code"] == 0 else None
+        for task_name, outcome in iter_verifier_runs(task_names, jobs, timeout, pytest_args=collect_args)
+    }
+
+    with tempfile.TemporaryDirectory(prefix="verifier-workers-") as workers_dir:
+        runs, workspaces, run_args, previous = [], [], [], {}
+        for task_name in task_names:
+            nodeids = collected[task_name]
+            if not nodeids:
+                runs.append(task_name)
+                workspaces.append(None)
+                run_args.append(None)
+                continue
+            previous[task_name] = previous_test_durations(task_name)
+            known = previous[task_name]
+            default = sum(known.values()) / len(known) if known else 1.0
+            durations = {nodeid: known.get(nodeid, default) for nodeid in nodeids}
+            workers, reason = plan_test_workers(task_name, nodeids, test_workers, durations)
+            if workers == 1:
+                print(f"Running '{task_name}' in a single worker: {reason}.")
+                runs.append(task_name)
+                workspaces.append(None)
+                run_args.append(None)
+                continue
+            groups = partition_by_duration(nodeids, durations, workers)
+            for number, group in enumerate(groups, 1):
+                workspace = os.path.join(workers_dir, f"{task_name}-{number}")
+                prepare_run_workspace(task_name, workspace, os.path.join(get_task_dir(task_name), "solution"))
+                runs.append(task_name)
+                workspaces.append(workspace)
+                run_args.append(group)
+
+        remaining = {task_name: runs.count(task_name) for task_name in task_names}
+        finished = {task_name: [] for task_name in task_names}
+        # Tasks share the worker pool, so each task's wall time runs from the spawn of its first worker.
+        first_spawn = {}
+        for task_name, outcome in iter_verifier_runs(runs, max(jobs, test_workers), timeout, workspaces, run_args):
+            if outcome.pop("workspace", None) is None:
+                yield task_name, outcome
+                continue
+            now = time.monotonic()
+            spawned_at = now - sum(outcome["timings"].values()) if outcome["duration"] is not None else now
+            first_spawn[task_name] = min(first_spawn.get(task_name, spawned_at), spawned_at)
+            finished[task_name].append(outcome)
+            remaining[task_name] -= 1
+            if not remaining[task_name]:
+                yield task_name, merge_split_outcomes(
+                    finished[task_name], collected[task_name], now - first_spawn[task_name], previous[task_name]
+                )
+
+def _hash_tree(digest, root, label):
+    """Feeds the relative paths, sizes and contents of every file under root into digest."""
+    digest.update(f"tree:{label}\0".encode())
+    if not os.path.isdir(root):
+        return
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in VERIFIER_CACHE_IGNORED_DIRS)
+        for name in sorted(filenames):
+            if name.endswith((".pyc", ".pyo")):
+                continue
+            path = os.path.join(dirpath, name)
+            rel_path = os.path.relpath(path, root).replace(os.sep, "/")
+            if os.path.islink(path) and not os.path.exists(path):
+                # A broken link has no content to hash, only its target.
+                digest.update(f"link:{rel_path}:{os.readlink(path)}\0".encode())
+                continue
+            digest.update(f"file:{rel_path}:{os.path.getsize(path)}\0".encode())
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+
+def compute_verifier_cache_key(task_name, labels=("solution", "verifier", "initial_code")):
+    """
+    Returns a key identifying a verifier run by its inputs: the task's solution,
+    verifier and initial code trees (or just those in labels), the shared
+    verifier support scripts along with the verifier, its task.json,
+    the environment variables its task.json lists under "environment", plus
+    the Python and pytest versions.
+    """
+    import hashlib
+    import importlib.metadata
+
+    task_dir = get_task_dir(task_name)
+    digest = hashlib.sha256()
+    digest.update(f"v2\0{sys.version}\0pytest {importlib.metadata.version('pytest')}\0".encode())
+    for label in labels:
+        _hash_tree(digest, os.path.join(task_dir, label), label)
+    if "verifier" in labels:
+        _hash_tree(digest, VERIFIER_SUPPORT_DIR, VERIFIER_SUPPORT_DIR)
+    config_path = os.path.join(task_dir, "task.json")
+    if os.path.isfile(config_path):
+        with open(config_path, 'rb') as f:
+            digest.update(b"task.json\0" + f.read())
+    environ = get_environ()
+    for name in sorted(load_task_config(task_name).get("environment", [])):
+        digest.update(f"env:{name}={environ.get(name)!r}\0".encode())
+    return digest.hexdigest()
+
+def is_cacheable_outcome(outcome):
+    """
+    Returns True if a verifier outcome may be reused: a completed run in which
+    every scored test passed. Failures may be flaky, so they are always taken
+    afresh.
+    """
+    return (
+        outcome["duration"] is not None
+        and not outcome.get("timed_out")
+        and outcome["counts"].get("failed", 0) == 0
+        and outcome["counts"].get("error", 0) == 0
+    )
+
+def metric_test_ids(outcome):
+    """Returns the node ids of the tests in an outcome that emitted metrics."""
+    return [test["nodeid"] for test in outcome["tests"] if test.get("metrics")]
+
+def complete_cached_outcome(cached, rerun):
+    """
+    Completes a cached outcome with a fresh run of the tests that emit metrics:
+    their measurements are never reused, only the other tests' outcomes are.
+    The result has the fresh run's duration and timings. Returns None if the
+    fresh run did not report every test that emits metrics.
+    """
+    nodeids = metric_test_ids(cached)
+    outcome = merge_impact_outcome(cached, rerun, nodeids)
+    if outcome is not None:
+        outcome["cache_rerun"] = len(nodeids)
+    return outcome
+
+def _remember_outcome(cache_key, serialized):
+    """Keeps a serialized outcome in the in-memory cache, evicting the least recently used."""
+    global _outcome_memory_cache
+    import collections
+
+    if _outcome_memory_cache is None:
+        _outcome_memory_cache = collections.OrderedDict()
+    _outcome_memory_cache[cache_key] = serialized
+    _outcome_memory_cache.move_to_end(cache_key)
+    while len(_outcome_memory_cache) > OUTCOME_MEMORY_CACHE_SIZE:
+        _outcome_memory_cache.popitem(last=False)
+
+def load_cached_outcome(cache_key):
+    """Returns the cached verifier outcome for a key, or None on a miss."""
+    if _outcome_memory_cache is not None and cache_key in _outcome_memory_cache:
+        _outcome_memory_cache.move_to_end(cache_key)
+        return json.loads(_outcome_memory_cache[cache_key])
+    cache_path = os.path.join(VERIFIER_CACHE_DIR, f"{cache_key}.json")
+    try:
+        with open(cache_path, 'r') as f:
+            outcome = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    # Bump the modification time so eviction treats the entry as recently used.
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    _remember_outcome(cache_key, json.dumps(outcome))
+    return outcome
+
+def store_cached_outcome(cache_keys, outcome):
+    """Stores a verifier outcome under each key and evicts least recently used entries."""
+    os.makedirs(VERIFIER_CACHE_DIR, exist_ok=True)
+    for cache_key in cache_keys:
+        write_json_atomic(os.path.join(VERIFIER_CACHE_DIR, f"{cache_key}.json"), outcome)
+        _remember_outcome(cache_key, json.dumps(outcome))
+
+    entries = []
+    for name in os.listdir(VERIFIER_CACHE_DIR):
+        if not name.endswith(".json"):
+            continue
+        try:
+            entry_stat = os.stat(os.path.join(VERIFIER_CACHE_DIR, name))
+        except OSError:
+            continue
+        entries.append((entry_stat.st_mtime, entry_stat.st_size, name))
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total_size <= VERIFIER_CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(os.path.join(VERIFIER_CACHE_DIR, name))
+        except OSError:
+            pass
+        total_size -= size
+
+def _hash_module_units(tree):
+    """
+    Returns the hashes of a parsed module's units: its top-level functions and
+    the methods of its top-level classes, by qualified name and including any
+    functions nested in them, plus "<module>" for all the remaining code.
+    """
+    import ast
+    import hashlib
+
+    units = {}
+
+    def visit(body, prefix):
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                units[prefix + node.name] = hashlib.sha256(ast.dump(node).encode()).hexdigest()
+                node.body = []
+            elif isinstance(node, ast.ClassDef):
+                visit(node.body, f"{prefix}{node.name}.")
+
+    visit(tree.body, "")
+    # With the units' bodies emptied, what is left is the module-level code.
+    units["<module>"] = hashlib.sha256(ast.dump(tree).encode()).hexdigest()
+    return units
+
+def hash_solution_units(solution_dir):
+    """
+    Returns {"modules": {path: unit hashes}, "files": {path: hash}} for the
+    files of a solution: the unit hashes of every Python module that parses,
+    and the content hashes of all other files.
+    """
+    import ast
+    import hashlib
+
+    hashes = {"modules": {}, "files": {}}
+    for dirpath, dirnames, filenames in os.walk(solution_dir):
+        dirnames[:] = sorted(d for d in dirnames if d not in VERIFIER_CACHE_IGNORED_DIRS)
+        for name in sorted(filenames):
+            if name.endswith((".pyc", ".pyo")):
+                continue
+            path = os.path.join(dirpath, name)
+            rel_path = os.path.relpath(path, solution_dir).replace(os.sep, "/")
+            with open(path, 'rb') as f:
+                content = f.read()
+            if name.endswith(".py"):
+                try:
+                    hashes["modules"][rel_path] = _hash_module_units(ast.parse(content))
+                    continue
+                except (SyntaxError, ValueError):
+                    pass
+            hashes["files"][rel_path] = hashlib.sha256(content).hexdigest()
+    return hashes
+
+def _unit_of(qualname, units):
+    """Maps the qualified name of a called code object to the module unit that defines it."""
+    unit = qualname.split(".<locals>.")[0]
+    return unit if unit in units else "<module>"
+
+def load_impact_map(task_name):
+    """Returns a task's test impact map, or None if it has none or it cannot be read."""
+    try:
+        with open(os.path.join(get_task_dir(task_name), IMPACT_MAP), 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+def plan_impact_run(task_name):
+    """
+    Decides which of a task's tests to re-run, from its impact map and the
+    current solution. Returns a plan with "rerun", the node ids to re-run, or
+    None for a full run, a "reason", and the "inputs" and "units" hashes that
+    the next map is saved with. A full run is needed without a usable map,
+    after the verifier changes, or after changes that calls cannot be traced
+    to: in module-level code, in non-Python files, or in the set of files.
+    Tests that start processes, or did not pass last time, are always re-run.
+    """
+    plan = {
+        "rerun": None,
+        "inputs": compute_verifier_cache_key(task_name, labels=("verifier", "initial_code")),
+        "units": hash_solution_units(os.path.join(get_task_dir(task_name), "solution")),
+    }
+    impact_map = load_impact_map(task_name)
+    if impact_map is None or impact_map.get("format") != IMPACT_MAP_FORMAT:
+        plan["reason"] = "no dependency map yet"
+        return plan
+    if impact_map["inputs"] != plan["inputs"]:
+        plan["reason"] = "the verifier changed"
+        return plan
+    old, new = impact_map["units"], plan["units"]
+    if old["files"] != new["files"] or old["modules"].keys() != new["modules"].keys():
+        plan["reason"] = "solution files other than Python functions changed"
+        return plan
+    changed = {}
+    for path, units in new["modules"].items():
+        old_units = old["modules"][path]
+        if old_units["<module>"] != units["<module>"]:
+            plan["reason"] = f"module-level code in '{path}' changed"
+            return plan
+        changed[path] = {unit for unit in old_units.keys() | units.keys() if old_units.get(unit) != units.get(unit)}
+
+    rerun, always = [], 0
+    for test in impact_map["outcome"]["tests"]:
+        dependencies = impact_map["dependencies"].get(test["nodeid"])
+        if dependencies is None or dependencies["spawns"] or test["outcome"] not in IMPACT_REUSABLE_OUTCOMES:
+            rerun.append(test["nodeid"])
+            always += 1
+        elif any(
+            _unit_of(name, old["modules"][path]) in changed[path]
+            for path, names in dependencies["files"].items() if path in changed
+            for name in names
+        ):
+            rerun.append(test["nodeid"])
+    plan["rerun"] = rerun
+    plan["map"] = impact_map
+    plan["reason"] = (
+        f"{len(rerun) - always} of {len(impact_map['outcome']['tests'])} tests call changed code; "
+        f"{always} that start processes or did not pass are always re-run"
+    )
+    return plan
+
+def merge_impact_outcome(baseline, outcome, rerun):
+    """
+    Combines the outcome of re-running some tests with the baseline outcome of
+    the rest, as a full run would have reported them. Returns None if the
+    re-run did not report every test it was given.
+    """
+    results = {test["nodeid"]: test for test in outcome["tests"]}
+    if outcome["duration"] is None or outcome["exit_code"] not in (0, 1) or not results.keys() >= set(rerun):
+        return None
+    tests = [results.get(test["nodeid"], test) for test in baseline["tests"]]
+    counts = dict(outcome["counts"])
+    for test in baseline["tests"]:
+        if test["nodeid"] not in results:
+            counts[test["outcome"]] += 1
+    return dict(outcome, tests=tests, counts=counts, exit_code=1 if counts["failed"] or counts["error"] else 0)
+
+def save_impact_map(task_name, plan, outcome, dependencies):
+    """Saves a task's test impact map for the solution state that produced outcome."""
+    write_json_atomic(os.path.join(get_task_dir(task_name), IMPACT_MAP), {
+        "format": IMPACT_MAP_FORMAT,
+        "inputs": plan["inputs"],
+        "units": plan["units"],
+        "dependencies": dependencies,
+        "outcome": {key: value for key, value in outcome.items() if key not in ("test_dependencies", "test_impact", "cache")},
+    })
+
+def iter_impact_verifier_runs(task_names, jobs, timeout=None, echo=None):
+    """
+    Like iter_verifier_runs, but traces which solution functions every test
+    calls into each task's impact map, and on later runs only re-runs the
+    tests impacted by the changes since, reusing the earlier outcomes of the
+    rest. Each outcome's "test_impact" records what was re-run and why.
+    """
+    plans = {task_name: plan_impact_run(task_name) for task_name in task_names}
+    runs, run_args = [], []
+    for task_name in task_names:
+        plan = plans[task_name]
+        if plan["rerun"] == []:
+            outcome = dict(plan["map"]["outcome"], duration=0.0, timings={})
+            outcome["test_impact"] = {"mode": "reused", "rerun": 0, "reused": len(outcome["tests"]), "reason": plan["reason"]}
+            yield task_name, outcome
+            continue
+        runs.append(task_name)
+        run_args.append(plan["rerun"])
+
+    for task_name, outcome in iter_verifier_runs(runs, jobs, timeout, pytest_args=run_args, trace=True, echo=echo):
+        plan = plans[task_name]
+        dependencies = outcome.pop("test_dependencies", {})
+        if plan["rerun"] is not None:
+            merged = merge_impact_outcome(plan["map"]["outcome"], outcome, plan["rerun"])
+            if merged is None:
+                print(f"Warning: Re-running the impacted tests of '{task_name}' failed. Running its verifier in full.")
+                plan["rerun"], plan["reason"] = None, "the impacted tests could not be re-run on their own"
+                _, outcome = next(iter_verifier_runs([task_name], 1, timeout, trace=True, echo=echo))
+                dependencies = outcome.pop("test_dependencies", {})
+            else:
+                outcome = merged
+                dependencies = dict(plan["map"]["dependencies"], **dependencies)
+        rerun = len(plan["rerun"]) if plan["rerun"] is not None else len(outcome["tests"])
+        outcome["test_impact"] = {
+            "mode": "full" if plan["rerun"] is None else "incremental",
+            "rerun": rerun,
+            "reused": len(outcome["tests"]) - rerun,
+            "reason": plan["reason"],
+        }
+        if outcome["duration"] is not None and outcome["exit_code"] in (0, 1):
+            save_impact_map(task_name, plan, outcome, dependencies)
+        yield task_name, outcome
+
+def iter_verifier_outcomes(task_names, jobs, use_cache, timeout=None, test_workers=1, impact=False, echo=None):
+    """
+    Yields (task_name, outcome) pairs for the given tasks, answering from the
+    verification cache where possible and running the remaining verifiers,
+    with each verifier's tests split across test_workers workers if above 1,
+    or with only the tests impacted by solution changes re-run if impact.
+    Verifiers run in one worker stream their output to echo, if given.
+    Each outcome's "cache" field records whether it was a hit, a miss or disabled.
+    On a hit, the tests that emit metrics still run, and "cache_rerun" counts them.
+    """
+    cache_keys = {}
+    to_run = []
+    lookup_times = {}
+    cached_outcomes = {}
+    for task_name in task_names:
+        if use_cache:
+            started = time.monotonic()
+            cache_keys[task_name] = compute_verifier_cache_key(task_name)
+            outcome = load_cached_outcome(cache_keys[task_name])
+            lookup_times[task_name] = round(time.monotonic() - started, 6)
+            if outcome is not None and metric_test_ids(outcome):
+                cached_outcomes[task_name] = outcome
+                continue
+            if outcome is not None:
+                outcome["cache"] = "hit"
+                # The stored phase timings belong to the original run.
+                outcome["timings"] = {"cache_lookup": lookup_times[task_name]}
+                yield task_name, outcome
+                continue
+        to_run.append(task_name)
+
+    rerun_names = list(cached_outcomes)
+    rerun_args = [metric_test_ids(cached_outcomes[task_name]) for task_name in rerun_names]
+    for task_name, outcome in iter_verifier_runs(rerun_names, jobs, timeout, pytest_args=rerun_args, echo=echo):
+        outcome = complete_cached_outcome(cached_outcomes[task_name], outcome)
+        if outcome is None:
+            print(f"Warning: Re-running the metric tests of '{task_name}' failed. Running its verifier in full.")
+            to_run.append(task_name)
+            continue
+        outcome["cache"] = "hit"
+        outcome["timings"]["cache_lookup"] = lookup_times[task_name]
+        yield task_name, outcome
+
+    if test_workers > 1:
+        runs = iter_split_verifier_runs(to_run, jobs, test_workers, timeout)
+    elif impact:
+        runs = iter_impact_verifier_runs(to_run, jobs, timeout, echo)
+    else:
+        runs = iter_verifier_runs(to_run, jobs, timeout, echo=echo)
+    for task_name, outcome in runs:
+        if use_cache and is_cacheable_outcome(outcome):
+            # Verifiers may generate files in solution/, so also key the outcome
+            # by the post-run state that the next identical evaluation will see.
+            store_cached_outcome({cache_keys[task_name], compute_verifier_cache_key(task_name)}, outcome)
+        if use_cache:
+            outcome["timings"]["cache_lookup"] = lookup_times[task_name]
+        outcome["cache"] = "miss" if use_cache else "disabled"
+        yield task_name, outcome
+
+def run_verifier(task_name, use_cache=False, timeout=None, test_workers=1, impact=False):
+    """Runs the verifier for a task, streaming its output, and returns the structured outcome."""
     print("\nRunning verifier...")
-    result = subprocess.run(
-        [sys.executable, "-m", "pytest", verifier_path],
-        capture_output=True,
-        text=True
+    streamed = []
+
+    def echo(stream, text):
+        if not streamed:
+            print("\n--- Pytest Output ---", flush=True)
+            streamed.append(stream)
+        output = sys.stdout if stream == "stdout" else sys.stderr
+        output.write(text)
+        output.flush()
+
+    for _, outcome in iter_verifier_outcomes([task_name], 1, use_cache, timeout, test_workers, impact, echo):
+        if outcome["cache"] == "hit" and outcome.get("cache_rerun"):
+            print(f"Verifier cache hit: reusing the outcome of an identical earlier run, with its {outcome['cache_rerun']} metric tests re-run.")
+        elif outcome["cache"] == "hit":
+            print("Verifier cache hit: reusing the outcome of an identical earlier run.")
+        print_verifier_output(outcome, streamed=bool(streamed))
+        return outcome
+
+def benchmark_verifier_startup(task_names, repeat):
+    """
+    Compares cold verifier runs (a fresh 'python -m pytest' interpreter per run)
+    with warm runs handed to the preloaded verifier workers, per task. Both
+    only collect the verifier's tests, so that interpreter startup and imports
+    dominate rather than the tests themselves.
+    """
+    import statistics
+    import subprocess
+
+    collect_args = {
+        task_name: [os.path.join(get_task_dir(task_name), "verifier"), "--collect-only", "-q"]
+        for task_name in task_names
+    }
+    # Start the forkserver up front so its one-off startup is not billed to any task.
+    for _ in iter_verifier_runs(task_names[:1], 1, pytest_args=[collect_args[task_names[0]]]):
+        pass
+
+    print(f"\nVerifier startup latency, median of {repeat} runs per task:\n")
+    print(f"| {'Task':<30} | {'Cold (s)':<10} | {'Warm (s)':<10} | {'Speedup':<8} |")
+    print(f"| {'-'*30} | {'-'*10} | {'-'*10} | {'-'*8} |")
+    for task_name in task_names:
+        cold, warm = [], []
+        for _ in range(repeat):
+            started = time.monotonic()
+            subprocess.run([sys.executable, "-m", "pytest"] + collect_args[task_name], capture_output=True)
+            cold.append(time.monotonic() - started)
+            started = time.monotonic()
+            for _ in iter_verifier_runs([task_name], 1, pytest_args=[collect_args[task_name]]):
+                pass
+            warm.append(time.monotonic() - started)
+        cold_median, warm_median = statistics.median(cold), statistics.median(warm)
+        speedup = f"{cold_median / warm_median:.2f}x"
+        print(f"| {task_name:<30} | {cold_median:<10.3f} | {warm_median:<10.3f} | {speedup:<8} |")
+
+def _seed_synthetic_state(root, task_names, rng):
+    """Gives every synthetic task a solution and a start time, and imports fake results for them via 'merge'."""
+    import subprocess
+
+    results = []
+    for task_name in task_names:
+        task_dir = os.path.join(root, "tasks", task_name)
+        os.makedirs(os.path.join(task_dir, "solution"), exist_ok=True)
+        with open(os.path.join(task_dir, "solution", "solution.py"), 'w') as f:
+            f.write("def answer():\n    return 42\n")
+        with open(os.path.join(task_dir, ".start_time"), 'w') as f:
+            json.dump({"started_at": datetime.datetime.now(datetime.timezone.utc).isoformat(), "timings": {}}, f)
+        passed = rng.randint(0, 4)
+        results.append({
+            "task_name": task_name,
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "scores": {"correctness": round(60 * passed / 4, 2), "task_completion": 20 if passed else 0},
+            "final_score_objective": round(60 * passed / 4 + (20 if passed else 0), 2),
+            "max_score": 80,
+            "execution_time_seconds": round(rng.uniform(10, 600), 3),
+            "verifier_duration_seconds": round(rng.uniform(0.1, 5), 3),
+            "pytest_exit_code": 0 if passed == 4 else 1,
+            "test_counts": dict({outcome: 0 for outcome in TEST_OUTCOMES}, passed=passed, failed=4 - passed),
+            "tests": [
+                {"nodeid": f"tasks/{task_name}/verifier/test_synthetic.py::test_{number}", "outcome": "passed" if number < passed else "failed", "duration": 0.001}
+                for number in range(4)
+            ],
+            "verifier_cache": "disabled",
+            "timings": {},
+            "timed_out": False,
+            "limits": dict(DEFAULT_TASK_LIMITS),
+            "resources": None,
+            "metrics": {},
+            "performance": None,
+            "test_parallelism": None,
+        })
+    bundle_path = os.path.join(root, "synthetic-results.json")
+    write_json_atomic(bundle_path, {
+        "format": EXPORT_FORMAT,
+        "exported_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "host": "synthetic",
+        "catalogue": task_names,
+        "results": results,
+    })
+    with open(os.path.join(root, CONFIRMATION_FILE), 'w') as f:
+        f.write("synthetic")
+    subprocess.run(
+        [sys.executable, "runner.py", "merge", bundle_path],
+        cwd=root, env=dict(os.environ, RUNNER_NO_DAEMON="1"), capture_output=True, check=True,
     )
 
-    print("\n--- Pytest Output ---")
-    print(result.stdout)
-    if result.stderr:
-        print("\n--- Pytest Errors ---")
-        print(result.stderr)
-    print("-----------------------\n")
-    return result.stdout
+def generate_synthetic_catalogue(root, count, rng):
+    """
+    Builds a runnable copy of the benchmark at root with count synthetic tasks,
+    each with a prompt, a passing verifier and initial code, and every tenth
+    with a task.json, plus solutions and fake results for all of them.
+    """
+    shutil.copy2(os.path.abspath(__file__), os.path.join(root, "runner.py"))
+    task_names = [f"synthetic-{number:05d}" for number in range(1, count + 1)]
+    for number, task_name in enumerate(task_names):
+        task_dir = os.path.join(root, "tasks", task_name)
+        os.makedirs(os.path.join(task_dir, "verifier"))
+        os.makedirs(os.path.join(task_dir, "initial_code"))
+        with open(os.path.join(task_dir, "prompt.md"), 'w') as f:
+            f.write(f"# {task_name}\n\nWrite `answer()` in `solution/solution.py`, returning 42.\n")
+        with open(os.path.join(task_dir, "verifier", "test_synthetic.py"), 'w') as f:
+            f.write(
+                "import os\nimport sys\n\n"
+                "sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'solution'))\n\n"
+                "from solution import answer\n\n\n"
+                "def test_answer():\n    assert answer() == 42\n"
+            )
+        with open(os.path.join(task_dir, "initial_code", "solution.py"), 'w') as f:
+            f.write("def answer():\n    raise NotImplementedError\n")
+        if number % 10 == 0:
+            with open(os.path.join(task_dir, "task.json"), 'w') as f:
+                json.dump({"expected_duration_seconds": rng.uniform(0.1, 5), "reset_paths": ["solution/*.txt"]}, f)
+    _seed_synthetic_state(root, task_names, rng)
+    return task_names
+
+def benchmark_catalogue(sizes, repeat):
+    """
+    Times 'list', 'start', 'evaluate', 'report' and 'reset' end to end, each
+    in a fresh interpreter, on synthetic catalogues of the given sizes, to
+    check that command latency stays flat as the catalogue grows.
+    """
+    import random
+    import statistics
+    import subprocess
+
+    env = dict(os.environ, RUNNER_NO_DAEMON="1")
+    columns = ["Startup", "List (cold)", "List", "Start", "Evaluate", "Report", "Reset"]
+    print(f"\nCommand latency in ms, median of {repeat} runs, including interpreter startup:\n")
+    print(f"| {'Tasks':<6} | " + " | ".join(f"{column:<11}" for column in columns) + " |")
+    print(f"| {'-'*6} | " + " | ".join("-" * 11 for _ in columns) + " |")
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix="catalogue-bench-") as root:
+            rng = random.Random(size)
+            task_names = generate_synthetic_catalogue(root, size, rng)
+
+            def timed(args, prepare=None):
+                samples = []
+                for _ in range(repeat):
+                    if prepare is not None:
+                        prepare()
+                    # 'report' and 'reset' remove the confirmation file.
+                    with open(os.path.join(root, CONFIRMATION_FILE), 'w') as f:
+                        f.write("synthetic")
+                    started = time.monotonic()
+                    process = subprocess.run([sys.executable, "runner.py", *args], cwd=root, env=env, capture_output=True, text=True)
+                    samples.append(time.monotonic() - started)
+                    if process.returncode != 0:
+                        print(f"Error: 'runner.py {' '.join(args)}' failed on {size} tasks:\n{process.stdout[-2000:]}{process.stderr[-2000:]}")
+                        sys.exit(1)
+                return statistics.median(samples) * 1000
+
+            def drop_registry():
+                if os.path.exists(os.path.join(root, TASK_REGISTRY)):
+                    os.remove(os.path.join(root, TASK_REGISTRY))
+
+            row = [
+                timed([]),
+                timed(["list"], prepare=drop_registry),
+                timed(["list"]),
+                timed(["start", task_names[-1]]),
+                timed(["evaluate", task_names[-1], "--no-cache"]),
+                timed(["report"]),
+                timed(["reset"], prepare=lambda: _seed_synthetic_state(root, task_names, rng)),
+            ]
+            print(f"| {size:<6} | " + " | ".join(f"{value:<11.1f}" for value in row) + " |")
+
+def get_boot_id():
+    """Returns an identifier for the current boot, or None where unavailable."""
+    try:
+        with open("/proc/sys/kernel/random/boot_id", 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
 
-def record_start_time(task_name):
-    """Records the start time for a task."""
+def record_start_time(task_name, timings=None):
+    """Records the start time, and the timings of the start phases, for a task."""
     task_dir = get_task_dir(task_name)
     start_time_path = os.path.join(task_dir, ".start_time")
+    start_record = {
+        "started_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        # The monotonic clock is immune to wall-clock changes and is shared by
+        # all processes until the next reboot.
+        "monotonic": time.monotonic(),
+        "boot_id": get_boot_id(),
+        "timings": timings or {},
+    }
     with open(start_time_path, 'w') as f:
-        f.write(datetime.datetime.now(datetime.timezone.utc).isoformat())
+        json.dump(start_record, f)
     print(f"Start time for '{task_name}' recorded.")
 
-def get_execution_time(task_name):
+def read_start_record(task_name):
+    """Reads a task's start record, or returns None if the task has not been started."""
+    task_dir = get_task_dir(task_name)
+    start_time_path = os.path.join(task_dir, ".start_time")
+    if not os.path.exists(start_time_path):
+        return None
+    with open(start_time_path, 'r') as f:
+        content = f.read()
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        # Start times recorded by older versions of the runner are plain ISO timestamps.
+        return {"started_at": content.strip(), "timings": {}}
+
+def get_execution_time(task_name):
+    """
+    Calculates the execution time for a task by reading the start time
+    (does NOT delete the start time file).
+    """
+    start_record = read_start_record(task_name)
+    if start_record is None:
+        print("Warning: Start time not found. Could not calculate execution time.")
+        return None
+    monotonic_start = start_record.get("monotonic")
+    if monotonic_start is not None and start_record.get("boot_id") == get_boot_id() and time.monotonic() >= monotonic_start:
+        return time.monotonic() - monotonic_start
+    start_time = datetime.datetime.fromisoformat(start_record["started_at"])
+    end_time = datetime.datetime.now(datetime.timezone.utc)
+    return (end_time - start_time).total_seconds()
+
+def get_evaluation_timings(task_name, execution_time):
+    """Returns the phase timings recorded at start plus the agent's think time."""
+    start_record = read_start_record(task_name) or {"timings": {}}
+    timings = dict(start_record["timings"])
+    if execution_time is not None:
+        timings["agent_think"] = round(execution_time, 6)
+    return timings
+
+def summarize_counts(counts):
+    """Returns the number of passed tests and the number of scored tests."""
+    passed_tests = counts.get("passed", 0)
+    total_tests = passed_tests + counts.get("failed", 0) + counts.get("error", 0)
+    return passed_tests, total_tests
+
+def write_json_atomic(path, data):
+    """Writes data as JSON to path via a temporary file and an atomic rename."""
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def open_results_store():
+    """Opens the run history database, creating or upgrading its schema as needed."""
+    import sqlite3
+
+    conn = sqlite3.connect(RESULTS_DB, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    for number, statements in enumerate(RESULTS_DB_MIGRATIONS[version:], version + 1):
+        with conn:
+            conn.executescript(statements)
+            conn.execute(f"PRAGMA user_version = {number}")
+    return conn
+
+def get_current_session(conn):
+    """
+    Returns the id of the current benchmark session, the latest one not started
+    by 'reverify', starting one if none exists.
+    """
+    row = conn.execute("SELECT MAX(session_id) FROM sessions WHERE NOT reverify").fetchone()
+    if row[0] is not None:
+        return row[0]
+    return start_session(conn)
+
+def start_session(conn, reverify=False):
     """
-    Calculates the execution time for a task by reading the start time
-    (does NOT delete the start time file).
+    Starts a new benchmark session; report only considers runs from the latest
+    session. A 'reverify' session is kept apart and never becomes the current one.
     """
-    task_dir = get_task_dir(task_name)
-    start_time_path = os.path.join(task_dir, ".start_time")
-    execution_time = None
-    if os.path.exists(start_time_path):
-        with open(start_time_path, 'r') as f:
-            start_time_str = f.read()
-            start_time = datetime.datetime.fromisoformat(start_time_str)
-            end_time = datetime.datetime.now(datetime.timezone.utc)
-            execution_time = (end_time - start_time).total_seconds()
+    with conn:
+        cursor = conn.execute(
+            "INSERT INTO sessions (started_at, reverify) VALUES (?, ?)",
+            (datetime.datetime.now(datetime.timezone.utc).isoformat(), int(reverify))
+        )
+    return cursor.lastrowid
+
+def number_attempt(conn, results_data):
+    """
+    Completes the "attempt" record of a run made since 'start' from the task's
+    previous attempt since the same 'start': its number, the tests that flipped
+    between passing and failing, the verifier time it counts for this run, and
+    running totals of verifier time, flips and the first attempt on which
+    every test passed.
+    """
+    attempt = results_data["attempt"]
+    previous = conn.execute(
+        """SELECT run_id, attempt, attempt_verifier_seconds, attempt_flips, first_pass_attempt, first_pass_offset
+           FROM runs WHERE task_name = ? AND started_at = ? ORDER BY run_id DESC LIMIT 1""",
+        (results_data["task_name"], attempt["started_at"])
+    ).fetchone()
+    previous_outcomes = {}
+    if previous is not None:
+        previous_outcomes = {
+            row["nodeid"]: row["outcome"]
+            for row in conn.execute("SELECT nodeid, outcome FROM test_results WHERE run_id = ?", (previous["run_id"],))
+        }
+    flipped = [
+        {"nodeid": test["nodeid"], "previous": previous_outcomes[test["nodeid"]], "outcome": test["outcome"]}
+        for test in results_data["tests"]
+        if test["outcome"] in SCORED_OUTCOMES
+        and previous_outcomes.get(test["nodeid"]) in SCORED_OUTCOMES
+        and (test["outcome"] == "passed") != (previous_outcomes[test["nodeid"]] == "passed")
+    ]
+    attempt["number"] = previous["attempt"] + 1 if previous is not None else 1
+    attempt["flipped"] = flipped
+    attempt["flips"] = (previous["attempt_flips"] if previous is not None else 0) + len(flipped)
+    # A cache hit replays the original run's duration; only the lookup, and any
+    # re-run of the tests that emit metrics, was spent on this attempt.
+    if results_data["verifier_cache"] == "hit":
+        verifier_seconds = results_data["timings"].get("cache_lookup", 0)
+        if results_data.get("verifier_cache_rerun"):
+            verifier_seconds += results_data["verifier_duration_seconds"] or 0
     else:
-        print("Warning: Start time not found. Could not calculate execution time.")
-    return execution_time
+        verifier_seconds = results_data["verifier_duration_seconds"] or 0
+    attempt["run_verifier_seconds"] = round(verifier_seconds, 6)
+    attempt["verifier_seconds"] = round(
+        (previous["attempt_verifier_seconds"] if previous is not None else 0) + verifier_seconds, 6
+    )
+    passed_tests, total_tests = summarize_counts(results_data["test_counts"])
+    if previous is not None and previous["first_pass_attempt"] is not None:
+        attempt["first_pass"] = {"number": previous["first_pass_attempt"], "offset_seconds": previous["first_pass_offset"]}
+    elif total_tests > 0 and passed_tests == total_tests:
+        attempt["first_pass"] = {"number": attempt["number"], "offset_seconds": attempt["offset_seconds"]}
+    else:
+        attempt["first_pass"] = None
 
-def calculate_and_save_results(task_name, pytest_output, execution_time):
-    """Calculates the scores and saves the results to a JSON file."""
-    task_dir = get_task_dir(task_name)
-    passed_tests, total_tests = 0, 0
+def record_run(results_data, conn=None, session_id=None):
+    """
+    Appends a scored run and its per-test records to the run history, in the
+    given session or else the current one, and returns its run id. Callers
+    recording many runs can pass an open conn.
+    A run made since 'start' is numbered in that attempt timeline, unless it
+    was numbered on the machine it was merged from.
+    """
+    started = time.monotonic()
+    counts = results_data["test_counts"]
+    resources = results_data["resources"] or {}
+    trials = results_data.get("trials")
+    own_conn = conn is None
+    if own_conn:
+        conn = open_results_store()
+    try:
+        if session_id is None:
+            session_id = get_current_session(conn)
+        attempt = results_data.get("attempt")
+        if attempt is not None and "number" not in attempt:
+            number_attempt(conn, results_data)
+        first_pass = (attempt or {}).get("first_pass") or {}
+        with conn:
+            cursor = conn.execute(
+                """INSERT INTO runs (session_id, task_name, timestamp, correctness, task_completion,
+                                     final_score, execution_time, verifier_duration, pytest_exit_code,
+                                     passed, failed, errors, skipped, xfailed, xpassed, verifier_cache,
+                                     timed_out, user_cpu, system_cpu, max_rss_kb,
+                                     voluntary_context_switches, involuntary_context_switches,
+                                     performance, max_score, flaky_tests, test_workers,
+                                     started_at, attempt, attempt_verifier_seconds, attempt_flips,
+                                     first_pass_attempt, first_pass_offset, snapshot, reverified_from,
+                                     run_verifier_seconds)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                           ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    session_id, results_data["task_name"], results_data["timestamp"],
+                    results_data["scores"]["correctness"], results_data["scores"]["task_completion"],
+                    results_data["final_score_objective"], results_data["execution_time_seconds"],
+                    results_data["verifier_duration_seconds"], results_data["pytest_exit_code"],
+                    counts["passed"], counts["failed"], counts["error"], counts["skipped"],
+                    counts["xfailed"], counts["xpassed"], results_data["verifier_cache"],
+                    results_data["timed_out"], resources.get("user_cpu_seconds"),
+                    resources.get("system_cpu_seconds"), resources.get("max_rss_kb"),
+                    resources.get("voluntary_context_switches"), resources.get("involuntary_context_switches"),
+                    results_data["scores"].get("performance"), results_data["max_score"],
+                    len(trials["flaky_tests"]) if trials else 0,
+                    (results_data.get("test_parallelism") or {}).get("workers", 1),
+                    (attempt or {}).get("started_at"), (attempt or {}).get("number"),
+                    (attempt or {}).get("verifier_seconds"), (attempt or {}).get("flips"),
+                    first_pass.get("number"), first_pass.get("offset_seconds"),
+                    results_data.get("snapshot"), results_data.get("reverified_from"),
+                    (attempt or {}).get("run_verifier_seconds"),
+                )
+            )
+            run_id = cursor.lastrowid
+            if attempt is not None:
+                conn.executemany(
+                    "INSERT INTO run_flips (run_id, nodeid, previous, outcome) VALUES (?, ?, ?, ?)",
+                    [(run_id, flip["nodeid"], flip["previous"], flip["outcome"]) for flip in attempt["flipped"]]
+                )
+            if trials:
+                conn.executemany(
+                    """INSERT INTO run_trials (run_id, trial, verifier_duration, passed, failed, errors)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    [
+                        (run_id, number, trial["duration"], trial["passed"], trial["failed"], trial["error"])
+                        for number, trial in enumerate(trials["trials"], 1)
+                    ]
+                )
+            conn.executemany(
+                "INSERT INTO run_metrics (run_id, name, value) VALUES (?, ?, ?)",
+                [(run_id, name, value) for name, value in results_data["metrics"].items()]
+            )
+            conn.executemany(
+                "INSERT INTO test_results (run_id, nodeid, outcome, duration, message) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (run_id, test["nodeid"], test["outcome"], test["duration"], test.get("message"))
+                    for test in results_data["tests"]
+                ]
+            )
+        # Persisting the timings themselves is the only part not covered. Merged runs keep the original timing.
+        results_data["timings"].setdefault("result_persistence", round(time.monotonic() - started, 6))
+        with conn:
+            conn.executemany(
+                "INSERT INTO run_timings (run_id, phase, seconds) VALUES (?, ?, ?)",
+                [(run_id, phase, seconds) for phase, seconds in results_data["timings"].items()]
+            )
+    finally:
+        if own_conn:
+            conn.close()
+    return run_id
 
-    summary_match = re.search(r"(\d+)\s+passed", pytest_output)
-    if summary_match:
-        passed_tests = int(summary_match.group(1))
+def collect_metrics(tests):
+    """Returns the metrics emitted by passing tests; a failing test's measurements are not trusted."""
+    metrics = {}
+    for test in tests:
+        if test["outcome"] == "passed":
+            metrics.update(test.get("metrics", {}))
+    return metrics
 
-    failed_match = re.search(r"(\d+)\s+failed", pytest_output)
-    errored_match = re.search(r"(\d+)\s+error", pytest_output)
-    
-    total_tests = passed_tests
-    if failed_match:
-        total_tests += int(failed_match.group(1))
-    if errored_match:
-        total_tests += int(errored_match.group(1))
+def calculate_performance_score(budgets, metrics):
+    """
+    Scores measured metrics against a task's performance budgets. Each metric
+    earns the fraction of its budget it achieves, capped at 1; a missing metric
+    earns nothing. Returns the score out of PERFORMANCE_POINTS and the per-metric
+    breakdown.
+    """
+    breakdown = {}
+    for name, budget in budgets.items():
+        value = metrics.get(name)
+        if value is None:
+            fraction = 0.0
+        elif budget.get("better", "higher") == "lower":
+            fraction = 1.0 if value <= 0 else min(1.0, budget["budget"] / value)
+        else:
+            fraction = min(1.0, value / budget["budget"])
+        breakdown[name] = {
+            "value": value,
+            "budget": budget["budget"],
+            "better": budget.get("better", "higher"),
+            "fraction": round(fraction, 4),
+        }
+    fractions = [entry["fraction"] for entry in breakdown.values()]
+    return PERFORMANCE_POINTS * sum(fractions) / len(fractions), breakdown
+
+def score_verifier_outcome(task_name, verifier_outcome, execution_time, timings=None, trials=None):
+    """
+    Calculates the scores of a verifier run and returns the results data, without
+    saving it. A run with an execution time, measured since 'start', is an attempt.
+    """
+    counts = verifier_outcome["counts"]
+    passed_tests, total_tests = summarize_counts(counts)
 
+    if verifier_outcome.get("timed_out"):
+        print(f"Warning: The verifier for '{task_name}' timed out. Scoring the run as an error.")
     if total_tests == 0 and passed_tests == 0:
-        if "no tests ran" not in pytest_output:
-            print("Warning: Could not determine test results from pytest output. Assuming 0 tests passed.")
-        correctness_score = 60 if "no tests ran" in pytest_output else 0
+        no_tests_ran = not any(counts.values())
+        if not no_tests_ran:
+            print("Warning: The verifier did not run any scored tests. Assuming 0 tests passed.")
+        correctness_score = 60 if no_tests_ran else 0
         task_completion_score = 0
     else:
         correctness_score = 60 * (passed_tests / total_tests)
         task_completion_score = 20 if passed_tests > 0 else 0
 
+    scores = {
+        "correctness": round(correctness_score, 2),
+        "task_completion": round(task_completion_score, 2),
+    }
+    metrics = collect_metrics(verifier_outcome["tests"])
+    budgets = load_task_config(task_name).get("performance", {})
+    performance = None
+    if budgets:
+        performance_score, performance = calculate_performance_score(budgets, metrics)
+        scores["performance"] = round(performance_score, 2)
+    start_record = read_start_record(task_name) if execution_time is not None else None
+
     results_data = {
         "task_name": task_name,
         "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-        "scores": {
-            "correctness": round(correctness_score, 2),
-            "task_completion": round(task_completion_score, 2),
-        },
-        "final_score_objective": round(correctness_score + task_completion_score, 2),
+        "scores": scores,
+        "final_score_objective": round(sum(scores.values()), 2),
+        "max_score": 80 + (PERFORMANCE_POINTS if budgets else 0),
         "execution_time_seconds": execution_time,
-        "pytest_output": pytest_output
+        "verifier_duration_seconds": verifier_outcome["duration"],
+        "pytest_exit_code": verifier_outcome["exit_code"],
+        "test_counts": counts,
+        "tests": verifier_outcome["tests"],
+        "verifier_cache": verifier_outcome.get("cache", "disabled"),
+        "verifier_cache_rerun": verifier_outcome.get("cache_rerun", 0),
+        "timings": dict(timings or {}, **verifier_outcome.get("timings", {})),
+        "timed_out": verifier_outcome.get("timed_out", False),
+        "limits": verifier_outcome.get("limits"),
+        "resources": verifier_outcome.get("resources"),
+        "metrics": metrics,
+        "performance": performance,
+        "test_parallelism": verifier_outcome.get("test_parallelism"),
+        "test_impact": verifier_outcome.get("test_impact"),
+        "verifier_output": dict(
+            verifier_outcome.get("output") or {},
+            stdout_tail=verifier_outcome.get("stdout", ""),
+            stderr_tail=verifier_outcome.get("stderr", ""),
+        ),
+        "attempt": {
+            "started_at": start_record["started_at"],
+            "offset_seconds": round(execution_time, 6),
+        } if start_record is not None else None,
+        "snapshot": verifier_outcome.get("snapshot"),
     }
+    if trials:
+        results_data["trials"] = trials
+    return results_data
 
+def calculate_and_save_results(task_name, verifier_outcome, execution_time, timings=None, trials=None):
+    """Calculates the scores and saves the results to a JSON file."""
+    task_dir = get_task_dir(task_name)
+    results_data = score_verifier_outcome(task_name, verifier_outcome, execution_time, timings, trials)
+    results_data["run_id"] = record_run(results_data)
     results_path = os.path.join(task_dir, "results.json")
-    with open(results_path, 'w') as f:
-        json.dump(results_data, f, indent=4)
+    write_json_atomic(results_path, results_data)
 
+    attempt = results_data["attempt"]
+    if attempt is not None:
+        message = f"Attempt {attempt['number']} since 'start', {attempt['offset_seconds']:.1f}s in."
+        if attempt["number"] > 1:
+            fixed = sum(flip["outcome"] == "passed" for flip in attempt["flipped"])
+            message += f" Since the previous attempt, {fixed} tests started passing and {len(attempt['flipped']) - fixed} stopped."
+        print(message)
     print(f"Results for '{task_name}' saved to '{results_path}'")
     print(f"\n{'='*30} Finished Task: {task_name.upper()} {'='*30}\n")
+    return results_data
+
+def clear_start_time(task_name):
+    """Deletes a task's start time, ending its attempt timeline."""
+    start_time_path = os.path.join(get_task_dir(task_name), ".start_time")
+    if os.path.exists(start_time_path):
+        os.remove(start_time_path)
+
+def finish_evaluation(task_name, verifier_outcome, execution_time, timings=None, trials=None, keep_start_time=False):
+    """
+    Scores a verifier run and clears the start time once every test passes,
+    unless keep_start_time, as 'evaluate --watch' does until it stops.
+    """
+    results_data = calculate_and_save_results(task_name, verifier_outcome, execution_time, timings, trials)
+    # Only delete .start_time if all tests passed
+    passed_tests, total_tests = summarize_counts(verifier_outcome["counts"])
+    if total_tests > 0 and passed_tests == total_tests and not keep_start_time:
+        clear_start_time(task_name)
+    return results_data
+
+def evaluate_task(task_name, use_cache=True, timeout=None, test_workers=1, impact=False):
+    """Runs the verifier for a single task and records its results."""
+    execution_time = get_execution_time(task_name)
+    timings = get_evaluation_timings(task_name, execution_time)
+    snapshot_id = snapshot_solution(task_name, timings)
+    verifier_outcome = run_verifier(task_name, use_cache, timeout, test_workers, impact)
+    verifier_outcome["snapshot"] = snapshot_id
+    finish_evaluation(task_name, verifier_outcome, execution_time, timings)
+
+def evaluate_tasks(task_names, jobs, use_cache=True, timeout=None, test_workers=1, impact=False):
+    """
+    Runs the verifiers for several tasks on a bounded pool of worker processes,
+    scoring each task as soon as its verifier finishes.
+    """
+    for task_name in task_names:
+        get_task_dir(task_name)
+    # Execution time is measured when evaluation is requested, as in a serial run.
+    execution_times = {task_name: get_execution_time(task_name) for task_name in task_names}
+    timings = {task_name: get_evaluation_timings(task_name, execution_times[task_name]) for task_name in task_names}
+    snapshots = {task_name: snapshot_solution(task_name, timings[task_name]) for task_name in task_names}
+
+    print(f"\nRunning verifiers for {len(task_names)} tasks with {jobs} parallel jobs...")
+    started = time.monotonic()
+    summary = []
+    for done, (task_name, outcome) in enumerate(iter_verifier_outcomes(task_names, jobs, use_cache, timeout, test_workers, impact), 1):
+        cached = " (cached)" if outcome["cache"] == "hit" else ""
+        print(f"\n[{done}/{len(task_names)}] Verifier finished for '{task_name}'{cached}")
+        print_verifier_output(outcome)
+        outcome["snapshot"] = snapshots[task_name]
+        results_data = finish_evaluation(task_name, outcome, execution_times[task_name], timings[task_name])
+        summary.append((task_name, results_data["final_score_objective"], results_data["max_score"]))
+
+    elapsed = time.monotonic() - started
+    print(f"Evaluated {len(task_names)} tasks in {elapsed:.2f}s:")
+    for task_name, score, max_score in sorted(summary):
+        print(f"- {task_name}: {score:.2f}/{max_score}")
+
+def duration_statistics(durations):
+    """Returns min/mean/p50/p95/max, the sample stddev and a 95% t-interval for the mean of some durations."""
+    import math
+    import statistics
+
+    ordered = sorted(durations)
+    count = len(ordered)
+    mean = statistics.fmean(ordered)
+    stddev = statistics.stdev(ordered) if count > 1 else 0.0
+    t_critical = T_CRITICAL_95[count - 2] if 1 < count <= len(T_CRITICAL_95) + 1 else 1.96
+    half_width = t_critical * stddev / math.sqrt(count) if count > 1 else 0.0
+    stats = {
+        "count": count,
+        "min": ordered[0],
+        "mean": mean,
+        "p50": statistics.median(ordered),
+        "p95": ordered[math.ceil(0.95 * count) - 1],
+        "max": ordered[-1],
+        "stddev": stddev,
+        "ci95_low": mean - half_width,
+        "ci95_high": mean + half_width,
+    }
+    return {name: round(value, 6) for name, value in stats.items()}
+
+def summarize_trials(outcomes):
+    """
+    Summarizes repeated verifier runs of one task: the verifier duration
+    distribution, each trial's counts, and the tests whose outcome was not the
+    same in every trial. A test missing from a trial counts as "not run".
+    """
+    durations = [outcome["duration"] for outcome in outcomes if outcome["duration"] is not None]
+    per_test = {}
+    for number, outcome in enumerate(outcomes):
+        for test in outcome["tests"]:
+            per_test.setdefault(test["nodeid"], ["not run"] * len(outcomes))[number] = test["outcome"]
+    flaky_tests = []
+    for nodeid, test_outcomes in sorted(per_test.items()):
+        if len(set(test_outcomes)) > 1:
+            tally = {}
+            for test_outcome in test_outcomes:
+                tally[test_outcome] = tally.get(test_outcome, 0) + 1
+            flaky_tests.append({"nodeid": nodeid, "outcomes": tally})
+    return {
+        "count": len(outcomes),
+        "verifier_duration": duration_statistics(durations) if durations else None,
+        "trials": [
+            {
+                "duration": outcome["duration"],
+                "passed": outcome["counts"]["passed"],
+                "failed": outcome["counts"]["failed"],
+                "error": outcome["counts"]["error"],
+                "timed_out": outcome.get("timed_out", False),
+            }
+            for outcome in outcomes
+        ],
+        "flaky_tests": flaky_tests,
+    }
+
+def evaluate_repeated(task_names, jobs, repeat, timeout=None, test_workers=1):
+    """
+    Runs each task's verifier 'repeat' times, uncached, and scores the first
+    trial as a single evaluation would. Trials of one task run one after the
+    other since they share its solution directory; tasks run in parallel.
+    """
+    for task_name in task_names:
+        get_task_dir(task_name)
+    execution_times = {task_name: get_execution_time(task_name) for task_name in task_names}
+    timings = {task_name: get_evaluation_timings(task_name, execution_times[task_name]) for task_name in task_names}
+    snapshots = {task_name: snapshot_solution(task_name, timings[task_name]) for task_name in task_names}
+
+    print(f"\nRunning {repeat} trials of the verifiers for {len(task_names)} task(s) with {jobs} parallel jobs...")
+    trials = {task_name: [] for task_name in task_names}
+    for trial in range(1, repeat + 1):
+        for task_name, outcome in iter_verifier_outcomes(task_names, jobs, use_cache=False, timeout=timeout, test_workers=test_workers):
+            trials[task_name].append(outcome)
+            passed_tests, total_tests = summarize_counts(outcome["counts"])
+            duration = "timed out" if outcome.get("timed_out") else f"{outcome['duration'] or 0:.2f}s"
+            print(f"[trial {trial}/{repeat}] '{task_name}': {passed_tests}/{total_tests} passed ({duration})")
+
+    summary = []
+    for task_name in task_names:
+        outcomes = trials[task_name]
+        trial_summary = summarize_trials(outcomes)
+        print(f"\nFirst trial of '{task_name}':")
+        print_verifier_output(outcomes[0])
+        stats = trial_summary["verifier_duration"]
+        if stats:
+            print(
+                f"Verifier duration over {stats['count']} trials: mean {stats['mean']:.3f}s "
+                f"(95% CI {stats['ci95_low']:.3f}-{stats['ci95_high']:.3f}s), p50 {stats['p50']:.3f}s, "
+                f"p95 {stats['p95']:.3f}s, min {stats['min']:.3f}s, stddev {stats['stddev']:.3f}s"
+            )
+        for flaky in trial_summary["flaky_tests"]:
+            tally = ", ".join(f"{count} {outcome}" for outcome, count in sorted(flaky["outcomes"].items()))
+            print(f"Warning: Flaky test {flaky['nodeid']} ({tally})")
+        outcomes[0]["snapshot"] = snapshots[task_name]
+        results_data = finish_evaluation(task_name, outcomes[0], execution_times[task_name], timings[task_name], trial_summary)
+        summary.append((task_name, results_data["final_score_objective"], results_data["max_score"], len(trial_summary["flaky_tests"])))
+
+    print(f"Evaluated {len(task_names)} tasks over {repeat} trials:")
+    for task_name, score, max_score, flaky_count in sorted(summary):
+        flaky = f" ({flaky_count} flaky tests)" if flaky_count else ""
+        print(f"- {task_name}: {score:.2f}/{max_score}{flaky}")
+
+def parse_candidates(value):
+    """Parses a comma-separated list of candidate directories."""
+    candidates = [path.strip() for path in value.split(",") if path.strip()]
+    if not candidates:
+        raise argparse.ArgumentTypeError("expected a comma-separated list of directories")
+    for path in candidates:
+        if not os.path.isdir(path):
+            raise argparse.ArgumentTypeError(f"candidate directory '{path}' not found")
+    return candidates
+
+def candidate_labels(candidate_dirs):
+    """Names each candidate after its directory, numbering repeated names."""
+    labels = []
+    for path in candidate_dirs:
+        base = os.path.basename(os.path.normpath(os.path.abspath(path))) or "candidate"
+        label, number = base, 1
+        while label in labels:
+            number += 1
+            label = f"{base}-{number}"
+        labels.append(label)
+    return labels
+
+def format_candidate_matrix(task_names, labels, results):
+    """Formats the scores of every candidate x task pair as a side-by-side markdown table."""
+    width = max([18] + [len(label) for label in labels])
+    lines = [
+        f"| {'Task':<30} | " + " | ".join(f"{label:<{width}}" for label in labels) + " |",
+        f"| {'-'*30} | " + " | ".join("-" * width for _ in labels) + " |",
+    ]
+    totals = {label: [0, 0] for label in labels}
+    for task_name in task_names:
+        cells = []
+        for label in labels:
+            data = results.get((label, task_name))
+            if data is None:
+                cells.append(f"{'-':<{width}}")
+                continue
+            totals[label][0] += data["final_score_objective"]
+            totals[label][1] += data["max_score"]
+            duration = data["verifier_duration_seconds"]
+            cell = f"{data['final_score_objective']:.2f}/{data['max_score']}"
+            cell += " (timeout)" if data["timed_out"] else f" ({duration:.2f}s)"
+            cells.append(f"{cell:<{width}}")
+        lines.append(f"| {'`' + task_name + '`':<30} | " + " | ".join(cells) + " |")
+    total_cells = [f"{f'{score:.2f}/{max_score}':<{width}}" for score, max_score in totals.values()]
+    lines.append(f"| {'Total':<30} | " + " | ".join(total_cells) + " |")
+    return "\n".join(lines)
+
+def evaluate_candidates(task_names, candidate_dirs, jobs, timeout=None):
+    """
+    Evaluates several candidates' solutions side by side. Each candidate
+    directory holds one solution directory per task, <candidate>/<task>/.
+    Every candidate x task pair gets its own isolated workspace under
+    .runs/<run id>/<candidate>/, so all of them can run concurrently. Results
+    are saved in the workspaces and summarized in the run's report.md; the
+    repository's solution directories and run history are left untouched.
+    """
+    for task_name in task_names:
+        get_task_dir(task_name)
+    labels = candidate_labels(candidate_dirs)
+    run_id = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ") + f"-{os.getpid()}"
+    run_dir = os.path.abspath(os.path.join(RUNS_DIR, run_id))
+
+    runs, workspaces, label_by_workspace = [], [], {}
+    for label, candidate_dir in zip(labels, candidate_dirs):
+        workspace = os.path.join(run_dir, label)
+        label_by_workspace[workspace] = label
+        for task_name in task_names:
+            solution_source = os.path.join(candidate_dir, task_name)
+            if not os.path.isdir(solution_source):
+                print(f"Warning: Candidate '{label}' has no solution for '{task_name}' at '{solution_source}'. Skipping it.")
+                continue
+            prepare_run_workspace(task_name, workspace, solution_source)
+            runs.append(task_name)
+            workspaces.append(workspace)
+
+    jobs = max(1, min(jobs, len(runs)))
+    print(f"\nRunning {len(runs)} verifiers for {len(labels)} candidates with {jobs} parallel jobs in '{run_dir}'...")
+    results = {}
+    for done, (task_name, outcome) in enumerate(iter_verifier_runs(runs, jobs, timeout, workspaces), 1):
+        label = label_by_workspace[outcome["workspace"]]
+        outcome["cache"] = "disabled"
+        results_data = score_verifier_outcome(task_name, outcome, None, outcome["timings"])
+        results_data["candidate"] = label
+        write_json_atomic(os.path.join(outcome["workspace"], "tasks", task_name, "results.json"), results_data)
+        results[(label, task_name)] = results_data
+        print(f"[{done}/{len(runs)}] '{label}' / '{task_name}': {results_data['final_score_objective']:.2f}/{results_data['max_score']}")
+
+    write_json_atomic(os.path.join(run_dir, "matrix.json"), {
+        "run_id": run_id,
+        "candidates": {label: os.path.abspath(path) for label, path in zip(labels, candidate_dirs)},
+        "tasks": task_names,
+        "results": {label: {task_name: data for (cell_label, task_name), data in results.items() if cell_label == label} for label in labels},
+    })
+    report = format_candidate_matrix(task_names, labels, results)
+    with open(os.path.join(run_dir, "report.md"), 'w') as f:
+        f.write(f"# Candidate Comparison ({run_id})\n\n{report}\n")
+    print(f"\n# Candidate Comparison ({run_id})\n")
+    print(report)
+    print(f"\nSaved to '{os.path.join(run_dir, 'report.md')}'")
+
+def select_snapshot_runs(conn, snapshot_prefixes, task_names, session_id=None, all_sessions=False):
+    """
+    Returns the recorded runs with a solution snapshot that 'reverify' should
+    replay, oldest first: those of the given session, or of every session if
+    all_sessions or if snapshot_prefixes are given, optionally narrowed to some
+    tasks and to the snapshots with the given id prefixes. Exits if a prefix
+    matches no snapshot or more than one.
+    """
+    conditions, params = ["snapshot IS NOT NULL"], []
+    if session_id is not None or not (all_sessions or snapshot_prefixes):
+        conditions.append("session_id = ?")
+        params.append(session_id if session_id is not None else get_current_session(conn))
+    if task_names:
+        conditions.append(f"task_name IN ({', '.join('?' for _ in task_names)})")
+        params.extend(task_names)
+    rows = conn.execute(f"SELECT * FROM runs WHERE {' AND '.join(conditions)} ORDER BY run_id", params).fetchall()
+    if not snapshot_prefixes:
+        return rows
+    selected = set()
+    for prefix in snapshot_prefixes:
+        matches = {row["snapshot"] for row in rows if row["snapshot"].startswith(prefix.lower())}
+        if len(matches) != 1:
+            problem = "matches no recorded snapshot" if not matches else f"is ambiguous ({len(matches)} snapshots)"
+            print(f"Error: Snapshot '{prefix}' {problem}.")
+            sys.exit(1)
+        selected |= matches
+    return [row for row in rows if row["snapshot"] in selected]
+
+def format_reverify_changes(changes):
+    """Formats the runs whose score changed on re-verification as a markdown table."""
+    lines = [
+        f"| {'Run':<6} | {'Task':<30} | {'Snapshot':<12} | {'Old Score':<12} | {'New Score':<12} |",
+        f"| {'-'*6} | {'-'*30} | {'-'*12} | {'-'*12} | {'-'*12} |",
+    ]
+    for row, data in changes:
+        old = f"{row['final_score']:.2f}/{row['max_score']:g}"
+        new = f"{data['final_score_objective']:.2f}/{data['max_score']}"
+        lines.append(f"| {row['run_id']:<6} | {'`' + row['task_name'] + '`':<30} | {row['snapshot'][:12]:<12} | {old:<12} | {new:<12} |")
+    return "\n".join(lines)
+
+def reverify_runs(snapshot_prefixes, task_names, jobs, session_id=None, all_sessions=False, timeout=None):
+    """
+    Re-scores recorded runs by replaying their solution snapshots against the
+    current verifiers, without involving any agent. Each distinct snapshot of a
+    task is restored into an isolated workspace and verified once, with up to
+    'jobs' verifiers in parallel and a bounded number of workspaces on disk.
+    Every selected run then gets a fresh run in a new 'reverify' session,
+    recorded in its original order with its original execution time and a
+    reference to it. The current session stays current.
+    Returns False if nothing could be re-verified.
+    """
+    conn = open_results_store()
+    try:
+        rows = select_snapshot_runs(conn, snapshot_prefixes, task_names, session_id, all_sessions)
+    finally:
+        conn.close()
+    if not rows:
+        print("No recorded runs with solution snapshots match. Snapshots are taken by 'evaluate'.")
+        return False
+
+    runs_by_snapshot = {}
+    for row in rows:
+        runs_by_snapshot.setdefault((row["task_name"], row["snapshot"]), []).append(row)
+    pending = []
+    for task_name, snapshot_id in runs_by_snapshot:
+        manifest = load_snapshot_manifest(snapshot_id)
+        if manifest is None:
+            print(f"Warning: Snapshot {snapshot_id[:12]} of '{task_name}' is not in '{SNAPSHOT_DIR}'. Skipping it.")
+        elif not os.path.isdir(os.path.join("tasks", task_name)):
+            print(f"Warning: Task '{task_name}' is no longer in the catalogue. Skipping snapshot {snapshot_id[:12]}.")
+        else:
+            pending.append((task_name, snapshot_id, manifest))
+
+    jobs = max(1, min(jobs, len(pending) or 1))
+    print(f"\nRe-verifying {len(pending)} snapshots of {len(rows)} runs with {jobs} parallel jobs...")
+    started = time.monotonic()
+    outcomes = {}
+    total = len(pending)
+    run_dir = os.path.abspath(os.path.join(RUNS_DIR, f"reverify-{os.getpid()}"))
+    batch_size = jobs * REVERIFY_BATCH_PER_JOB
+    try:
+        for batch_start in range(0, len(pending), batch_size):
+            names, workspaces, snapshot_by_workspace = [], [], {}
+            for index, (task_name, snapshot_id, manifest) in enumerate(pending[batch_start:batch_start + batch_size], batch_start):
+                workspace = os.path.join(run_dir, str(index))
+                prepare_run_workspace(task_name, workspace, None)
+                try:
+                    restore_snapshot(manifest, os.path.join(workspace, "tasks", task_name, "solution"))
+                except FileNotFoundError as e:
+                    print(f"Warning: Snapshot {snapshot_id[:12]} of '{task_name}' is incomplete ({e.filename} is missing). Skipping it.")
+                    _remove_path(workspace)
+                    total -= 1
+                    continue
+                names.append(task_name)
+                workspaces.append(workspace)
+                snapshot_by_workspace[workspace] = snapshot_id
+            for task_name, outcome in iter_verifier_runs(names, jobs, timeout, workspaces):
+                workspace = outcome.pop("workspace")
+                snapshot_id = snapshot_by_workspace[workspace]
+                _remove_path(workspace)
+                outcome["cache"] = "disabled"
+                outcome["snapshot"] = snapshot_id
+                outcomes[(task_name, snapshot_id)] = outcome
+                passed_tests, total_tests = summarize_counts(outcome["counts"])
+                duration = "timed out" if outcome.get("timed_out") else f"{outcome['duration'] or 0:.2f}s"
+                print(f"[{len(outcomes)}/{total}] '{task_name}' {snapshot_id[:12]}: {passed_tests}/{total_tests} passed ({duration})")
+    finally:
+        if os.path.isdir(run_dir):
+            shutil.rmtree(run_dir)
+    if not outcomes:
+        return False
+
+    changes = []
+    conn = open_results_store()
+    try:
+        session_id = start_session(conn, reverify=True)
+        for row in rows:
+            outcome = outcomes.get((row["task_name"], row["snapshot"]))
+            if outcome is None:
+                continue
+            results_data = score_verifier_outcome(row["task_name"], outcome, None, outcome["timings"])
+            results_data["execution_time_seconds"] = row["execution_time"]
+            results_data["reverified_from"] = row["run_id"]
+            results_data["run_id"] = record_run(results_data, conn, session_id)
+            if results_data["final_score_objective"] != row["final_score"] or results_data["max_score"] != row["max_score"]:
+                changes.append((row, results_data))
+    finally:
+        conn.close()
+
+    rescored = sum(len(runs_by_snapshot[key]) for key in outcomes)
+    print(f"\nRe-scored {rescored} runs from {len(outcomes)} snapshots in {time.monotonic() - started:.2f}s into session {session_id}.")
+    if changes:
+        print(f"{len(changes)} scores changed:\n")
+        print(format_reverify_changes(changes))
+    else:
+        print("No scores changed.")
+    print(f"Run 'python runner.py report --session {session_id}' to see the re-scored session.")
+    return True
+
+def _watched_files(task_dir):
+    """Yields the paths, relative to task_dir, of the files whose changes 'evaluate --watch' reacts to."""
+    if os.path.isfile(os.path.join(task_dir, "task.json")):
+        yield "task.json"
+    for tree in WATCHED_TREES:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(task_dir, tree)):
+            dirnames[:] = sorted(d for d in dirnames if d not in VERIFIER_CACHE_IGNORED_DIRS)
+            for name in sorted(filenames):
+                if not name.endswith((".pyc", ".pyo")):
+                    yield os.path.relpath(os.path.join(dirpath, name), task_dir).replace(os.sep, "/")
+
+def _is_watched_path(rel_path):
+    """Returns True if a path relative to the task directory is one that _watched_files covers."""
+    parts = rel_path.split("/")
+    if parts == ["task.json"]:
+        return True
+    return (
+        parts[0] in WATCHED_TREES
+        and not any(part in VERIFIER_CACHE_IGNORED_DIRS for part in parts)
+        and not parts[-1].endswith((".pyc", ".pyo"))
+    )
+
+def snapshot_watched_files(task_dir):
+    """Returns a content digest of every watched file in a task, keyed by its relative path."""
+    import hashlib
+
+    digests = {}
+    for rel_path in _watched_files(task_dir):
+        digest = hashlib.sha256()
+        try:
+            with open(os.path.join(task_dir, rel_path), 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        except OSError:
+            continue
+        digests[rel_path] = digest.hexdigest()
+    return digests
+
+class _InotifyWatcher:
+    """Watches a task directory tree for changes with Linux's inotify, called through ctypes."""
+
+    kind = "inotify"
+
+    def __init__(self, task_dir):
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._task_dir = task_dir
+        self._paths = {}
+        self._add_tree(task_dir)
+
+    def _add_tree(self, root):
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in VERIFIER_CACHE_IGNORED_DIRS]
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), INOTIFY_MASK)
+            if wd >= 0:
+                self._paths[wd] = dirpath
+
+    def wait(self, timeout):
+        """Waits up to timeout seconds (None: forever) and returns True if a watched file may have changed."""
+        import select
+        import struct
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            if not select.select([self._fd], [], [], remaining)[0]:
+                return False
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            changed = False
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = struct.unpack_from("iIII", data, offset)
+                name = data[offset + 16:offset + 16 + length].rstrip(b"\0").decode(errors="replace")
+                offset += 16 + length
+                if mask & INOTIFY_Q_OVERFLOW:
+                    # Events were dropped, so anything may have changed.
+                    changed = True
+                    continue
+                if mask & INOTIFY_IGNORED:
+                    self._paths.pop(wd, None)
+                    continue
+                directory = self._paths.get(wd)
+                if directory is None:
+                    continue
+                path = os.path.join(directory, name) if name else directory
+                if mask & INOTIFY_ISDIR and mask & (INOTIFY_CREATE | INOTIFY_MOVED_TO) and name not in VERIFIER_CACHE_IGNORED_DIRS:
+                    self._add_tree(path)
+                rel_path = os.path.relpath(path, self._task_dir).replace(os.sep, "/")
+                if rel_path != "." and (_is_watched_path(rel_path) or rel_path in WATCHED_TREES):
+                    changed = True
+            if changed:
+                return True
+
+    def close(self):
+        os.close(self._fd)
+
+class _PollingWatcher:
+    """Watches a task directory tree for changes by polling file sizes and modification times."""
+
+    kind = "polling"
+
+    def __init__(self, task_dir):
+        self._task_dir = task_dir
+        self._state = self._scan()
+
+    def _scan(self):
+        state = {}
+        for rel_path in _watched_files(self._task_dir):
+            try:
+                file_stat = os.stat(os.path.join(self._task_dir, rel_path))
+            except OSError:
+                continue
+            state[rel_path] = (file_stat.st_size, file_stat.st_mtime_ns)
+        return state
+
+    def wait(self, timeout):
+        """Waits up to timeout seconds (None: forever) and returns True if a watched file may have changed."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = WATCH_POLL_INTERVAL if deadline is None else min(WATCH_POLL_INTERVAL, deadline - time.monotonic())
+            if remaining > 0:
+                time.sleep(remaining)
+            state = self._scan()
+            if state != self._state:
+                self._state = state
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    def close(self):
+        pass
+
+def open_task_watcher(task_dir):
+    """
+    Returns a watcher for a task directory: inotify on Linux, else (or if
+    RUNNER_WATCH_POLLING is set, for filesystems that deliver no inotify
+    events, such as some network and container mounts) a polling watcher.
+    """
+    if sys.platform.startswith("linux") and not os.environ.get("RUNNER_WATCH_POLLING"):
+        try:
+            return _InotifyWatcher(task_dir)
+        except (OSError, AttributeError):
+            pass
+    return _PollingWatcher(task_dir)
+
+def wait_for_changes(watcher):
+    """
+    Blocks until a watched file changes, then keeps absorbing changes until
+    none arrive for WATCH_DEBOUNCE_SECONDS, so that a burst of writes (an
+    editor saving, a tool rewriting several files) starts a single run.
+    Returns the monotonic time of the first change.
+    """
+    watcher.wait(None)
+    first_change = time.monotonic()
+    while time.monotonic() - first_change < WATCH_MAX_DEBOUNCE_SECONDS and watcher.wait(WATCH_DEBOUNCE_SECONDS):
+        pass
+    return first_change
+
+def select_affected_tests(task_name, changed, nodeids):
+    """
+    Returns the tests among nodeids affected by the changed files of a task,
+    in their collected order: those whose test module, or a conftest.py next
+    to it, refers to a changed solution file by its file or module name.
+    Returns None if the change may affect any test: the verifier or task.json
+    changed, or a changed solution file is referred to by no test module.
+    """
+    import re
+
+    if any(not path.startswith("solution/") for path in changed):
+        return None
+    task_dir = get_task_dir(task_name)
+    modules = {}
+    for nodeid in nodeids:
+        module_path = nodeid.split("::")[0]
+        if module_path in modules:
+            continue
+        texts = []
+        for path in (module_path, os.path.join(os.path.dirname(module_path), "conftest.py")):
+            try:
+                with open(path, 'r', errors="replace") as f:
+                    texts.append(f.read())
+            except OSError:
+                pass
+        modules[module_path] = "\n".join(texts)
+
+    affected_modules = set()
+    for path in changed:
+        name = path.rsplit("/", 1)[-1]
+        pattern = re.compile(rf"\b({re.escape(name)}|{re.escape(os.path.splitext(name)[0])})\b")
+        referring = {module_path for module_path, text in modules.items() if pattern.search(text)}
+        if not referring:
+            return None
+        affected_modules |= referring
+    return [nodeid for nodeid in nodeids if nodeid.split("::")[0] in affected_modules]
+
+def _summarize_watch_run(outcome):
+    """Returns what the iteration log keeps of a verifier run."""
+    return {
+        "tests": len(outcome["tests"]),
+        "counts": outcome["counts"],
+        "duration": outcome["duration"],
+        "exit_code": outcome["exit_code"],
+    }
+
+def _print_watch_failures(outcome):
+    """Prints the failing tests of a run, or the verifier's output if it failed without test results."""
+    failing = [test for test in outcome["tests"] if test["outcome"] in ("failed", "error")]
+    if not failing and outcome["exit_code"] not in (0, 5):
+        print_verifier_output(outcome)
+    for test in failing:
+        print(f"  {test['outcome'].upper()} {test['nodeid']}: {test.get('message', '')}")
+
+def run_watch_iteration(task_name, workspace, changed, last_outcomes, use_cache, timeout):
+    """
+    Runs one iteration of 'evaluate --watch' from the isolated workspace. The
+    tests affected by the changed files run first, followed by the tests that
+    failed last time; only if all of those pass does the full verifier run and
+    get scored. Updates last_outcomes and returns the iteration's log entry.
+    """
+    task_dir = get_task_dir(task_name)
+    started = time.monotonic()
+    cache_key = compute_verifier_cache_key(task_name) if use_cache else None
+    snapshot_timings = {}
+    snapshot_id = snapshot_solution(task_name, snapshot_timings)
+    prepare_run_workspace(task_name, workspace, os.path.join(task_dir, "solution"))
+    entry = {"focused": None, "full": None}
+
+    cached = load_cached_outcome(cache_key) if use_cache else None
+    focus = None
+    if cached is None and last_outcomes:
+        nodeids = list(last_outcomes)
+        affected = select_affected_tests(task_name, changed, nodeids)
+        if affected is not None:
+            failing = [nodeid for nodeid in nodeids if last_outcomes[nodeid] in ("failed", "error") and nodeid not in affected]
+            focus = affected + failing
+            entry["affected_tests"] = len(affected)
+            entry["failing_tests"] = len(failing)
+        if focus is not None and len(focus) >= len(nodeids):
+            focus = None
+    if focus:
+        _, outcome = next(iter_verifier_runs([task_name], 1, timeout, [workspace], [focus]))
+        entry["focused"] = _summarize_watch_run(outcome)
+        entry["first_result_seconds"] = round(time.monotonic() - started, 6)
+        last_outcomes.update((test["nodeid"], test["outcome"]) for test in outcome["tests"])
+        passed, total = summarize_counts(outcome["counts"])
+        print(f"Focused run: {passed}/{total} passed in {outcome['duration'] or 0:.2f}s "
+              f"({entry['affected_tests']} affected, {entry['failing_tests']} previously failing).")
+        if outcome["duration"] is None or passed < total:
+            _print_watch_failures(outcome)
+            print("Skipping the full run until these pass.")
+            return entry
+
+    outcome = None
+    if cached is not None and metric_test_ids(cached):
+        _, rerun = next(iter_verifier_runs([task_name], 1, timeout, [workspace], [metric_test_ids(cached)]))
+        rerun.pop("workspace", None)
+        outcome = complete_cached_outcome(cached, rerun)
+    elif cached is not None:
+        outcome = dict(cached, timings={})
+    if outcome is not None:
+        outcome["cache"] = "hit"
+    else:
+        _, outcome = next(iter_verifier_runs([task_name], 1, timeout, [workspace]))
+        outcome.pop("workspace", None)
+        if use_cache and is_cacheable_outcome(outcome):
+            store_cached_outcome([cache_key], outcome)
+        outcome["cache"] = "miss" if use_cache else "disabled"
+    entry.setdefault("first_result_seconds", round(time.monotonic() - started, 6))
+    last_outcomes.clear()
+    last_outcomes.update((test["nodeid"], test["outcome"]) for test in outcome["tests"])
+    execution_time = get_execution_time(task_name)
+    outcome["snapshot"] = snapshot_id
+    timings = dict(get_evaluation_timings(task_name, execution_time), **snapshot_timings)
+    # Later iterations still measure from 'start', so the start time is kept until the watch ends.
+    results_data = finish_evaluation(task_name, outcome, execution_time, timings, keep_start_time=True)
+    entry["full"] = dict(
+        _summarize_watch_run(outcome),
+        cache=outcome["cache"],
+        score=results_data["final_score_objective"],
+        max_score=results_data["max_score"],
+        run_id=results_data["run_id"],
+    )
+    passed, total = summarize_counts(outcome["counts"])
+    cached_note = " (cached)" if outcome["cache"] == "hit" else ""
+    print(f"Full run{cached_note}: {passed}/{total} passed, score {results_data['final_score_objective']:.2f}/{results_data['max_score']}.")
+    _print_watch_failures(outcome)
+    return entry
+
+def watch_task(task_name, use_cache=True, timeout=None):
+    """
+    Re-verifies a task whenever its solution, verifier or task.json changes,
+    until interrupted. Runs happen in an isolated copy of the task, so files
+    the verifier writes never trigger another run, and keep reusing the warm
+    verifier workers. Each iteration is appended to the task's watch log.
+    The start time is cleared on exit if the last run passed every test.
+    """
+    import statistics
+
+    task_dir = get_task_dir(task_name)
+    if not os.path.isdir(os.path.join(task_dir, "solution")):
+        print(f"Error: '{task_name}' has no solution directory yet. Run 'python runner.py start {task_name}' first.")
+        sys.exit(1)
+    log_path = os.path.join(task_dir, WATCH_LOG)
+    watcher = open_task_watcher(task_dir)
+    print(f"Watching '{task_dir}' for changes ({watcher.kind}); iterations are logged to '{log_path}'. Press Ctrl+C to stop.")
+    latencies = []
+    last_outcomes = {}
+    passing = False
+    digests = snapshot_watched_files(task_dir)
+    changed, first_change, debounce = [], time.monotonic(), 0.0
+    try:
+        with tempfile.TemporaryDirectory(prefix="watch-") as workspace:
+            for iteration in itertools.count():
+                if iteration:
+                    print(f"\n[watch #{iteration}] Changed: {', '.join(changed)}")
+                else:
+                    print("\n[watch #0] Initial run")
+                entry = run_watch_iteration(task_name, workspace, changed, last_outcomes, use_cache, timeout)
+                # Without a full run, the focused run failed.
+                passed, total = summarize_counts(entry["full"]["counts"]) if entry["full"] is not None else (0, 0)
+                passing = total > 0 and passed == total
+                latency = round(time.monotonic() - first_change, 6)
+                latencies.append(latency)
+                entry = dict(
+                    iteration=iteration,
+                    timestamp=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                    changed=changed,
+                    debounce_seconds=round(debounce, 6),
+                    latency_seconds=latency,
+                    **entry,
+                )
+                with open(log_path, 'a') as f:
+                    f.write(json.dumps(entry) + "\n")
+                print(f"Feedback in {latency:.2f}s after the change. Waiting for changes...")
+
+                changed = []
+                while not changed:
+                    first_change = wait_for_changes(watcher)
+                    debounce = time.monotonic() - first_change
+                    new_digests = snapshot_watched_files(task_dir)
+                    changed = sorted(path for path in digests.keys() | new_digests.keys() if digests.get(path) != new_digests.get(path))
+                    digests = new_digests
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+        if passing:
+            clear_start_time(task_name)
+    if latencies:
+        print(f"\nStopped watching after {len(latencies)} runs; median feedback latency {statistics.median(latencies):.2f}s.")
+
+def _profile_path(filename, workspace):
+    """Shortens a profiled file name: relative to the workspace if inside it, else its base name."""
+    real_path = os.path.realpath(filename)
+    if real_path.startswith(workspace + os.sep):
+        return os.path.relpath(real_path, workspace).replace(os.sep, "/")
+    return os.path.basename(filename)
+
+def summarize_profile(profile_dir, workspace):
+    """
+    Combines the profiles of every process of a profiled verifier run into a
+    summary: the functions with the most self time, the allocation sites
+    holding the most memory near each process's peak, and collapsed stacks
+    for flame graph tools. Time spent in pytest and the runner is left out.
+    """
+    import collections
+    import pstats
+
+    workspace = os.path.realpath(workspace)
+    prof_paths = sorted(os.path.join(profile_dir, name) for name in os.listdir(profile_dir) if name.endswith(".prof"))
+    processes, samples, allocations = [], collections.Counter(), collections.Counter()
+    for name in sorted(os.listdir(profile_dir)):
+        if not name.endswith(".json"):
+            continue
+        with open(os.path.join(profile_dir, name), 'r') as f:
+            data = json.load(f)
+        processes.append(data["label"])
+        samples.update(data["samples"])
+        for allocation in data["allocations"]:
+            filename, _, line = allocation["location"].rpartition(":")
+            allocations[f"{_profile_path(filename, workspace)}:{line}"] += allocation["bytes"]
+
+    hotspots = []
+    if prof_paths:
+        stats = pstats.Stats(*prof_paths).stats
+        internal = (os.sep + "_pytest" + os.sep, os.sep + "pluggy" + os.sep, os.sep + "pytest" + os.sep)
+        runner_path = os.path.realpath(__file__)
+        for (filename, line, name), (_, calls, self_time, cumulative_time, _) in sorted(stats.items(), key=lambda item: item[1][2], reverse=True):
+            if any(part in filename for part in internal) or os.path.realpath(filename) == runner_path:
+                continue
+            hotspots.append({
+                # pstats names built-in functions with the file name "~".
+                "function": name if filename == "~" else f"{_profile_path(filename, workspace)}:{line}({name})",
+                "calls": calls,
+                "self_seconds": round(self_time, 6),
+                "cumulative_seconds": round(cumulative_time, 6),
+            })
+            if len(hotspots) == PROFILE_TOP_ENTRIES:
+                break
+
+    return {
+        "processes": collections.Counter(processes),
+        "hotspots": hotspots,
+        "allocations": [
+            {"location": location, "bytes": size}
+            for location, size in allocations.most_common(PROFILE_TOP_ENTRIES)
+        ],
+        "samples": samples,
+    }
+
+def profile_tasks(task_names, jobs, timeout=None):
+    """
+    Runs each task's verifier once more with it, and every Python process it
+    starts, profiled. The pass runs after scoring from isolated workspaces, so
+    profiling overhead never reaches the scored run or its timings. Saves the
+    summary as profile.json and the collapsed stacks as profile.collapsed next
+    to each task's results.json, and adds the top hotspots to results.json.
+    Tasks without a solution or a results.json to attach the profile to are
+    skipped.
+    """
+    profiled = []
+    for task_name in task_names:
+        task_dir = get_task_dir(task_name)
+        if not os.path.isdir(os.path.join(task_dir, "solution")):
+            print(f"Warning: '{task_name}' has no solution directory. Skipping its profile.")
+        elif not os.path.isfile(os.path.join(task_dir, "results.json")):
+            print(f"Warning: '{task_name}' has no results.json to attach a profile to. Skipping its profile.")
+        else:
+            profiled.append(task_name)
+    if not profiled:
+        return
+    task_names = profiled
+    print(f"\nProfiling {len(task_names)} verifier runs...")
+    with tempfile.TemporaryDirectory(prefix="profile-") as profile_root:
+        workspaces, profile_dirs = [], []
+        for task_name in task_names:
+            workspace = os.path.join(profile_root, "workspaces", task_name)
+            prepare_run_workspace(task_name, workspace, os.path.join(get_task_dir(task_name), "solution"))
+            workspaces.append(workspace)
+            profile_dirs.append(os.path.join(profile_root, "profiles", task_name))
+            os.makedirs(profile_dirs[-1])
+        profile_dir_by_workspace = dict(zip(workspaces, profile_dirs))
+
+        for task_name, outcome in iter_verifier_runs(task_names, jobs, timeout, workspaces, profile_dirs=profile_dirs):
+            task_dir = get_task_dir(task_name)
+            results_path = os.path.join(task_dir, "results.json")
+            try:
+                with open(results_path, 'r') as f:
+                    results_data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                print(f"Warning: Could not read '{results_path}'. Skipping the profile of '{task_name}'.")
+                continue
+            summary = summarize_profile(profile_dir_by_workspace[outcome["workspace"]], outcome["workspace"])
+            samples = summary.pop("samples")
+            with open(os.path.join(task_dir, PROFILE_STACKS), 'w') as f:
+                for stack, count in sorted(samples.items()):
+                    f.write(f"{stack} {count}\n")
+
+            summary = dict(
+                run_id=results_data.get("run_id"),
+                timestamp=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                profiled_duration_seconds=outcome["duration"],
+                test_counts=outcome["counts"],
+                collapsed_stacks=PROFILE_STACKS,
+                **summary,
+            )
+            write_json_atomic(os.path.join(task_dir, PROFILE_SUMMARY), summary)
+            results_data["profile"] = {
+                "summary": PROFILE_SUMMARY,
+                "collapsed_stacks": PROFILE_STACKS,
+                "hotspots": summary["hotspots"][:PROFILE_REPORT_HOTSPOTS],
+            }
+            write_json_atomic(results_path, results_data)
+
+            print(f"\nProfile of '{task_name}' ({len(samples)} distinct stacks from {sum(summary['processes'].values())} processes) saved to '{os.path.join(task_dir, PROFILE_SUMMARY)}'")
+            for hotspot in summary["hotspots"][:PROFILE_REPORT_HOTSPOTS]:
+                print(f"  {hotspot['self_seconds']:>8.3f}s self  {hotspot['calls']:>9} calls  {hotspot['function']}")
+
+def get_task_names():
+    """Returns the sorted names of all tasks in the 'tasks' directory, from the task registry."""
+    return list(load_task_registry())
+
+def parse_shard(value):
+    """Parses an 'i/N' shard spec into a 1-based (index, count) pair."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}', expected i/N") from None
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}', expected 1 <= i <= N")
+    return index, count
+
+def load_expected_durations(task_names, durations_path=None):
+    """
+    Returns the expected verifier duration of each task, taken from a durations
+    file if given, then from the task's task.json "expected_duration_seconds".
+    Tasks with neither get the mean of the known durations.
+    """
+    durations = {}
+    if durations_path:
+        with open(durations_path, 'r') as f:
+            durations = json.load(f)
+    known = {}
+    for task_name in task_names:
+        duration = durations.get(task_name, load_task_config(task_name).get("expected_duration_seconds"))
+        if duration is not None:
+            known[task_name] = float(duration)
+    default = sum(known.values()) / len(known) if known else 1.0
+    return {task_name: known.get(task_name, default) for task_name in task_names}
+
+def partition_by_duration(names, durations, count):
+    """
+    Splits names (tasks or tests) into count groups of similar total expected
+    duration. Names are assigned longest first to the least loaded group, with
+    ties broken by name and group number, so every machine computes the same
+    partition. Each group keeps the order in which the names were given.
+    """
+    groups = [[] for _ in range(count)]
+    loads = [0.0] * count
+    for name in sorted(names, key=lambda name: (-durations[name], name)):
+        target = min(range(count), key=lambda i: (loads[i], i))
+        groups[target].append(name)
+        loads[target] += durations[name]
+    position = {name: i for i, name in enumerate(names)}
+    return [sorted(group, key=position.get) for group in groups]
+
+def export_results(path):
+    """Writes the latest results of every task in the current session to a bundle for 'merge'."""
+    import platform
+
+    conn = open_results_store()
+    try:
+        latest = conn.execute(
+            f"""SELECT runs.run_id, runs.task_name FROM runs JOIN ({LATEST_RUNS_SQL}) AS latest USING (run_id)
+               ORDER BY task_name""",
+            (get_current_session(conn),)
+        ).fetchall()
+    finally:
+        conn.close()
+
+    results = []
+    for row in latest:
+        results_path = os.path.join("tasks", row["task_name"], "results.json")
+        data = None
+        if os.path.exists(results_path):
+            with open(results_path, 'r') as f:
+                data = json.load(f)
+        if data is None or data.get("run_id") != row["run_id"]:
+            print(f"Warning: '{results_path}' does not match the latest run of '{row['task_name']}'. Skipping it.")
+            continue
+        results.append(data)
+
+    write_json_atomic(path, {
+        "format": EXPORT_FORMAT,
+        "exported_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "host": platform.node(),
+        "catalogue": get_task_names(),
+        "results": results,
+    })
+    print(f"Exported results for {len(results)} tasks to '{path}'")
+
+def merge_results(paths, durations_path=None):
+    """
+    Imports the results of several exported bundles into a new session, so that
+    'report' covers the merged set. Refuses to merge if a task appears in more
+    than one bundle. Returns False, without recording or writing anything, if
+    any task of the catalogue is missing.
+    """
+    bundles = []
+    for path in paths:
+        with open(path, 'r') as f:
+            bundle = json.load(f)
+        if bundle.get("format") != EXPORT_FORMAT:
+            print(f"Error: '{path}' is not a results bundle in format {EXPORT_FORMAT}.")
+            sys.exit(1)
+        bundles.append((path, bundle))
+
+    sources = {}
+    for path, bundle in bundles:
+        for data in bundle["results"]:
+            sources.setdefault(data["task_name"], []).append(path)
+    duplicates = {task_name: found_in for task_name, found_in in sources.items() if len(found_in) > 1}
+    if duplicates:
+        print("Error: The following tasks appear in more than one bundle:")
+        for task_name, found_in in sorted(duplicates.items()):
+            print(f"- {task_name}: {', '.join(found_in)}")
+        sys.exit(1)
+
+    catalogues = {tuple(bundle["catalogue"]) for _, bundle in bundles}
+    if len(catalogues) > 1:
+        print("Warning: The bundles were exported from different task catalogues; using all of their tasks.")
+    catalogue = sorted({task_name for names in catalogues for task_name in names})
+    # A partial merge would leave a session that reports some tasks as never evaluated.
+    missing = [task_name for task_name in catalogue if task_name not in sources]
+    if missing:
+        print("Error: The following tasks are missing from every bundle; nothing was merged:")
+        for task_name in missing:
+            print(f"- {task_name}")
+        return False
+
+    merged = []
+    conn = open_results_store()
+    try:
+        start_session(conn)
+        for path, bundle in bundles:
+            for data in bundle["results"]:
+                data["run_id"] = record_run(data, conn)
+                task_dir = os.path.join("tasks", data["task_name"])
+                if os.path.isdir(task_dir):
+                    write_json_atomic(os.path.join(task_dir, "results.json"), data)
+                merged.append(data)
+            print(f"Merged {len(bundle['results'])} tasks from '{path}' ({bundle['host']})")
+    finally:
+        conn.close()
+
+    if durations_path:
+        write_json_atomic(durations_path, {
+            data["task_name"]: data["verifier_duration_seconds"] for data in merged
+            if data["verifier_duration_seconds"] is not None
+        })
+        print(f"Wrote verifier durations to '{durations_path}'")
+
+    print(f"Merged results for all {len(catalogue)} tasks into a new session. Run 'python runner.py report' to see them.")
+    return True
 
 def list_tasks():
     """Lists all available tasks."""
-    tasks_dir = "tasks"
-    if os.path.isdir(tasks_dir):
-        tasks = [d for d in os.listdir(tasks_dir) if os.path.isdir(os.path.join(tasks_dir, d))]
+    if os.path.isdir("tasks"):
+        tasks = get_task_names()
         if tasks:
             print("Available tasks:")
             for task in tasks:
@@ -166,20 +3614,54 @@ def list_tasks():
     else:
         print("'tasks' directory not found.")
 
-def report_results():
-    """Finds all results.json files and reports the scores in a markdown table."""
-    tasks_dir = "tasks"
-    all_results = []
+def report_results(show_history=False, show_timings=False, session_id=None):
+    """
+    Reports the latest scores of every task in the current session, or in the
+    given one, as a markdown table. Only the current session must cover every task.
+    """
+    task_names = get_task_names()
+    conn = open_results_store()
+    try:
+        current = session_id is None
+        if current:
+            session_id = get_current_session(conn)
+        # One aggregate query over the indexed run history; per-test records are never read.
+        all_results = conn.execute(
+            f"""SELECT runs.* FROM runs JOIN ({LATEST_RUNS_SQL}) AS latest USING (run_id)
+               ORDER BY task_name""",
+            (session_id,)
+        ).fetchall()
+        timing_rows = conn.execute(
+            f"""SELECT runs.task_name, run_timings.phase, run_timings.seconds
+               FROM run_timings JOIN ({LATEST_RUNS_SQL}) AS latest USING (run_id)
+               JOIN runs USING (run_id)""",
+            (session_id,)
+        ).fetchall() if show_timings else []
+        attempt_rows = conn.execute(
+            f"""SELECT runs.* FROM runs JOIN ({LATEST_ATTEMPTS_SQL}) AS latest USING (run_id)
+               ORDER BY task_name""",
+            (session_id,)
+        ).fetchall()
+        trial_rows = conn.execute(
+            f"""SELECT runs.task_name, run_trials.verifier_duration
+               FROM run_trials JOIN ({LATEST_RUNS_SQL}) AS latest USING (run_id)
+               JOIN runs USING (run_id) WHERE run_trials.verifier_duration IS NOT NULL""",
+            (session_id,)
+        ).fetchall()
+        # With a single MAX(), SQLite takes the bare max_score from the best run.
+        history = conn.execute(
+            """SELECT task_name, COUNT(*) AS runs, MAX(final_score) AS best_score, max_score,
+                      AVG(verifier_duration) AS mean_verifier_duration, MIN(timestamp) AS first_run,
+                      MAX(timestamp) AS last_run
+               FROM runs GROUP BY task_name ORDER BY task_name"""
+        ).fetchall() if show_history else []
+    finally:
+        conn.close()
 
-    # Check for missing results.json files
-    missing_results = []
-    task_names = [d for d in sorted(os.listdir(tasks_dir)) if os.path.isdir(os.path.join(tasks_dir, d))]
-    for task_name in task_names:
-        task_dir = os.path.join(tasks_dir, task_name)
-        results_path = os.path.join(task_dir, "results.json")
-        if not os.path.exists(results_path):
-            missing_results.append(task_name)
-    if missing_results:
+    # Check for tasks that have not been evaluated in this session
+    evaluated = {row["task_name"] for row in all_results}
+    missing_results = [task_name for task_name in task_names if task_name not in evaluated]
+    if missing_results and current:
         print("Error: You must attempt all tasks before running the report.")
         print("The following tasks have not been evaluated:")
         for t in missing_results:
@@ -187,24 +3669,10 @@ def report_results():
         print("\nPlease run 'python runner.py evaluate <task-name>' for each missing task before generating the report.")
         return
 
-    for task_name in task_names:
-        task_dir = os.path.join(tasks_dir, task_name)
-        results_path = os.path.join(task_dir, "results.json")
-        if os.path.exists(results_path):
-            try:
-                with open(results_path, 'r') as f:
-                    data = json.load(f)
-                    all_results.append(data)
-            except (json.JSONDecodeError, KeyError):
-                print(f"Warning: Could not parse results.json for '{task_name}'")
-
     if not all_results:
         print("No results found. Run a task with 'evaluate' to generate results.")
         return
 
-    # Sort results by task name for consistent output
-    all_results.sort(key=lambda x: x.get("task_name", ""))
-
     output_lines = [
         "\n# Benchmark Results Summary\n",
         "The table below shows the results for all completed tasks.",
@@ -212,34 +3680,138 @@ def report_results():
     ]
 
     # Table header
-    output_lines.append(f"| {'Task':<30} | {'Correct. (/60)':<15} | {'Complete (/20)':<15} | {'Score (/80)':<12} | {'Time (s)':<10} |")
-    output_lines.append(f"| {'-'*30} | {'-'*15} | {'-'*15} | {'-'*12} | {'-'*10} |")
+    output_lines.append(f"| {'Task':<30} | {'Correct. (/60)':<15} | {'Complete (/20)':<15} | {'Perf. (/20)':<12} | {'Score':<12} | {'Time (s)':<10} | {'Verifier (s)':<15} | {'CPU (s)':<8} | {'Peak RSS (MB)':<13} |")
+    output_lines.append(f"| {'-'*30} | {'-'*15} | {'-'*15} | {'-'*12} | {'-'*12} | {'-'*10} | {'-'*15} | {'-'*8} | {'-'*13} |")
+
+    trial_durations = {}
+    for row in trial_rows:
+        trial_durations.setdefault(row["task_name"], []).append(row["verifier_duration"])
 
     total_correctness = 0
     total_completion = 0
     total_score = 0
     total_time = 0
+    total_cpu = 0
+    total_performance = 0
+    total_max_score = 0
+    total_verifier = 0
 
     for data in all_results:
-        task_name = f"`{data.get('task_name', 'N/A')}`"
-        correctness = data.get('scores', {}).get('correctness', 0)
-        completion = data.get('scores', {}).get('task_completion', 0)
-        score = data.get("final_score_objective", 0)
-        time = data.get('execution_time_seconds', 0)
+        task_name = f"`{data['task_name']}`"
+        correctness = data['correctness']
+        completion = data['task_completion']
+        score = data['final_score']
+        time = data['execution_time'] or 0
 
         total_correctness += correctness
         total_completion += completion
         total_score += score
         total_time += time
 
-        output_lines.append(f"| {task_name:<30} | {correctness:<15.2f} | {completion:<15.2f} | {score:<12.2f} | {time:<10.2f} |")
+        if data['user_cpu'] is None:
+            cpu, peak_rss = f"{'-':<8}", f"{'-':<13}"
+        else:
+            total_cpu += data['user_cpu'] + data['system_cpu']
+            cpu = f"{data['user_cpu'] + data['system_cpu']:<8.2f}"
+            peak_rss = f"{data['max_rss_kb'] / 1024:<13.1f}"
+        if data['timed_out']:
+            task_name += " (timeout)"
+        if data['flaky_tests']:
+            task_name += " (flaky)"
+
+        # Repeated runs show the mean verifier duration with its 95% confidence interval.
+        durations = trial_durations.get(data['task_name'])
+        if durations and len(durations) > 1:
+            stats = duration_statistics(durations)
+            total_verifier += stats['mean']
+            verifier = f"{stats['mean']:.2f} ± {stats['mean'] - stats['ci95_low']:.2f}"
+        elif data['verifier_duration'] is not None:
+            total_verifier += data['verifier_duration']
+            verifier = f"{data['verifier_duration']:.2f}"
+        else:
+            verifier = "-"
+
+        if data['performance'] is None:
+            performance = f"{'-':<12}"
+        else:
+            total_performance += data['performance']
+            performance = f"{data['performance']:<12.2f}"
+        total_max_score += data['max_score']
+        score_label = f"{score:.2f}/{data['max_score']:.0f}"
+
+        output_lines.append(f"| {task_name:<30} | {correctness:<15.2f} | {completion:<15.2f} | {performance} | {score_label:<12} | {time:<10.2f} | {verifier:<15} | {cpu} | {peak_rss} |")
 
     # Total row
     total_label = f"Total"
-    output_lines.append(f"| {total_label:<30} | {total_correctness:<15.2f} | {total_completion:<15.2f} | {total_score:<12.2f} | {total_time:<10.2f} |")
+    total_score_label = f"{total_score:.2f}/{total_max_score:.0f}"
+    output_lines.append(f"| {total_label:<30} | {total_correctness:<15.2f} | {total_completion:<15.2f} | {total_performance:<12.2f} | {total_score_label:<12} | {total_time:<10.2f} | {total_verifier:<15.2f} | {total_cpu:<8.2f} | {'':<13} |")
     
     print('\n'.join(output_lines))
 
+    cache_states = [data["verifier_cache"] for data in all_results]
+    if "hit" in cache_states or "miss" in cache_states:
+        print(f"\nVerifier cache: {cache_states.count('hit')} hits, {cache_states.count('miss')} misses.")
+
+    if attempt_rows:
+        # Offsets are taken when each evaluation starts, so the agent's time up to an
+        # attempt is its offset less the verifier time counted for the attempts before
+        # it. Runs recorded before that time was stored fall back to their duration.
+        print("\n# Attempt Timeline\n")
+        print(f"| {'Task':<30} | {'Attempts':<8} | {'To Pass':<7} | {'First Pass (s)':<14} | {'Verifier (s)':<12} | {'Agent (s)':<10} | {'Flips':<5} |")
+        print(f"| {'-'*30} | {'-'*8} | {'-'*7} | {'-'*14} | {'-'*12} | {'-'*10} | {'-'*5} |")
+        for row in attempt_rows:
+            task_name = f"`{row['task_name']}`"
+            run_verifier_seconds = row['run_verifier_seconds']
+            if run_verifier_seconds is None:
+                run_verifier_seconds = row['verifier_duration'] or 0
+            agent_time = row['execution_time'] - (row['attempt_verifier_seconds'] - run_verifier_seconds)
+            if row['first_pass_attempt'] is None:
+                to_pass, first_pass = f"{'-':<7}", f"{'-':<14}"
+            else:
+                to_pass, first_pass = f"{row['first_pass_attempt']:<7}", f"{row['first_pass_offset']:<14.2f}"
+            print(f"| {task_name:<30} | {row['attempt']:<8} | {to_pass} | {first_pass} | {row['attempt_verifier_seconds']:<12.2f} | {agent_time:<10.2f} | {row['attempt_flips']:<5} |")
+
+    if show_timings:
+        timings = {}
+        for row in timing_rows:
+            timings.setdefault(row["task_name"], {})[row["phase"]] = row["seconds"]
+        print("\n# Phase Timings (seconds)\n")
+        print(f"| {'Task':<30} | " + " | ".join(f"{label:<8}" for _, label in TIMING_PHASES) + " |")
+        print(f"| {'-'*30} | " + " | ".join("-" * 8 for _ in TIMING_PHASES) + " |")
+        for data in all_results:
+            task_name = f"`{data['task_name']}`"
+            phases = timings.get(data["task_name"], {})
+            cells = [f"{phases[phase]:<8.3f}" if phase in phases else f"{'-':<8}" for phase, _ in TIMING_PHASES]
+            print(f"| {task_name:<30} | " + " | ".join(cells) + " |")
+
+    # Profiles are only shown if they were taken right after the task's latest run.
+    profiles = {}
+    for data in all_results:
+        try:
+            with open(os.path.join("tasks", data["task_name"], PROFILE_SUMMARY), 'r') as f:
+                profile = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        if profile.get("run_id") == data["run_id"] and profile["hotspots"]:
+            profiles[data["task_name"]] = profile
+    if profiles:
+        print("\n# Profile Hotspots\n")
+        print(f"| {'Task':<30} | {'Function':<50} | {'Calls':<9} | {'Self (s)':<8} | {'Cum. (s)':<8} |")
+        print(f"| {'-'*30} | {'-'*50} | {'-'*9} | {'-'*8} | {'-'*8} |")
+        for task_name, profile in profiles.items():
+            for hotspot in profile["hotspots"][:PROFILE_REPORT_HOTSPOTS]:
+                print(f"| {'`' + task_name + '`':<30} | {hotspot['function']:<50} | {hotspot['calls']:<9} | {hotspot['self_seconds']:<8.3f} | {hotspot['cumulative_seconds']:<8.3f} |")
+
+    if history:
+        print("\n# Run History (all sessions)\n")
+        print(f"| {'Task':<30} | {'Runs':<6} | {'Best':<12} | {'Verifier (s)':<12} | {'Last Run (UTC)':<19} |")
+        print(f"| {'-'*30} | {'-'*6} | {'-'*12} | {'-'*12} | {'-'*19} |")
+        for row in history:
+            task_name = f"`{row['task_name']}`"
+            verifier_duration = row['mean_verifier_duration'] or 0
+            best = f"{row['best_score']:.2f}/{row['max_score']:g}"
+            print(f"| {task_name:<30} | {row['runs']:<6} | {best:<12} | {verifier_duration:<12.3f} | {row['last_run'][:19]:<19} |")
+
     if os.path.exists(CONFIRMATION_FILE):
         os.remove(CONFIRMATION_FILE)
         print(f"\nRemoved '{CONFIRMATION_FILE}' to allow for re-running tests from scratch.")
@@ -251,43 +3823,272 @@ def reset_benchmark():
     if os.path.exists(CONFIRMATION_FILE):
         os.remove(CONFIRMATION_FILE)
         print("Removed .readme_confirmed")
-    # Clean up each task
-    tasks_dir = "tasks"
-    if os.path.isdir(tasks_dir):
-        for task_name in os.listdir(tasks_dir):
-            task_dir = os.path.join(tasks_dir, task_name)
-            if not os.path.isdir(task_dir):
-                continue
-            # Remove .start_time
-            start_time_path = os.path.join(task_dir, ".start_time")
-            if os.path.exists(start_time_path):
-                os.remove(start_time_path)
-                print(f"Removed {start_time_path}")
-            # Remove solution directory
-            solution_dir = os.path.join(task_dir, "solution")
-            if os.path.exists(solution_dir):
-                shutil.rmtree(solution_dir)
-                print(f"Removed {solution_dir}")
-            # Remove results.json
-            results_path = os.path.join(task_dir, "results.json")
-            if os.path.exists(results_path):
-                os.remove(results_path)
-                print(f"Removed {results_path}")
-            # Remove generated report in csv-report-generator (if exists)
-            if task_name == "csv-report-generator":
-                # Remove any .csv or .txt files in solution if present
-                solution_dir = os.path.join(task_dir, "solution")
-                if os.path.exists(solution_dir):
-                    for f in os.listdir(solution_dir):
-                        if f.endswith(".csv") or f.endswith(".txt") or f.lower().startswith("report"):
-                            try:
-                                os.remove(os.path.join(solution_dir, f))
-                                print(f"Removed {os.path.join(solution_dir, f)}")
-                            except Exception:
-                                pass
+    # Start a new session so report ignores earlier runs; the run history itself is kept.
+    conn = open_results_store()
+    try:
+        start_session(conn)
+    finally:
+        conn.close()
+    print(f"Started a new session in {RESULTS_DB}")
+    # Clean up each task: the files that evaluating it generates, plus any
+    # others that its task.json lists as glob patterns under "reset_paths".
+    for task_name in get_task_names():
+        task_dir = os.path.join("tasks", task_name)
+        try:
+            names = set(os.listdir(task_dir))
+        except FileNotFoundError:
+            continue
+        for pattern in load_task_config(task_name).get("reset_paths", []):
+            for path in sorted(glob.glob(os.path.join(task_dir, pattern))):
+                _remove_path(path)
+                print(f"Removed {path}")
+        for name in RESET_PATHS:
+            if name in names:
+                _remove_path(os.path.join(task_dir, name))
+                print(f"Removed {os.path.join(task_dir, name)}")
 
-def main():
-    """Main function to run and score benchmark tasks."""
+class _ThreadOutput:
+    """
+    Stand-in for sys.stdout or sys.stderr in the 'serve' daemon. Writes from a
+    thread running a job go to that job's client; all others go to the
+    original stream.
+    """
+
+    def __init__(self, name, original):
+        self._name = name
+        self._original = original
+
+    def write(self, text):
+        sink = getattr(_output_sinks, "sink", None)
+        if sink is None:
+            return self._original.write(text)
+        sink(self._name, text)
+        return len(text)
+
+    def flush(self):
+        if getattr(_output_sinks, "sink", None) is None:
+            self._original.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._original, name)
+
+def job_task_names(argv):
+    """Returns the tasks a command modifies, so that the daemon never runs two jobs on one task at once."""
+    try:
+        args = build_parser()[0].parse_args(argv)
+    except SystemExit:
+        return set()
+    if args.command == "start":
+        return {args.task}
+    if args.command == "evaluate" and not args.candidates:
+        return set(get_task_names() if args.all or not args.tasks else args.tasks)
+    if args.command in ("reset", "merge", "reverify"):
+        return set(get_task_names())
+    return set()
+
+def job_environ(argv, client_environ):
+    """
+    Returns the environment that a daemon job runs in: the daemon's own, except
+    for the variables that the job's tasks list under "environment" in their
+    task.json, which are taken from the client, set or unset. Other client
+    variables, such as PATH or PYTHONPATH, are ignored. Returns None, for the
+    daemon's own environment, if the client sent none.
+    """
+    if client_environ is None:
+        return None
+    try:
+        args = build_parser()[0].parse_args(argv)
+    except SystemExit:
+        args = None
+    catalogue = get_task_names()
+    if args is not None and args.command == "evaluate" and args.tasks:
+        task_names = [task_name for task_name in args.tasks if task_name in catalogue]
+    else:
+        task_names = catalogue
+    declared = {name for task_name in task_names for name in load_task_config(task_name).get("environment", [])}
+    environ = {name: value for name, value in os.environ.items() if name not in declared}
+    environ.update({name: client_environ[name] for name in declared if name in client_environ})
+    return environ
+
+def _peer_uid(connection):
+    """Returns the user id of the process at the other end of a Unix socket, or None if the platform cannot tell."""
+    import socket
+    import struct
+
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    credentials = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    return struct.unpack("3i", credentials)[1]
+
+def run_daemon_job(argv, sink, environ=None):
+    """Runs a command in the client's environ with its output sent to sink and returns its exit code."""
+    _output_sinks.sink = sink
+    _job_environs.environ = environ
+    try:
+        run_command(argv)
+        return 0
+    except SystemExit as exit:
+        if exit.code is None or isinstance(exit.code, int):
+            return exit.code or 0
+        print(exit.code, file=sys.stderr)
+        return 1
+    except Exception:
+        import traceback
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.stdout.flush()
+        _output_sinks.sink = None
+        _job_environs.environ = None
+
+def serve(socket_path, concurrency):
+    """
+    Runs the runner as a daemon on a Unix socket. Each connection sends one
+    command line as JSON and receives its output as JSON lines, followed by
+    its exit code. Commands wait in a queue for one of 'concurrency' job
+    threads, and two jobs touching the same task never run at the same time.
+    The task registry and verifier outcomes stay cached in memory between jobs.
+    Only the daemon's own user can connect: the socket is created with mode
+    0600, and connections from other users are refused where the platform
+    reports the peer's credentials.
+    """
+    global _output_sinks, _job_environs
+    import queue
+    import socketserver
+
+    if not hasattr(socketserver, "UnixStreamServer"):
+        print("Error: 'serve' needs Unix domain sockets, which this platform does not support.")
+        sys.exit(1)
+    if os.path.exists(socket_path):
+        import socket
+        probe = socket.socket(socket.AF_UNIX)
+        try:
+            probe.connect(socket_path)
+            print(f"Error: A daemon is already listening on '{socket_path}'.")
+            sys.exit(1)
+        except OSError:
+            os.remove(socket_path)
+        finally:
+            probe.close()
+
+    _output_sinks = threading.local()
+    _job_environs = threading.local()
+    sys.stdout = _ThreadOutput("stdout", sys.stdout)
+    sys.stderr = _ThreadOutput("stderr", sys.stderr)
+    # Create the verifier context once, before job threads race to create it.
+    get_verifier_context()
+    workdir = os.path.realpath(os.getcwd())
+    jobs = queue.Queue()
+    busy_tasks = set()
+    busy_changed = threading.Condition()
+
+    def run_jobs():
+        while True:
+            argv, environ, tasks, sink, done = jobs.get()
+            with busy_changed:
+                busy_changed.wait_for(lambda: not tasks & busy_tasks)
+                busy_tasks.update(tasks)
+            try:
+                done["exit_code"] = run_daemon_job(argv, sink, environ)
+            finally:
+                with busy_changed:
+                    busy_tasks.difference_update(tasks)
+                    busy_changed.notify_all()
+                done["event"].set()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            lock = threading.Lock()
+
+            def send(message):
+                with lock:
+                    try:
+                        self.wfile.write(json.dumps(message).encode() + b"\n")
+                        self.wfile.flush()
+                    except OSError:
+                        pass  # The client went away; the job still runs to completion.
+
+            if _peer_uid(self.request) not in (None, os.getuid()):
+                send({"error": "The daemon only serves the user that started it."})
+                return
+            try:
+                request = json.loads(self.rfile.readline())
+            except ValueError:
+                send({"error": "Malformed request."})
+                return
+            if os.path.realpath(request.get("cwd", "")) != workdir:
+                send({"error": f"The daemon serves '{workdir}'."})
+                return
+            argv = request["argv"]
+            environ = job_environ(argv, request.get("env"))
+            done = {"event": threading.Event()}
+            jobs.put((argv, environ, job_task_names(argv), lambda stream, data: send({"stream": stream, "data": data}), done))
+            done["event"].wait()
+            send({"exit_code": done["exit_code"]})
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    for _ in range(concurrency):
+        threading.Thread(target=run_jobs, daemon=True).start()
+    # Create the socket readable and writable by its owner only.
+    umask = os.umask(0o177)
+    try:
+        server = Server(socket_path, Handler)
+    finally:
+        os.umask(umask)
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    # Stop cleanly on SIGTERM too, e.g. from a service manager or a background job.
+    signal.signal(signal.SIGTERM, stop)
+    print(f"Runner daemon listening on '{socket_path}' with {concurrency} concurrent jobs. Press Ctrl+C to stop.", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+def route_to_daemon(argv):
+    """
+    Sends a command to a running 'serve' daemon and relays its output.
+    Returns the command's exit code, or None if it should run locally.
+    """
+    # Watch sessions run until interrupted, so they always run locally.
+    if os.environ.get("RUNNER_NO_DAEMON") or "serve" in argv or "--watch" in argv or not any(arg in DAEMON_COMMANDS for arg in argv):
+        return None
+    socket_path = os.environ.get("RUNNER_SOCKET", DAEMON_SOCKET)
+    import socket
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+    client = socket.socket(socket.AF_UNIX)
+    try:
+        client.connect(socket_path)
+    except OSError:
+        client.close()
+        return None
+    with client, client.makefile("rwb") as stream:
+        stream.write(json.dumps({"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}).encode() + b"\n")
+        stream.flush()
+        for line in stream:
+            message = json.loads(line)
+            if "error" in message:
+                print(f"Warning: {message['error']} Running the command locally.")
+                return None
+            if "exit_code" in message:
+                return message["exit_code"]
+            output = sys.stdout if message["stream"] == "stdout" else sys.stderr
+            output.write(message["data"])
+            output.flush()
+    print("Error: The runner daemon stopped before the command finished.")
+    return 1
+
+def build_parser():
+    """Builds the command-line parser; returns it with the subparsers whose errors main reports."""
     parser = argparse.ArgumentParser(
         description="Run and score benchmark tasks for a coding agent.",
         epilog="Please read the README.md for full instructions. You must run this script with '--confirm-i-have-viewed-entire-readme' once before you can use other commands."
@@ -304,15 +4105,69 @@ def main():
 
     # 'evaluate' command
     evaluate_parser = subparsers.add_parser("evaluate", help="Evaluate the solution for a task.")
-    evaluate_parser.add_argument("task", help="The name of the task to evaluate.")
+    evaluate_parser.add_argument("tasks", nargs="*", metavar="task", help="The name of the task(s) to evaluate.")
+    evaluate_parser.add_argument("--all", action="store_true", help="Evaluate every task.")
+    evaluate_parser.add_argument("--jobs", "-j", type=int, default=None, help="Number of verifiers to run in parallel (default: number of CPUs).")
+    evaluate_parser.add_argument("--no-cache", action="store_true", help="Always run the verifier instead of reusing a cached outcome.")
+    evaluate_parser.add_argument("--timeout", type=float, default=None, help="Wall-clock timeout in seconds for each verifier, overriding task.json.")
+    evaluate_parser.add_argument("--test-workers", type=int, default=1, metavar="N", help="Split each verifier's tests across N workers, each with its own copy of the solution.")
+    evaluate_parser.add_argument("--repeat", type=int, default=1, metavar="N", help="Run each verifier N times to measure timing noise and detect flaky tests.")
+    evaluate_parser.add_argument("--candidates", type=parse_candidates, default=None, metavar="DIR,DIR,...", help="Evaluate several candidates' solutions side by side, each in isolated workspaces.")
+    evaluate_parser.add_argument("--impact", action="store_true", help="Only re-run the tests that call solution code changed since the last traced run.")
+    evaluate_parser.add_argument("--profile", action="store_true", help="After scoring, profile a separate verifier run and save the hotspots next to results.json.")
+    evaluate_parser.add_argument("--watch", action="store_true", help="Re-verify the task whenever its solution changes, until interrupted.")
+    evaluate_parser.add_argument("--shard", type=parse_shard, default=None, metavar="i/N", help="Only evaluate shard i of N, balanced by expected duration (default: all tasks).")
+    evaluate_parser.add_argument("--durations", default=None, metavar="FILE", help="JSON file of expected verifier durations per task, used by --shard.")
 
     # 'report' command
-    subparsers.add_parser("report", help="Report the results of all completed tasks.")
+    report_parser = subparsers.add_parser("report", help="Report the results of all completed tasks.")
+    report_parser.add_argument("--history", action="store_true", help="Also summarize every recorded run per task.")
+    report_parser.add_argument("--timings", action="store_true", help="Also show where time went in each task's latest run.")
+    report_parser.add_argument("--session", type=int, default=None, metavar="N", help="Report session N, such as one recorded by 'reverify', instead of the current session.")
+
+    # 'export' command
+    export_parser = subparsers.add_parser("export", help="Export the latest results of this session for 'merge'.")
+    export_parser.add_argument("output", help="Path of the bundle to write.")
+
+    # 'merge' command
+    merge_parser = subparsers.add_parser("merge", help="Merge results exported from several shards into a new session.")
+    merge_parser.add_argument("bundles", nargs="+", metavar="bundle", help="Bundles written by 'export'.")
+    merge_parser.add_argument("--durations-out", default=None, metavar="FILE", help="Also write each task's verifier duration, for 'evaluate --durations'.")
+
+    # 'reverify' command
+    reverify_parser = subparsers.add_parser("reverify", help="Re-score recorded runs by replaying their solution snapshots against the current verifiers.")
+    reverify_parser.add_argument("snapshots", nargs="*", metavar="snapshot", help="Only replay the snapshots with these ids or unique id prefixes, from any session.")
+    reverify_parser.add_argument("--task", action="append", dest="tasks", default=None, metavar="TASK", help="Only replay runs of this task (repeatable).")
+    reverify_scope = reverify_parser.add_mutually_exclusive_group()
+    reverify_scope.add_argument("--session", type=int, default=None, help="Replay the runs of this session (default: the current session).")
+    reverify_scope.add_argument("--all-sessions", action="store_true", help="Replay the runs of every session.")
+    reverify_parser.add_argument("--jobs", "-j", type=int, default=None, help="Number of verifiers to run in parallel (default: number of CPUs).")
+    reverify_parser.add_argument("--timeout", type=float, default=None, help="Wall-clock timeout in seconds for each verifier, overriding task.json.")
 
     # 'reset' command (not documented)
     subparsers.add_parser("reset", help=argparse.SUPPRESS)
 
-    args = parser.parse_args()
+    # 'bench-startup' command (not documented)
+    bench_startup_parser = subparsers.add_parser("bench-startup", help=argparse.SUPPRESS)
+    bench_startup_parser.add_argument("tasks", nargs="*", metavar="task")
+    bench_startup_parser.add_argument("--repeat", type=int, default=5)
+
+    # 'bench-catalogue' command (not documented)
+    bench_catalogue_parser = subparsers.add_parser("bench-catalogue", help=argparse.SUPPRESS)
+    bench_catalogue_parser.add_argument("--tasks", default="100,1000,5000", metavar="N,N,...")
+    bench_catalogue_parser.add_argument("--repeat", type=int, default=3)
+
+    # 'serve' command
+    serve_parser = subparsers.add_parser("serve", help="Run as a daemon that the other commands are routed through.")
+    serve_parser.add_argument("--socket", default=DAEMON_SOCKET, help=f"Path of the Unix socket to listen on (default: {DAEMON_SOCKET}).")
+    serve_parser.add_argument("--concurrency", type=int, default=1, metavar="N", help="Number of commands to run at the same time (default: 1).")
+
+    return parser, evaluate_parser
+
+def run_command(argv):
+    """Runs one command line of the runner."""
+    parser, evaluate_parser = build_parser()
+    args = parser.parse_args(argv)
 
     # If --confirm-i-have-viewed-entire-readme is used, create the file.
     if args.confirm_i_have_viewed_entire_readme:
@@ -343,37 +4198,89 @@ def main():
     if args.command == "list":
         list_tasks()
     elif args.command == "start":
+        timings = {}
+        started = time.monotonic()
         prepare_workspace(args.task)
+        timings["workspace_prep"] = round(time.monotonic() - started, 6)
+        started = time.monotonic()
         display_prompt(args.task)
-        record_start_time(args.task)
+        timings["prompt_display"] = round(time.monotonic() - started, 6)
+        record_start_time(args.task, timings)
     elif args.command == "evaluate":
-        execution_time = get_execution_time(args.task)
-        pytest_output = run_verifier(args.task)
-        calculate_and_save_results(args.task, pytest_output, execution_time)
-        # Only delete .start_time if all tests passed
-        passed_tests = 0
-        total_tests = 0
-        summary_match = re.search(r"(\d+)\s+passed", pytest_output)
-        if summary_match:
-            passed_tests = int(summary_match.group(1))
-        failed_match = re.search(r"(\d+)\s+failed", pytest_output)
-        errored_match = re.search(r"(\d+)\s+error", pytest_output)
-        total_tests = passed_tests
-        if failed_match:
-            total_tests += int(failed_match.group(1))
-        if errored_match:
-            total_tests += int(errored_match.group(1))
-        if total_tests > 0 and passed_tests == total_tests:
-            # All tests passed, delete .start_time
-            task_dir = get_task_dir(args.task)
-            start_time_path = os.path.join(task_dir, ".start_time")
-            if os.path.exists(start_time_path):
-                os.remove(start_time_path)
+        if args.all and args.tasks:
+            evaluate_parser.error("specify task names or --all, not both")
+        task_names = get_task_names() if args.all or (args.shard and not args.tasks) else args.tasks
+        if not task_names:
+            evaluate_parser.error("specify at least one task name or --all")
+        if args.jobs is not None and args.jobs < 1:
+            evaluate_parser.error("--jobs must be at least 1")
+        if args.durations and not args.shard:
+            evaluate_parser.error("--durations requires --shard")
+        if args.shard:
+            index, count = args.shard
+            durations = load_expected_durations(task_names, args.durations)
+            task_names = partition_by_duration(task_names, durations, count)[index - 1]
+            print(f"Shard {index}/{count}: {', '.join(task_names) or 'no tasks'}")
+            if not task_names:
+                return
+        if args.repeat < 1:
+            evaluate_parser.error("--repeat must be at least 1")
+        if args.test_workers < 1:
+            evaluate_parser.error("--test-workers must be at least 1")
+        if args.candidates and args.repeat > 1:
+            evaluate_parser.error("--candidates cannot be combined with --repeat")
+        if args.candidates and args.test_workers > 1:
+            evaluate_parser.error("--candidates cannot be combined with --test-workers")
+        if args.watch and (len(task_names) != 1 or args.all or args.shard):
+            evaluate_parser.error("--watch takes exactly one task name")
+        if args.watch and (args.candidates or args.repeat > 1 or args.test_workers > 1):
+            evaluate_parser.error("--watch cannot be combined with --candidates, --repeat or --test-workers")
+        if args.profile and (args.candidates or args.watch):
+            evaluate_parser.error("--profile cannot be combined with --candidates or --watch")
+        if args.impact and (args.candidates or args.repeat > 1 or args.test_workers > 1 or args.watch):
+            evaluate_parser.error("--impact cannot be combined with --candidates, --repeat, --test-workers or --watch")
+        if args.watch:
+            watch_task(task_names[0], use_cache=not args.no_cache, timeout=args.timeout)
+        elif args.candidates:
+            evaluate_candidates(task_names, args.candidates, args.jobs or os.cpu_count() or 1, timeout=args.timeout)
+        elif args.repeat > 1:
+            jobs = args.jobs or os.cpu_count() or 1
+            evaluate_repeated(task_names, min(jobs, len(task_names)), args.repeat, timeout=args.timeout, test_workers=args.test_workers)
+        elif len(task_names) == 1:
+            evaluate_task(task_names[0], use_cache=not args.no_cache, timeout=args.timeout, test_workers=args.test_workers, impact=args.impact)
+        else:
+            jobs = args.jobs or os.cpu_count() or 1
+            evaluate_tasks(task_names, min(jobs, len(task_names)), use_cache=not args.no_cache, timeout=args.timeout, test_workers=args.test_workers, impact=args.impact)
+        if args.profile:
+            profile_tasks(task_names, min(args.jobs or os.cpu_count() or 1, len(task_names)), timeout=args.timeout)
     elif args.command == "report":
-        report_results()
+        report_results(show_history=args.history, show_timings=args.timings, session_id=args.session)
+    elif args.command == "export":
+        export_results(args.output)
+    elif args.command == "merge":
+        if not merge_results(args.bundles, args.durations_out):
+            sys.exit(1)
+    elif args.command == "reverify":
+        jobs = max(args.jobs or os.cpu_count() or 1, 1)
+        if not reverify_runs(args.snapshots, args.tasks, jobs, args.session, args.all_sessions, args.timeout):
+            sys.exit(1)
     elif args.command == "reset":
         reset_benchmark()
         print("Benchmark state has been reset.")
+    elif args.command == "bench-startup":
+        benchmark_verifier_startup(args.tasks or get_task_names(), max(args.repeat, 1))
+    elif args.command == "bench-catalogue":
+        benchmark_catalogue([int(size) for size in args.tasks.split(",")], max(args.repeat, 1))
+    elif args.command == "serve":
+        serve(args.socket, max(args.concurrency, 1))
+
+def main():
+    """Main function to run and score benchmark tasks."""
+    argv = sys.argv[1:]
+    exit_code = route_to_daemon(argv)
+    if exit_code is not None:
+        sys.exit(exit_code)
+    run_command(argv)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,51 @@
+import json
+import os
+import sys
+
+TASKS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tasks.json")
+
+
+def load():
+    if not os.path.exists(TASKS_FILE):
+        return []
+    with open(TASKS_FILE) as f:
+        return json.load(f)
+
+
+def save(tasks):
+    with open(TASKS_FILE, "w") as f:
+        json.dump(tasks, f)
+
+
+def main(argv):
+    if not argv:
+        print("Usage: todo.py add|list|complete|delete")
+        return 1
+    cmd, args = argv[0], argv[1:]
+    tasks = load()
+    if cmd == "add":
+        tasks.append({"task": " ".join(args), "completed": False})
+        save(tasks)
+    elif cmd == "list":
+        if not tasks:
+            print("No tasks yet.")
+        else:
+            print("\n".join(f"{i}. [{'x' if t['completed'] else ' '}] - {t['task']}" for i, t in enumerate(tasks, 1)))
+    elif cmd in ("complete", "delete"):
+        try:
+            idx = int(args[0]) - 1
+            if idx < 0 or idx >= len(tasks):
+                raise IndexError
+        except (IndexError, ValueError):
+            print("Invalid index")
+            return 1
+        if cmd == "complete":
+            tasks[idx]["completed"] = True
+        else:
+            del tasks[idx]
+        save(tasks)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,135 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+# Path to the solution script
+SOLUTION_PATH = Path(__file__).parent.parent / "solution" / "todo.py"
+TASKS_FILE = Path(__file__).parent.parent / "solution" / "tasks.json"
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
+# Number of pre-seeded tasks and timed invocations per command. Raise them to
+# stress solutions harder, e.g. TODO_STRESS_TASKS=1000000.
+STRESS_TASKS = int(os.environ.get("TODO_STRESS_TASKS", "100000"))
+STRESS_RUNS = int(os.environ.get("TODO_STRESS_RUNS", "15"))
+
+# Runs a script and writes its own peak RSS in KB to $PEAK_RSS_FILE on exit.
+PEAK_RSS_SCRIPT = PROJECT_ROOT / "verifier_support" / "peak_rss.py"
+
+
+class CommandTimings:
+    """Collects the latency and peak memory of repeated todo.py invocations."""
+
+    def __init__(self):
+        self.latencies_ms = []
+        self.peak_rss_mb = 0.0
+
+    def run(self, command):
+        """Runs a todo.py command, records its latency and peak RSS, and returns its stdout."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            peak_rss_path = os.path.join(tmp_dir, "peak_rss")
+            start = time.perf_counter()
+            process = subprocess.run(
+                [sys.executable, str(PEAK_RSS_SCRIPT), str(SOLUTION_PATH)] + command,
+                capture_output=True,
+                text=True,
+                cwd=PROJECT_ROOT,
+                env=dict(os.environ, PEAK_RSS_FILE=peak_rss_path),
+            )
+            self.latencies_ms.append((time.perf_counter() - start) * 1000)
+            if os.path.exists(peak_rss_path):
+                with open(peak_rss_path, "r") as f:
+                    self.peak_rss_mb = max(self.peak_rss_mb, int(f.read()) / 1024)
+        return process.stdout.strip()
+
+    def record(self, record_property, name):
+        """Emits p50/p95 latency and peak memory as metrics for the runner."""
+        latencies = sorted(self.latencies_ms)
+        record_property(f"metric:{name}_p50_ms", statistics.median(latencies))
+        record_property(f"metric:{name}_p95_ms", latencies[min(len(latencies) - 1, round(0.95 * (len(latencies) - 1)))])
+        record_property(f"metric:{name}_peak_memory_mb", self.peak_rss_mb)
+
+
+def read_tasks():
+    """Helper function to read tasks from the JSON file."""
+    with open(TASKS_FILE, "r") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def seeded_tasks():
+    """Pre-seeds tasks.json with a large to-do list and removes it afterwards."""
+    tasks = [{"task": f"Task {i}", "completed": i % 3 == 0} for i in range(1, STRESS_TASKS + 1)]
+    with open(TASKS_FILE, "w") as f:
+        json.dump(tasks, f)
+    yield tasks
+    if TASKS_FILE.exists():
+        TASKS_FILE.unlink()
+
+
+def test_stress_add(seeded_tasks, record_property):
+    """Test adding tasks to a very large list."""
+    timings = CommandTimings()
+    for i in range(STRESS_RUNS):
+        timings.run(["add", f"Stress task {i}"])
+    tasks = read_tasks()
+    assert len(tasks) == STRESS_TASKS + STRESS_RUNS
+    assert tasks[STRESS_TASKS - 1] == seeded_tasks[-1]
+    assert [t["task"] for t in tasks[STRESS_TASKS:]] == [f"Stress task {i}" for i in range(STRESS_RUNS)]
+    assert not any(t["completed"] for t in tasks[STRESS_TASKS:])
+    timings.record(record_property, "add")
+
+
+def test_stress_list(seeded_tasks, record_property):
+    """Test listing a very large list."""
+    timings = CommandTimings()
+    for _ in range(STRESS_RUNS):
+        output = timings.run(["list"])
+        lines = output.splitlines()
+        assert len(lines) == STRESS_TASKS
+        assert lines[0] == "1. [ ] - Task 1"
+        assert lines[2] == "3. [x] - Task 3"
+        last = seeded_tasks[-1]
+        assert lines[-1] == f"{STRESS_TASKS}. [{'x' if last['completed'] else ' '}] - {last['task']}"
+    timings.record(record_property, "list")
+
+
+def test_stress_complete(seeded_tasks, record_property):
+    """Test completing tasks spread across a very large list."""
+    timings = CommandTimings()
+    indexes = [1 + (STRESS_TASKS - 1) * i // max(1, STRESS_RUNS - 1) for i in range(STRESS_RUNS)]
+    for index in indexes:
+        timings.run(["complete", str(index)])
+    tasks = read_tasks()
+    assert len(tasks) == STRESS_TASKS
+    for index in indexes:
+        assert tasks[index - 1]["completed"]
+        assert tasks[index - 1]["task"] == f"Task {index}"
+    completed = set(indexes)
+    untouched = [i for i in range(STRESS_TASKS) if i + 1 not in completed]
+    assert all(tasks[i] == seeded_tasks[i] for i in untouched)
+    timings.record(record_property, "complete")
+
+
+def test_stress_delete(seeded_tasks, record_property):
+    """Test deleting tasks from the front of a very large list."""
+    timings = CommandTimings()
+    for _ in range(STRESS_RUNS):
+        timings.run(["delete", "1"])
+    tasks = read_tasks()
+    assert len(tasks) == STRESS_TASKS - STRESS_RUNS
+    assert tasks == seeded_tasks[STRESS_RUNS:]
+    timings.record(record_property, "delete")
+
+
+def test_stress_invalid_index(seeded_tasks):
+    """Test that an out-of-range index is rejected on a very large list."""
+    output = CommandTimings().run(["delete", str(STRESS_TASKS + 1)])
+    assert "Invalid index" in output
+    assert len(read_tasks()) == STRESS_TASKS
@@ -0,0 +1,19 @@
+import csv
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DATA = sys.argv[1] if len(sys.argv) > 1 else os.path.join(HERE, "..", "initial_code", "data.csv")
+REPORT = sys.argv[2] if len(sys.argv) > 2 else os.path.join(HERE, "report.txt")
+
+total = 0.0
+revenue = 0.0
+n = 0
+with open(DATA) as f:
+    for row in csv.DictReader(f):
+        p = float(row["price"])
+        total += p
+        revenue += p * int(row["quantity"])
+        n += 1
+with open(REPORT, "w") as f:
+    f.write(f"Sales Report\n============\nAverage Price: ${total / n:.2f}\nTotal Revenue: ${revenue:.2f}\n")
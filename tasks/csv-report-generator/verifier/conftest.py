@@ -0,0 +1,72 @@
+import json
+import os
+import random
+
+import pytest
+
+# Size and seed of the generated large-scale input. Raise the row count to test
+# multi-GB inputs, e.g. CSV_REPORT_SCALE_ROWS=100000000 (about 2.3 GB).
+SCALE_ROWS = int(os.environ.get("CSV_REPORT_SCALE_ROWS", "1000000"))
+SCALE_SEED = int(os.environ.get("CSV_REPORT_SCALE_SEED", "20240601"))
+# Generated files are cached here by seed and row count, outside the solution.
+# Isolated workspaces link this directory to the task's own, so they reuse it.
+DATA_CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../.generated'))
+
+CHUNK_ROWS = 100_000
+MIN_PRICE_CENTS, MAX_PRICE_CENTS = 100, 50_000
+MAX_QUANTITY = 100
+PRICE_STRINGS = [f"{cents // 100}.{cents % 100:02d}" for cents in range(MIN_PRICE_CENTS, MAX_PRICE_CENTS + 1)]
+QUANTITY_STRINGS = [str(quantity) for quantity in range(MAX_QUANTITY + 1)]
+
+
+def generate_sales_data(path, rows, seed):
+    """
+    Writes a deterministic product_id,price,quantity CSV with the given number
+    of rows and returns the exact expected report values. Rows are generated
+    and written in chunks, with prices in integer cents so the sums are exact.
+    """
+    rng = random.Random(seed)
+    price_indices = range(len(PRICE_STRINGS))
+    quantities = range(1, MAX_QUANTITY + 1)
+    line = "{},{},{}\n".format
+    price_cents_total = 0
+    revenue_cents = 0
+    with open(path, 'w', buffering=1 << 20) as f:
+        f.write("product_id,price,quantity\n")
+        for start in range(0, rows, CHUNK_ROWS):
+            count = min(CHUNK_ROWS, rows - start)
+            prices = rng.choices(price_indices, k=count)
+            quantity = rng.choices(quantities, k=count)
+            price_cents_total += sum(prices) + MIN_PRICE_CENTS * count
+            revenue_cents += sum(map(int.__mul__, prices, quantity)) + MIN_PRICE_CENTS * sum(quantity)
+            f.write("".join(map(
+                line,
+                range(100000 + start, 100000 + start + count),
+                map(PRICE_STRINGS.__getitem__, prices),
+                map(QUANTITY_STRINGS.__getitem__, quantity),
+            )))
+    return {
+        "rows": rows,
+        "average_price": price_cents_total / rows / 100,
+        "total_revenue": revenue_cents / 100,
+    }
+
+
+@pytest.fixture(scope="session")
+def scaled_sales_data():
+    """Returns the path and expected values of the large generated input, generating it once per seed."""
+    os.makedirs(DATA_CACHE_DIR, exist_ok=True)
+    name = f"sales-seed{SCALE_SEED}-rows{SCALE_ROWS}"
+    data_path = os.path.join(DATA_CACHE_DIR, f"{name}.csv")
+    expected_path = os.path.join(DATA_CACHE_DIR, f"{name}.json")
+    if not (os.path.exists(data_path) and os.path.exists(expected_path)):
+        tmp_path = f"{data_path}.{os.getpid()}.tmp"
+        expected = generate_sales_data(tmp_path, SCALE_ROWS, SCALE_SEED)
+        os.replace(tmp_path, data_path)
+        # Isolated workspaces share this directory, so other runs may read the file while it is written.
+        with open(f"{expected_path}.{os.getpid()}.tmp", 'w') as f:
+            json.dump(expected, f)
+        os.replace(f"{expected_path}.{os.getpid()}.tmp", expected_path)
+    with open(expected_path, 'r') as f:
+        expected = json.load(f)
+    return data_path, expected
@@ -0,0 +1,74 @@
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+import pytest
+
+SCRIPT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../solution/report_generator.py'))
+WORKSPACE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
+
+# Runs a script and writes its own peak RSS in KB to $PEAK_RSS_FILE on exit.
+PEAK_RSS_SCRIPT = os.path.join(WORKSPACE_ROOT, "verifier_support", "peak_rss.py")
+
+
+def run_measured(script_args, cwd):
+    """Runs a Python script and returns its exit code, stderr, wall time and peak RSS in MB."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        peak_rss_path = os.path.join(tmp_dir, "peak_rss")
+        stderr_path = os.path.join(tmp_dir, "stderr")
+        with open(stderr_path, 'wb') as stderr:
+            start = time.perf_counter()
+            process = subprocess.run(
+                [sys.executable, PEAK_RSS_SCRIPT] + script_args,
+                cwd=cwd,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr,
+                env=dict(os.environ, PEAK_RSS_FILE=peak_rss_path),
+            )
+            elapsed = time.perf_counter() - start
+        with open(stderr_path, 'r', errors="replace") as f:
+            stderr_text = f.read()
+        peak_rss_mb = None
+        if os.path.exists(peak_rss_path):
+            with open(peak_rss_path, 'r') as f:
+                peak_rss_mb = int(f.read()) / 1024
+        return process.returncode, stderr_text, elapsed, peak_rss_mb
+
+
+@pytest.fixture(scope="module")
+def scaled_report(scaled_sales_data, tmp_path_factory):
+    """Runs the report generator on the large generated input and returns the measurements."""
+    if not os.path.exists(SCRIPT_PATH):
+        pytest.fail(f"Report generator script not found at: {SCRIPT_PATH}")
+    data_path, expected = scaled_sales_data
+    report_path = tmp_path_factory.mktemp("scaled") / "report.txt"
+    returncode, stderr, elapsed, peak_rss_mb = run_measured([SCRIPT_PATH, data_path, str(report_path)], WORKSPACE_ROOT)
+    if returncode != 0:
+        pytest.fail(f"The report generator failed on the large input with the following error:\n{stderr}")
+    if not report_path.exists():
+        pytest.fail(f"Report file not found at: {report_path}")
+    return {
+        "content": report_path.read_text(),
+        "expected": expected,
+        "elapsed": elapsed,
+        "peak_rss_mb": peak_rss_mb,
+    }
+
+
+def test_large_input_report(scaled_report, record_property):
+    """Tests the report for a large generated input, and records throughput and peak memory."""
+    content = scaled_report["content"]
+    expected = scaled_report["expected"]
+    avg_price_match = re.search(r"Average Price: \$([\d\.]+)", content)
+    total_revenue_match = re.search(r"Total Revenue: \$([\d\.]+)", content)
+    assert avg_price_match, "Could not find 'Average Price' in the report."
+    assert total_revenue_match, "Could not find 'Total Revenue' in the report."
+    assert abs(float(avg_price_match.group(1)) - expected["average_price"]) < 0.01
+    assert abs(float(total_revenue_match.group(1)) - expected["total_revenue"]) < 0.01
+
+    record_property("metric:rows_per_second", expected["rows"] / scaled_report["elapsed"])
+    if scaled_report["peak_rss_mb"] is not None:
+        record_property("metric:peak_memory_mb", scaled_report["peak_rss_mb"])
@@ -0,0 +1,112 @@
+import argparse, csv, datetime, http.client, json, os, sys, time, urllib.error, urllib.request
+
+STEPS = ["download", "validate", "process", "report"]
+REQUIRED = ["id", "name", "value"]
+
+class Pipeline:
+    def __init__(self, workdir):
+        self.workdir = workdir
+        os.makedirs(workdir, exist_ok=True)
+        self.state_path = os.path.join(workdir, "state.json")
+        if os.path.exists(self.state_path):
+            with open(self.state_path) as f:
+                self.state = json.load(f)
+        else:
+            self.state = {"url": None, "steps": {}}
+            for i, s in enumerate(STEPS):
+                self.state["steps"][s] = {"status": "pending", "reason": "not started" if i == 0 else f"waiting for {STEPS[i-1]}"}
+            self.state["steps"]["download"]["attempts"] = 0
+    def path(self, n): return os.path.join(self.workdir, n)
+    def save(self):
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w") as f: json.dump(self.state, f, indent=2)
+        os.replace(tmp, self.state_path)
+    def log(self, level, step, msg):
+        with open(self.path("pipeline.log"), "a") as f:
+            f.write(f"{datetime.datetime.now().isoformat()} {level} {step}: {msg}\n")
+    def set(self, step, status, reason=""):
+        self.state["steps"][step]["status"] = status
+        self.state["steps"][step]["reason"] = reason
+        self.save()
+
+    def download(self, url):
+        part = self.path("data.csv.part")
+        self.state["steps"]["download"]["attempts"] = 0
+        for attempt in range(4):
+            self.state["steps"]["download"]["attempts"] = attempt + 1
+            if attempt: time.sleep(0.2)
+            offset = os.path.getsize(part) if os.path.exists(part) else 0
+            req = urllib.request.Request(url)
+            if offset: req.add_header("Range", f"bytes={offset}-")
+            try:
+                with urllib.request.urlopen(req, timeout=30) as resp:
+                    mode = "ab" if resp.status == 206 else "wb"
+                    expected = resp.length; got = 0
+                    with open(part, mode) as f:
+                        while True:
+                            try:
+                                chunk = resp.read(1 << 16)
+                            except http.client.IncompleteRead as e:
+                                f.write(e.partial); raise
+                            if not chunk: break
+                            f.write(chunk); got += len(chunk)
+                    if expected is not None and got < expected:
+                        raise http.client.IncompleteRead(b"", expected - got)
+                os.replace(part, self.path("data.csv"))
+                self.log("INFO", "download", f"downloaded {url} on attempt {attempt+1}")
+                return True
+            except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+                self.log("ERROR", "download", f"attempt {attempt+1} failed: {e!r}")
+        return False
+
+    def run(self, url):
+        self.state["url"] = url
+        steps = self.state["steps"]
+        if steps["download"]["status"] != "completed":
+            if not self.download(url):
+                self.set("download", "failed", "download failed after 4 attempts"); return 1
+            self.set("download", "completed")
+            self.set("validate", "pending", "not started")
+        with open(self.path("data.csv"), newline="") as f:
+            header = next(csv.reader(f), [])
+        if steps["validate"]["status"] != "completed":
+            missing = [c for c in REQUIRED if c not in header]
+            if missing:
+                r = "missing columns: " + ", ".join(missing)
+                self.log("ERROR", "validate", r); self.set("validate", "failed", r); return 1
+            self.log("INFO", "validate", "ok"); self.set("validate", "completed")
+        if steps["process"]["status"] != "completed" or steps["report"]["status"] != "completed":
+            total = active = processed = skipped = 0; tv = 0.0
+            with open(self.path("data.csv"), newline="") as f, open(self.path("detailed_report.csv.tmp"), "w", newline="") as out:
+                reader = csv.DictReader(f)
+                w = csv.writer(out); w.writerow(reader.fieldnames + ["cumulative_value"])
+                has_status = "status" in reader.fieldnames
+                for row in reader:
+                    total += 1
+                    if has_status and row["status"] != "active": continue
+                    active += 1
+                    try: v = float(row["value"])
+                    except ValueError:
+                        skipped += 1; self.log("ERROR", "process", f"row {row['id']}: bad value {row['value']!r}"); continue
+                    tv += v; processed += 1
+                    w.writerow(list(row.values()) + [f"{tv:g}" if tv != int(tv) else int(tv)])
+            self.set("process", "completed")
+            tvo = int(tv) if tv == int(tv) else tv
+            with open(self.path("summary.json"), "w") as f:
+                json.dump({"total_rows": total, "active_rows": active, "processed_rows": processed, "skipped_rows": skipped, "total_value": tvo}, f)
+            os.replace(self.path("detailed_report.csv.tmp"), self.path("detailed_report.csv"))
+            self.log("INFO", "report", "written"); self.set("report", "completed")
+        return 0
+
+def main():
+    p = argparse.ArgumentParser(); sub = p.add_subparsers(dest="cmd", required=True)
+    r = sub.add_parser("run"); r.add_argument("url"); r.add_argument("--workdir", required=True)
+    s = sub.add_parser("status"); s.add_argument("--workdir", required=True)
+    a = p.parse_args()
+    pl = Pipeline(a.workdir)
+    if a.cmd == "run": sys.exit(pl.run(a.url))
+    for step in STEPS:
+        st = pl.state["steps"][step]
+        print(f"{step}: {st['status']}" + (f" - {st['reason']}" if st["reason"] else ""))
+
+if __name__ == "__main__": main()
@@ -0,0 +1,203 @@
+import collections
+import os
+import random
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+DATA_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../initial_code/data.csv'))
+
+# Size and seed of the generated throughput input, e.g. DATA_PIPELINE_SCALE_ROWS=5000000.
+SCALE_ROWS = int(os.environ.get("DATA_PIPELINE_SCALE_ROWS", "200000"))
+SCALE_SEED = int(os.environ.get("DATA_PIPELINE_SCALE_SEED", "20240601"))
+
+CHUNK_SIZE = 64 * 1024
+RANGE_PATTERN = re.compile(r"bytes=(\d+)-$")
+STATUSES = ["active", "inactive", "pending", ""]
+
+
+class FaultInjectingServer:
+    """
+    Serves in-memory files over HTTP on 127.0.0.1 with configurable faults.
+
+    `latency` delays each response, `bandwidth` throttles bodies to that many
+    bytes per second, and queued faults apply to the next requests in order.
+    Range requests of the form `bytes=<start>-` are answered with 206. Every
+    request is recorded in `requests` with its range start, status and the
+    number of body bytes actually sent.
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.latency = 0.0
+        self.bandwidth = None
+        self.faults = collections.deque()
+        self.requests = []
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def url(self, path):
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}{path}"
+
+    def serve(self, path, content):
+        """Serves `content` (bytes) at `path` and returns its URL."""
+        self.files[path] = content
+        return self.url(path)
+
+    def queue_error(self, status, count=1):
+        """Answers the next `count` requests with the given HTTP status and no body."""
+        self.faults.extend([("status", status)] * count)
+
+    def queue_drop(self, sent_bytes, count=1):
+        """Closes the next `count` connections after this many body bytes (0 closes before responding)."""
+        self.faults.extend([("drop", sent_bytes)] * count)
+
+    def reset(self):
+        """Clears queued faults, latency, throttling and the request log."""
+        with self._lock:
+            self.faults.clear()
+            self.requests.clear()
+        self.latency = 0.0
+        self.bandwidth = None
+
+    def bytes_served(self, path):
+        return sum(request["bytes_sent"] for request in self.requests if request["path"] == path)
+
+    def _next_request(self, handler):
+        with self._lock:
+            fault = self.faults.popleft() if self.faults else None
+            match = RANGE_PATTERN.match(handler.headers.get("Range", ""))
+            request = {
+                "path": handler.path,
+                "range_start": int(match.group(1)) if match else None,
+                "status": None,
+                "bytes_sent": 0,
+            }
+            self.requests.append(request)
+        return request, fault
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                request, fault = server._next_request(self)
+                if server.latency:
+                    time.sleep(server.latency)
+                if fault == ("drop", 0):
+                    self._drop()
+                    return
+                if fault and fault[0] == "status":
+                    request["status"] = fault[1]
+                    self.send_response(fault[1])
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                content = server.files.get(self.path)
+                if content is None:
+                    request["status"] = 404
+                    self.send_error(404)
+                    return
+                start = request["range_start"]
+                if start is not None and start >= len(content):
+                    request["status"] = 416
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{len(content)}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = content[start:] if start is not None else content
+                request["status"] = 206 if start is not None else 200
+                self.send_response(request["status"])
+                self.send_header("Content-Type", "text/csv")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Accept-Ranges", "bytes")
+                if start is not None:
+                    self.send_header("Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}")
+                self.end_headers()
+                limit = fault[1] if fault and fault[0] == "drop" else len(body)
+                self._send_body(request, body[:limit])
+                if limit < len(body):
+                    self._drop()
+
+            def _send_body(self, request, body):
+                try:
+                    for offset in range(0, len(body), CHUNK_SIZE):
+                        chunk = body[offset:offset + CHUNK_SIZE]
+                        self.wfile.write(chunk)
+                        request["bytes_sent"] += len(chunk)
+                        if server.bandwidth:
+                            time.sleep(len(chunk) / server.bandwidth)
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def _drop(self):
+                self.close_connection = True
+                try:
+                    self.wfile.flush()
+                    self.connection.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def generate_pipeline_data(rows, seed):
+    """
+    Returns a deterministic id,name,status,value CSV with the given number of
+    rows and the summary the pipeline is expected to produce for it.
+    """
+    rng = random.Random(seed)
+    statuses = rng.choices(STATUSES, k=rows)
+    values = rng.choices(range(1, 10_000), k=rows)
+    lines = ["id,name,status,value\n"]
+    lines.extend(f"{i + 1},user{i + 1},{status},{value}\n" for i, (status, value) in enumerate(zip(statuses, values)))
+    active_values = [value for status, value in zip(statuses, values) if status == "active"]
+    expected = {
+        "total_rows": rows,
+        "active_rows": len(active_values),
+        "processed_rows": len(active_values),
+        "skipped_rows": 0,
+        "total_value": sum(active_values),
+    }
+    return "".join(lines).encode(), expected
+
+
+@pytest.fixture
+def http_server():
+    """A fresh fault-injecting HTTP server on 127.0.0.1 for each test."""
+    server = FaultInjectingServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def data_csv():
+    """The task's sample data.csv as bytes."""
+    with open(DATA_PATH, 'rb') as f:
+        return f.read()
+
+
+@pytest.fixture(scope="session")
+def scaled_pipeline_data():
+    """The large generated CSV and its expected summary, generated once per session."""
+    return generate_pipeline_data(SCALE_ROWS, SCALE_SEED)
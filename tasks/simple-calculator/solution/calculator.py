@@ -0,0 +1,37 @@
+class Calculator:
+    def add(self, a, b):
+        return a + b
+
+    def subtract(self, a, b):
+        return a - b
+
+    def multiply(self, a, b):
+        return a * b
+
+    def divide(self, a, b):
+        if b == 0:
+            raise ValueError("Cannot divide by zero")
+        return a / b
+
+    def _check(self, a, b):
+        if len(a) != len(b):
+            raise ValueError("Inputs must have the same length")
+
+    def add_batch(self, a, b):
+        self._check(a, b)
+        return [x + y for x, y in zip(a, b)]
+
+    def subtract_batch(self, a, b):
+        self._check(a, b)
+        return [x - y for x, y in zip(a, b)]
+
+    def multiply_batch(self, a, b):
+        self._check(a, b)
+        return [x * y for x, y in zip(a, b)]
+
+    def divide_batch(self, a, b):
+        self._check(a, b)
+        for i, y in enumerate(b):
+            if y == 0:
+                raise ValueError(f"Cannot divide by zero at index {i}")
+        return [x / y for x, y in zip(a, b)]
@@ -0,0 +1,167 @@
+import array
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+import pytest
+
+# Add the solution directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../solution')))
+
+from calculator import Calculator
+
+# Number of elements and seed of the large generated inputs, e.g.
+# SIMPLE_CALCULATOR_BATCH_SIZE=100000000 for inputs of 800 MB each.
+BATCH_SIZE = int(os.environ.get("SIMPLE_CALCULATOR_BATCH_SIZE", "10000000"))
+BATCH_SEED = int(os.environ.get("SIMPLE_CALCULATOR_BATCH_SEED", "20240601"))
+
+# The large inputs repeat a random block, so the expected results can be
+# computed on the block alone and repeated the same way.
+BLOCK_SIZE = 1 << 16
+
+OPERATIONS = {
+    "add_batch": lambda a, b: a + b,
+    "subtract_batch": lambda a, b: a - b,
+    "multiply_batch": lambda a, b: a * b,
+    "divide_batch": lambda a, b: a / b,
+}
+
+
+def repeat_to(block, size):
+    """Returns an array('d') of the given size that repeats block."""
+    return (block * (size // len(block) + 1))[:size]
+
+
+def as_floats(result):
+    """Converts a batch result to an array('d'), whatever sequence type it is."""
+    return result if isinstance(result, array.array) and result.typecode == 'd' else array.array('d', result)
+
+
+def read_status_kb(field):
+    """Returns a field of /proc/self/status in KB, such as VmRSS or VmHWM."""
+    with open("/proc/self/status") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith(f"{field}:"))
+
+
+def reset_peak_rss():
+    """
+    Resets this process's peak RSS to its current RSS and returns that in bytes,
+    so the growth of the peak measures one call. Returns None where this is not
+    supported (outside Linux); memory is then traced with tracemalloc instead.
+    """
+    try:
+        with open("/proc/self/clear_refs", 'w') as f:
+            f.write("5")
+        return read_status_kb("VmRSS") * 1024
+    except (OSError, StopIteration):
+        return None
+
+
+def first_mismatch(result, expected):
+    """Returns a description of the first element where result differs from expected."""
+    for index, (value, wanted) in enumerate(zip(result, expected)):
+        if value != wanted:
+            return f"element {index} is {value!r}, expected {wanted!r}"
+    return f"the result has {len(result)} elements, expected {len(expected)}"
+
+
+@pytest.fixture
+def calculator():
+    """Returns a Calculator instance."""
+    return Calculator()
+
+
+@pytest.fixture(scope="module")
+def batch_data():
+    """The large generated inputs and the expected result block of every batch operation."""
+    rng = random.Random(BATCH_SEED)
+    block_a = array.array('d', [rng.uniform(-1000, 1000) for _ in range(BLOCK_SIZE)])
+    # Divisors stay well away from zero.
+    block_b = array.array('d', [rng.uniform(0.5, 1000) * rng.choice((-1, 1)) for _ in range(BLOCK_SIZE)])
+    expected = {name: array.array('d', map(operation, block_a, block_b)) for name, operation in OPERATIONS.items()}
+    return repeat_to(block_a, BATCH_SIZE), repeat_to(block_b, BATCH_SIZE), expected
+
+
+@pytest.mark.parametrize("name", OPERATIONS)
+def test_batch_matches_scalar(calculator, name):
+    a = [1, -1, 0, 1.5, 6, -6, 5, 1e308, 0.1]
+    b = [2, 1, 100, 2.5, 3, -3, 2, 10.0, 0.2]
+    scalar = getattr(calculator, name[:-len("_batch")])
+    result = getattr(calculator, name)(a, b)
+    assert len(result) == len(a)
+    assert list(as_floats(result)) == [float(scalar(x, y)) for x, y in zip(a, b)]
+
+
+@pytest.mark.parametrize("name", OPERATIONS)
+def test_batch_accepts_arrays_and_tuples(calculator, name):
+    a = array.array('d', [2.0, 4.5, -8.0])
+    b = (4, 0.5, 2)
+    result = getattr(calculator, name)(a, b)
+    assert list(as_floats(result)) == [OPERATIONS[name](x, y) for x, y in zip(a, b)]
+    assert list(a) == [2.0, 4.5, -8.0]
+
+
+@pytest.mark.parametrize("name", OPERATIONS)
+def test_batch_empty(calculator, name):
+    assert len(getattr(calculator, name)([], [])) == 0
+
+
+@pytest.mark.parametrize("name", OPERATIONS)
+def test_batch_length_mismatch(calculator, name):
+    with pytest.raises(ValueError):
+        getattr(calculator, name)([1, 2, 3], [1, 2])
+
+
+def test_batch_inputs_unchanged(calculator):
+    a = [1.0, 2.0, 3.0]
+    b = array.array('d', [4.0, 5.0, 6.0])
+    for name in OPERATIONS:
+        getattr(calculator, name)(a, b)
+    assert a == [1.0, 2.0, 3.0]
+    assert list(b) == [4.0, 5.0, 6.0]
+
+
+@pytest.mark.parametrize("zero", [0, 0.0, -0.0])
+def test_divide_batch_by_zero(calculator, zero):
+    b = [1.0] * 100_000
+    b[77_777] = zero
+    b[90_000] = 0
+    with pytest.raises(ValueError) as excinfo:
+        calculator.divide_batch([1.0] * 100_000, b)
+    assert "77777" in str(excinfo.value)
+
+
+def test_batch_throughput(calculator, batch_data, record_property):
+    """Tests every batch operation on the large inputs and measures elements per second and peak memory."""
+    a, b, expected = batch_data
+    elapsed = 0.0
+    peak_bytes = 0
+    for name in OPERATIONS:
+        method = getattr(calculator, name)
+        gc.collect()
+        base_rss = reset_peak_rss()
+        start = time.perf_counter()
+        result = method(a, b)
+        elapsed += time.perf_counter() - start
+        if base_rss is not None:
+            peak_bytes = max(peak_bytes, read_status_kb("VmHWM") * 1024 - base_rss)
+        result, wanted = as_floats(result), repeat_to(expected[name], BATCH_SIZE)
+        assert result == wanted, f"{name}: {first_mismatch(result, wanted)}"
+        del result, wanted
+
+        if base_rss is None:
+            # Tracing allocations slows them down, so this takes a second call.
+            gc.collect()
+            tracemalloc.start()
+            try:
+                result = method(a, b)
+                peak_bytes = max(peak_bytes, tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+            del result
+
+    record_property("metric:elements_per_second", len(OPERATIONS) * BATCH_SIZE / elapsed)
+    record_property("metric:peak_memory_mb", peak_bytes / (1024 * 1024))
@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import runner
+from helpers import create_task
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """A benchmark root with one task, "demo", and its own results.db."""
+    task_dir = create_task(tmp_path, "demo")
+    monkeypatch.chdir(tmp_path)
+    # The registry and outcome caches are per process; each test has its own repository.
+    monkeypatch.setattr(runner, "_task_registry", None)
+    monkeypatch.setattr(runner, "_outcome_memory_cache", None)
+    return task_dir
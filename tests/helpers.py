@@ -0,0 +1,57 @@
+"""Sample tasks and builders of the verifier outcomes that the runner's functions take."""
+import runner
+
+
+CALCULATOR = '''\
+SCALE = 1
+
+def add(a, b):
+    return a + b
+
+def multiply(a, b):
+    return a * b
+'''
+
+VERIFIER = '''\
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "solution"))
+
+from calculator import add, multiply
+
+
+def test_add():
+    assert add(1, 2) == 3
+
+
+def test_multiply():
+    assert multiply(2, 3) == 6
+'''
+
+
+def create_task(root, name, solution=CALCULATOR, verifier=VERIFIER, task_json=None):
+    """Creates tasks/<name> under root with a calculator solution and a verifier for it."""
+    import json
+
+    task_dir = root / "tasks" / name
+    for subdir in ("solution", "verifier", "initial_code"):
+        (task_dir / subdir).mkdir(parents=True, exist_ok=True)
+    (task_dir / "solution" / "calculator.py").write_text(solution)
+    (task_dir / "verifier" / "test_calculator.py").write_text(verifier)
+    if task_json is not None:
+        (task_dir / "task.json").write_text(json.dumps(task_json))
+    return task_dir
+
+
+def result(nodeid, outcome="passed", duration=0.1):
+    return {"nodeid": nodeid, "outcome": outcome, "duration": duration}
+
+
+def make_outcome(tests, duration=1.0, exit_code=None):
+    counts = {name: 0 for name in runner.TEST_OUTCOMES}
+    for test in tests:
+        counts[test["outcome"]] += 1
+    if exit_code is None:
+        exit_code = 1 if counts["failed"] or counts["error"] else 0
+    return {"exit_code": exit_code, "duration": duration, "counts": counts, "tests": tests}
@@ -0,0 +1,96 @@
+import runner
+from helpers import make_outcome, result
+
+
+def make_run(tests, offset, duration=1.0, cache="miss", timings=None):
+    outcome = make_outcome(tests)
+    return {
+        "task_name": "demo", "timestamp": "2026-01-01T00:00:00+00:00",
+        "scores": {"correctness": 0, "task_completion": 0}, "final_score_objective": 0,
+        "execution_time_seconds": offset, "verifier_duration_seconds": duration,
+        "pytest_exit_code": outcome["exit_code"], "test_counts": outcome["counts"], "tests": tests,
+        "verifier_cache": cache, "timed_out": False, "resources": None, "max_score": 100,
+        "metrics": {}, "timings": dict(timings or {}),
+        "attempt": {"started_at": "2026-01-01T00:00:00+00:00", "offset_seconds": offset},
+    }
+
+
+def test_number_attempt_tracks_flips_and_first_pass(workdir):
+    conn = runner.open_results_store()
+    try:
+        first = make_run([result("t::a", "failed"), result("t::b")], offset=10.0, duration=2.0)
+        runner.record_run(first, conn)
+        second = make_run([result("t::a"), result("t::b")], offset=20.0, duration=3.0)
+        runner.record_run(second, conn)
+        third = make_run([result("t::a"), result("t::b", "failed")], offset=30.0, duration=1.0)
+        runner.record_run(third, conn)
+    finally:
+        conn.close()
+
+    assert first["attempt"]["number"] == 1
+    assert first["attempt"]["first_pass"] is None
+    assert second["attempt"]["number"] == 2
+    assert second["attempt"]["flipped"] == [{"nodeid": "t::a", "previous": "failed", "outcome": "passed"}]
+    assert second["attempt"]["first_pass"] == {"number": 2, "offset_seconds": 20.0}
+    assert second["attempt"]["verifier_seconds"] == 5.0
+    assert third["attempt"]["flips"] == 2
+    assert third["attempt"]["first_pass"] == {"number": 2, "offset_seconds": 20.0}
+    assert third["attempt"]["verifier_seconds"] == 6.0
+
+
+def test_number_attempt_counts_only_the_lookup_of_a_cache_hit(workdir):
+    conn = runner.open_results_store()
+    try:
+        runner.record_run(make_run([result("t::a")], offset=10.0, duration=2.0), conn)
+        hit = make_run([result("t::a")], offset=20.0, duration=2.0, cache="hit", timings={"cache_lookup": 0.01})
+        runner.record_run(hit, conn)
+    finally:
+        conn.close()
+    assert hit["attempt"]["verifier_seconds"] == 2.01
+
+
+def test_number_attempt_starts_a_new_timeline_after_start(workdir):
+    conn = runner.open_results_store()
+    try:
+        runner.record_run(make_run([result("t::a")], offset=10.0), conn)
+        restarted = make_run([result("t::a")], offset=5.0)
+        restarted["attempt"]["started_at"] = "2026-01-02T00:00:00+00:00"
+        runner.record_run(restarted, conn)
+    finally:
+        conn.close()
+    assert restarted["attempt"]["number"] == 1
+    assert restarted["attempt"]["flipped"] == []
+
+
+def test_number_attempt_counts_the_metric_rerun_of_a_cache_hit(workdir):
+    conn = runner.open_results_store()
+    try:
+        runner.record_run(make_run([result("t::a")], offset=10.0, duration=2.0), conn)
+        hit = make_run([result("t::a")], offset=20.0, duration=0.5, cache="hit", timings={"cache_lookup": 0.01})
+        hit["verifier_cache_rerun"] = 1
+        runner.record_run(hit, conn)
+        stored = conn.execute("SELECT run_verifier_seconds FROM runs ORDER BY run_id").fetchall()
+    finally:
+        conn.close()
+    assert hit["attempt"]["run_verifier_seconds"] == 0.51
+    assert hit["attempt"]["verifier_seconds"] == 2.51
+    assert [row[0] for row in stored] == [2.0, 0.51]
+
+
+def test_report_subtracts_only_the_counted_verifier_time(workdir, capsys):
+    conn = runner.open_results_store()
+    try:
+        runner.record_run(make_run([result("t::a")], offset=10.0, duration=2.0), conn)
+        # The hit replays a 5 second duration, of which only the 0.01 second lookup was spent.
+        hit = make_run([result("t::a")], offset=20.0, duration=5.0, cache="hit", timings={"cache_lookup": 0.01})
+        runner.record_run(hit, conn)
+    finally:
+        conn.close()
+
+    runner.report_results()
+
+    timeline = capsys.readouterr().out.split("# Attempt Timeline")[1]
+    row = next(line for line in timeline.splitlines() if line.startswith("| `demo`"))
+    cells = [cell.strip() for cell in row.split("|")[1:-1]]
+    assert cells[4] == "2.01"
+    assert cells[5] == "18.00"
@@ -0,0 +1,36 @@
+import json
+
+import runner
+
+BROKEN = "def add(a, b):\n    return a - b\n\ndef multiply(a, b):\n    return a * b\n"
+
+
+def test_candidates_are_scored_in_isolated_workspaces(workdir, tmp_path, capsys):
+    good, broken = tmp_path / "good", tmp_path / "broken"
+    (good / "demo").mkdir(parents=True)
+    (broken / "demo").mkdir(parents=True)
+    (good / "demo" / "calculator.py").write_text((workdir / "solution" / "calculator.py").read_text())
+    (broken / "demo" / "calculator.py").write_text(BROKEN)
+    (workdir / "solution" / "calculator.py").write_text("raise ImportError\n")
+
+    runner.evaluate_candidates(["demo"], [str(good), str(broken)], jobs=2)
+
+    [run_dir] = (tmp_path / runner.RUNS_DIR).iterdir()
+    matrix = json.loads((run_dir / "matrix.json").read_text())["results"]
+    assert matrix["good"]["demo"]["test_counts"]["passed"] == 2
+    assert matrix["broken"]["demo"]["test_counts"]["failed"] == 1
+    assert (run_dir / "broken" / "tasks" / "demo" / "solution" / "calculator.py").read_text() == BROKEN
+    assert (run_dir / "report.md").exists()
+    # The repository's own solution and results are left alone.
+    assert (workdir / "solution" / "calculator.py").read_text() == "raise ImportError\n"
+    assert not (workdir / "results.json").exists()
+
+
+def test_candidates_without_a_solution_are_skipped(workdir, tmp_path, capsys):
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "good" / "demo").mkdir(parents=True)
+    (tmp_path / "good" / "demo" / "calculator.py").write_text((workdir / "solution" / "calculator.py").read_text())
+
+    runner.evaluate_candidates(["demo"], [str(tmp_path / "good"), str(tmp_path / "empty")], jobs=1)
+
+    assert "Candidate 'empty' has no solution for 'demo'" in capsys.readouterr().out
@@ -0,0 +1,83 @@
+import os
+import signal
+import socket
+import stat
+import subprocess
+import sys
+import time
+
+import pytest
+
+import runner
+from helpers import create_task
+
+RUNNER = os.path.abspath(runner.__file__)
+
+# Records the variables that the verifier sees.
+ENV_VERIFIER = '''\
+import os
+
+
+def test_environment():
+    with open(os.path.join(os.path.dirname(__file__), "..", "seen.txt"), "w") as f:
+        f.write(f"{os.environ.get('DEMO_SCALE')} {os.environ.get('UNLISTED')}")
+'''
+
+
+@pytest.fixture
+def daemon(workdir, tmp_path):
+    """A 'serve' daemon for the workdir repository, on its own socket."""
+    (tmp_path / runner.CONFIRMATION_FILE).write_text("confirmed")
+    socket_path = tmp_path / "daemon.sock"
+    process = subprocess.Popen(
+        [sys.executable, RUNNER, "serve", "--socket", str(socket_path)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while not socket_path.exists() and time.monotonic() < deadline and process.poll() is None:
+            time.sleep(0.05)
+        assert socket_path.exists()
+        yield socket_path
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=30)
+
+
+def test_job_environ_takes_only_the_declared_variables_from_the_client(workdir, monkeypatch):
+    (workdir / "task.json").write_text('{"environment": ["DEMO_SCALE", "DEMO_SEED"]}')
+    monkeypatch.setenv("PATH", "/daemon/bin")
+    monkeypatch.setenv("DEMO_SEED", "daemon")
+    client = {"PATH": "/client/bin", "DEMO_SCALE": "2", "PYTHONPATH": "/client"}
+
+    environ = runner.job_environ(["evaluate", "demo"], client)
+
+    assert environ["PATH"] == "/daemon/bin"
+    assert environ["DEMO_SCALE"] == "2"
+    assert "DEMO_SEED" not in environ
+    assert environ.get("PYTHONPATH") == os.environ.get("PYTHONPATH")
+    assert runner.job_environ(["evaluate", "demo"], None) is None
+
+
+def test_peer_uid_is_the_connecting_user():
+    if not hasattr(socket, "SO_PEERCRED"):
+        pytest.skip("the platform does not report peer credentials")
+    left, right = socket.socketpair(socket.AF_UNIX)
+    with left, right:
+        assert runner._peer_uid(left) == os.getuid()
+
+
+def test_daemon_runs_client_commands_on_a_private_socket(daemon, workdir, tmp_path):
+    create_task(tmp_path, "env", verifier=ENV_VERIFIER, task_json={"environment": ["DEMO_SCALE"]})
+    env = dict(os.environ, RUNNER_SOCKET=str(daemon), DEMO_SCALE="3", UNLISTED="client")
+
+    completed = subprocess.run(
+        [sys.executable, RUNNER, "evaluate", "env", "--no-cache"],
+        cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120,
+    )
+
+    assert stat.S_IMODE(os.stat(daemon).st_mode) == 0o600
+    assert completed.returncode == 0, completed.stdout + completed.stderr
+    assert "Running the command locally" not in completed.stdout
+    assert "Results for 'env' saved" in completed.stdout
+    assert (tmp_path / "tasks" / "env" / "seen.txt").read_text() == "3 None"
@@ -0,0 +1,130 @@
+import pytest
+
+import runner
+from helpers import CALCULATOR, make_outcome, result
+
+
+def save_map(task_dir, tests, dependencies):
+    plan = runner.plan_impact_run("demo")
+    runner.save_impact_map("demo", plan, make_outcome(tests), dependencies)
+
+
+DEPENDENCIES = {
+    "test_calculator.py::test_add": {"spawns": False, "files": {"calculator.py": ["add"]}},
+    "test_calculator.py::test_multiply": {"spawns": False, "files": {"calculator.py": ["multiply"]}},
+}
+BASELINE = [result("test_calculator.py::test_add"), result("test_calculator.py::test_multiply")]
+
+
+def test_plan_impact_run_without_map_runs_everything(workdir):
+    plan = runner.plan_impact_run("demo")
+    assert plan["rerun"] is None
+    assert plan["reason"] == "no dependency map yet"
+
+
+def test_plan_impact_run_reruns_only_tests_calling_changed_functions(workdir):
+    save_map(workdir, BASELINE, DEPENDENCIES)
+    solution = workdir / "solution" / "calculator.py"
+    solution.write_text(CALCULATOR.replace("return a * b", "return b * a"))
+    assert runner.plan_impact_run("demo")["rerun"] == ["test_calculator.py::test_multiply"]
+
+
+def test_plan_impact_run_reuses_everything_when_nothing_changed(workdir):
+    save_map(workdir, BASELINE, DEPENDENCIES)
+    assert runner.plan_impact_run("demo")["rerun"] == []
+
+
+@pytest.mark.parametrize("change, reason", [
+    (lambda task_dir: (task_dir / "solution" / "calculator.py").write_text(CALCULATOR.replace("SCALE = 1", "SCALE = 2")),
+     "module-level code in 'calculator.py' changed"),
+    (lambda task_dir: (task_dir / "solution" / "notes.txt").write_text("new file"),
+     "solution files other than Python functions changed"),
+    (lambda task_dir: (task_dir / "verifier" / "test_calculator.py").write_text("def test_add():\n    assert True\n"),
+     "the verifier changed"),
+])
+def test_plan_impact_run_needs_full_run_for_untraceable_changes(workdir, change, reason):
+    save_map(workdir, BASELINE, DEPENDENCIES)
+    change(workdir)
+    plan = runner.plan_impact_run("demo")
+    assert plan["rerun"] is None
+    assert plan["reason"] == reason
+
+
+def test_plan_impact_run_always_reruns_failing_and_spawning_tests(workdir):
+    dependencies = dict(DEPENDENCIES, **{"test_calculator.py::test_multiply": {"spawns": True, "files": {}}})
+    baseline = [result("test_calculator.py::test_add", "failed"), result("test_calculator.py::test_multiply")]
+    save_map(workdir, baseline, dependencies)
+    assert runner.plan_impact_run("demo")["rerun"] == ["test_calculator.py::test_add", "test_calculator.py::test_multiply"]
+
+
+def test_merge_impact_outcome_matches_full_run(workdir):
+    """Re-running the impacted tests and reusing the rest scores the same as a full run."""
+    save_map(workdir, BASELINE, DEPENDENCIES)
+    (workdir / "solution" / "calculator.py").write_text(CALCULATOR.replace("return a * b", "return a + b"))
+    plan = runner.plan_impact_run("demo")
+    rerun = make_outcome([result("test_calculator.py::test_multiply", "failed")], duration=0.5)
+    full = make_outcome([result("test_calculator.py::test_add"), result("test_calculator.py::test_multiply", "failed")])
+
+    merged = runner.merge_impact_outcome(plan["map"]["outcome"], rerun, plan["rerun"])
+
+    assert [t["nodeid"] for t in merged["tests"]] == [t["nodeid"] for t in full["tests"]]
+    assert [t["outcome"] for t in merged["tests"]] == [t["outcome"] for t in full["tests"]]
+    assert merged["counts"] == full["counts"]
+    assert merged["exit_code"] == full["exit_code"] == 1
+    assert merged["duration"] == 0.5
+
+
+@pytest.mark.parametrize("outcome", [
+    make_outcome([], exit_code=5),
+    make_outcome([result("test_calculator.py::test_multiply")], duration=None),
+    make_outcome([result("test_calculator.py::test_multiply")], exit_code=2),
+])
+def test_merge_impact_outcome_rejects_incomplete_reruns(outcome):
+    assert runner.merge_impact_outcome(make_outcome(BASELINE), outcome, ["test_calculator.py::test_multiply"]) is None
+
+
+NESTED_SOURCE = '''\
+import functools
+
+
+def plain():
+    return [x for x in range(3)]
+
+
+class Shape:
+    @functools.lru_cache
+    def area(self):
+        return (lambda: 1)()
+
+    class Inner:
+        def method(self):
+            def helper():
+                pass
+            return helper
+
+
+@functools.wraps(plain)
+def outer():
+    class Local:
+        def run(self):
+            pass
+    return Local
+'''
+
+
+def code_objects(code):
+    yield code
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            yield from code_objects(const)
+
+
+def test_qualnames_are_rebuilt_from_the_source(tmp_path):
+    path = tmp_path / "nested.py"
+    path.write_text(NESTED_SOURCE)
+    scopes = runner._source_scopes(str(path))
+    codes = list(code_objects(compile(NESTED_SOURCE, str(path), "exec")))
+
+    assert len(codes) > 10
+    for code in codes:
+        assert runner._qualname_from_scopes(code, scopes) == code.co_qualname
@@ -0,0 +1,19 @@
+import json
+
+import runner
+from helpers import create_task
+
+
+def test_evaluate_tasks_scores_every_task(workdir, tmp_path, capsys):
+    create_task(tmp_path, "broken", solution="def add(a, b):\n    return a - b\n\ndef multiply(a, b):\n    return a * b\n")
+
+    runner.evaluate_tasks(["demo", "broken"], jobs=2, use_cache=False)
+
+    demo = json.loads((workdir / "results.json").read_text())
+    broken = json.loads((tmp_path / "tasks" / "broken" / "results.json").read_text())
+    assert demo["test_counts"]["passed"] == 2
+    assert broken["test_counts"]["passed"] == 1 and broken["test_counts"]["failed"] == 1
+    assert demo["final_score_objective"] > broken["final_score_objective"]
+    output = capsys.readouterr().out
+    assert "Running verifiers for 2 tasks with 2 parallel jobs..." in output
+    assert "Evaluated 2 tasks" in output
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+import runner
+from helpers import create_task
+
+
+# Emits a throughput metric of 500 against a budget of 1000.
+MEASURED_VERIFIER = '''\
+def test_throughput(record_property):
+    record_property("metric:rows_per_second", 500)
+'''
+
+
+def test_calculate_performance_score():
+    budgets = {
+        "rows_per_second": {"budget": 1000, "better": "higher"},
+        "peak_rss_mb": {"budget": 50, "better": "lower"},
+        "latency_ms": {"budget": 10, "better": "lower"},
+    }
+    score, breakdown = runner.calculate_performance_score(
+        budgets, {"rows_per_second": 500, "peak_rss_mb": 25}
+    )
+    assert breakdown["rows_per_second"]["fraction"] == 0.5
+    assert breakdown["peak_rss_mb"]["fraction"] == 1.0
+    assert breakdown["latency_ms"]["fraction"] == 0.0
+    assert breakdown["latency_ms"]["value"] is None
+    assert score == pytest.approx(runner.PERFORMANCE_POINTS * 1.5 / 3)
+
+
+def test_calculate_performance_score_lower_is_better():
+    budgets = {"seconds": {"budget": 2, "better": "lower"}}
+    assert runner.calculate_performance_score(budgets, {"seconds": 4})[1]["seconds"]["fraction"] == 0.5
+    assert runner.calculate_performance_score(budgets, {"seconds": 0})[0] == runner.PERFORMANCE_POINTS
+
+
+@pytest.mark.parametrize("budget", [{"budget": 0}, {"budget": -1}, {"budget": "fast"}, {"budget": 1, "better": "faster"}])
+def test_invalid_performance_budgets_are_rejected(budget, capsys):
+    with pytest.raises(SystemExit):
+        runner._validate_performance_budgets("demo", {"metric": budget})
+    assert "Error:" in capsys.readouterr().out
+
+
+def test_metrics_add_a_performance_axis_to_the_score(workdir, tmp_path, capsys):
+    budgets = {"rows_per_second": {"budget": 1000, "better": "higher"}}
+    task_dir = create_task(tmp_path, "measured", verifier=MEASURED_VERIFIER, task_json={"performance": budgets})
+    runner.evaluate_tasks(["demo", "measured"], jobs=1, use_cache=False)
+
+    data = json.loads((task_dir / "results.json").read_text())
+    assert data["metrics"] == {"rows_per_second": 500}
+    assert data["scores"]["performance"] == pytest.approx(runner.PERFORMANCE_POINTS / 2)
+    assert data["max_score"] == 80 + runner.PERFORMANCE_POINTS
+
+    capsys.readouterr()
+    runner.report_results(show_history=True)
+    history = capsys.readouterr().out.split("# Run History")[1]
+    row = next(line for line in history.splitlines() if line.startswith("| `measured`"))
+    assert f"{data['final_score_objective']:.2f}/100" in row
@@ -0,0 +1,21 @@
+import json
+
+import runner
+
+
+def test_verifier_phase_timings_skips_missing_marks():
+    timestamps = {"worker_start": 1.5, "session_start": 2.0, "collection_finish": 2.25}
+    assert runner.verifier_phase_timings(1.0, timestamps) == {
+        "verifier_spawn": 0.5, "pytest_startup": 0.5, "pytest_collection": 0.25,
+    }
+
+
+def test_results_record_every_phase_of_an_attempt(workdir):
+    runner.record_start_time("demo", {"workspace_prep": 0.2, "prompt_display": 0.1})
+    runner.evaluate_tasks(["demo"], jobs=1, use_cache=False)
+
+    timings = json.loads((workdir / "results.json").read_text())["timings"]
+    phases = [phase for phase, label in runner.TIMING_PHASES if phase != "cache_lookup"]
+    assert sorted(timings) == sorted(phases)
+    assert timings["workspace_prep"] == 0.2
+    assert all(seconds >= 0 for seconds in timings.values())
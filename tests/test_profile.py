@@ -0,0 +1,49 @@
+import json
+
+import runner
+from helpers import create_task
+
+# The solution spends its time in crunch(), so that it tops the profile.
+SLOW_SOLUTION = '''\
+def crunch():
+    total = 0
+    for number in range(2_000_000):
+        total += number * number
+    return total
+'''
+
+SLOW_VERIFIER = '''\
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "solution"))
+
+from calculator import crunch
+
+
+def test_crunch():
+    assert crunch() > 0
+'''
+
+
+def test_profile_attaches_the_hotspots_to_the_latest_results(workdir, tmp_path, capsys):
+    task_dir = create_task(tmp_path, "slow", solution=SLOW_SOLUTION, verifier=SLOW_VERIFIER)
+    runner.evaluate_tasks(["slow"], jobs=1, use_cache=False)
+
+    runner.profile_tasks(["demo", "slow"], jobs=1)
+
+    assert "'demo' has no results.json to attach a profile to" in capsys.readouterr().out
+    assert not (workdir / runner.PROFILE_SUMMARY).exists()
+    results = json.loads((task_dir / "results.json").read_text())
+    summary = json.loads((task_dir / runner.PROFILE_SUMMARY).read_text())
+    assert summary["run_id"] == results["run_id"]
+    assert summary["test_counts"]["passed"] == 1
+    assert "crunch" in summary["hotspots"][0]["function"]
+    assert results["profile"]["hotspots"] == summary["hotspots"][:runner.PROFILE_REPORT_HOTSPOTS]
+    assert (task_dir / runner.PROFILE_STACKS).read_text().strip()
+    # The profiled run is not recorded as another run.
+    conn = runner.open_results_store()
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM runs WHERE task_name = 'slow'").fetchone()[0] == 1
+    finally:
+        conn.close()
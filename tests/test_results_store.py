@@ -0,0 +1,52 @@
+import sqlite3
+
+import runner
+
+
+def test_new_store_gets_every_migration(workdir):
+    conn = runner.open_results_store()
+    try:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == len(runner.RESULTS_DB_MIGRATIONS)
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    finally:
+        conn.close()
+    assert {"sessions", "runs", "test_results", "run_timings", "run_metrics", "run_trials", "run_flips"} <= tables
+
+
+def test_old_store_is_upgraded_in_place(workdir):
+    conn = sqlite3.connect(runner.RESULTS_DB)
+    with conn:
+        conn.executescript(runner.RESULTS_DB_MIGRATIONS[0])
+        conn.execute("PRAGMA user_version = 1")
+        conn.execute("INSERT INTO sessions (started_at) VALUES ('2026-01-01T00:00:00+00:00')")
+        conn.execute(
+            """INSERT INTO runs (session_id, task_name, timestamp, correctness, task_completion, final_score,
+                                 passed, failed, errors, skipped, xfailed, xpassed)
+               VALUES (1, 'demo', '2026-01-01T00:00:00+00:00', 60, 20, 80, 2, 0, 0, 0, 0, 0)"""
+        )
+    conn.close()
+
+    conn = runner.open_results_store()
+    try:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == len(runner.RESULTS_DB_MIGRATIONS)
+        row = conn.execute("SELECT * FROM runs").fetchone()
+    finally:
+        conn.close()
+    assert row["final_score"] == 80
+    assert row["max_score"] == 80 and row["test_workers"] == 1 and row["snapshot"] is None
+
+
+def test_report_reads_the_latest_run_of_each_task(workdir, capsys):
+    (workdir / "solution" / "calculator.py").write_text("def add(a, b):\n    return 0\n\ndef multiply(a, b):\n    return a * b\n")
+    runner.evaluate_tasks(["demo"], 1, use_cache=False)
+    (workdir / "solution" / "calculator.py").write_text("def add(a, b):\n    return a + b\n\ndef multiply(a, b):\n    return a * b\n")
+    runner.evaluate_tasks(["demo"], 1, use_cache=False)
+    capsys.readouterr()
+
+    runner.report_results(show_history=True)
+
+    output = capsys.readouterr().out
+    row = next(line for line in output.splitlines() if line.startswith("| `demo`"))
+    assert "80.00/80" in row
+    history = [line for line in output.split("# Run History")[1].splitlines() if line.startswith("| `demo`")]
+    assert history and history[0].split("|")[2].strip() == "2"
@@ -0,0 +1,69 @@
+import json
+
+import runner
+from helpers import create_task
+
+
+def test_partition_by_duration_balances_and_keeps_order():
+    durations = {"a": 5.0, "b": 1.0, "c": 3.0, "d": 2.0, "e": 2.0}
+    groups = runner.partition_by_duration(list(durations), durations, 2)
+    assert sorted(name for group in groups for name in group) == sorted(durations)
+    loads = [sum(durations[name] for name in group) for group in groups]
+    assert max(loads) - min(loads) <= 1.0
+    for group in groups:
+        assert group == sorted(group, key=list(durations).index)
+
+
+def test_partition_by_duration_is_deterministic_on_ties():
+    durations = {name: 1.0 for name in "dcba"}
+    assert runner.partition_by_duration(list(durations), durations, 2) == [["c", "a"], ["d", "b"]]
+    assert runner.partition_by_duration(["x"], {"x": 1.0}, 3) == [["x"], [], []]
+
+
+def export_shard(task_name, path):
+    """Evaluates one task in a session of its own and exports it, like a shard on its own machine."""
+    conn = runner.open_results_store()
+    try:
+        runner.start_session(conn)
+    finally:
+        conn.close()
+    runner.evaluate_tasks([task_name], jobs=1, use_cache=False)
+    runner.export_results(str(path))
+
+
+def current_session():
+    conn = runner.open_results_store()
+    try:
+        return runner.get_current_session(conn)
+    finally:
+        conn.close()
+
+
+def test_merge_combines_shards_into_a_new_session(workdir, tmp_path, capsys):
+    create_task(tmp_path, "other")
+    export_shard("demo", tmp_path / "shard-1.json")
+    export_shard("other", tmp_path / "shard-2.json")
+    before = current_session()
+
+    assert runner.merge_results([str(tmp_path / "shard-1.json"), str(tmp_path / "shard-2.json")], str(tmp_path / "durations.json"))
+
+    assert current_session() == before + 1
+    assert sorted(json.loads((tmp_path / "durations.json").read_text())) == ["demo", "other"]
+    capsys.readouterr()
+    runner.report_results()
+    rows = [line for line in capsys.readouterr().out.splitlines() if line.startswith("| `")]
+    assert {row.split("|")[1].strip() for row in rows} >= {"`demo`", "`other`"}
+
+
+def test_merge_writes_nothing_when_a_task_is_missing(workdir, tmp_path, capsys):
+    create_task(tmp_path, "other")
+    export_shard("demo", tmp_path / "shard-1.json")
+    (workdir / "results.json").unlink()
+    before = current_session()
+
+    assert not runner.merge_results([str(tmp_path / "shard-1.json")], str(tmp_path / "durations.json"))
+
+    assert "- other" in capsys.readouterr().out
+    assert current_session() == before
+    assert not (workdir / "results.json").exists()
+    assert not (tmp_path / "durations.json").exists()
@@ -0,0 +1,110 @@
+import json
+import os
+import sqlite3
+
+import runner
+
+BROKEN = "def add(a, b):\n    return a - b\n\ndef multiply(a, b):\n    return a * b\n"
+
+
+def current_session():
+    conn = runner.open_results_store()
+    try:
+        return runner.get_current_session(conn)
+    finally:
+        conn.close()
+
+
+def test_snapshot_restores_the_solution_with_links_as_content(workdir, tmp_path):
+    outside = tmp_path / "data.txt"
+    outside.write_text("shared data")
+    solution = workdir / "solution"
+    os.symlink(outside, solution / "data.txt")
+    os.symlink(tmp_path / "missing.txt", solution / "broken.txt")
+    (solution / "copy.py").write_text((solution / "calculator.py").read_text())
+    (solution / "__pycache__").mkdir()
+    (solution / "__pycache__" / "calculator.cpython-311.pyc").write_bytes(b"bytecode")
+
+    snapshot_id = runner.snapshot_solution("demo")
+    manifest = runner.load_snapshot_manifest(snapshot_id)
+    restored = tmp_path / "restored"
+    runner.restore_snapshot(manifest, str(restored))
+
+    assert sorted(manifest["files"]) == ["calculator.py", "copy.py", "data.txt"]
+    assert manifest["files"]["copy.py"]["sha256"] == manifest["files"]["calculator.py"]["sha256"]
+    assert not (restored / "data.txt").is_symlink()
+    assert (restored / "data.txt").read_text() == "shared data"
+    assert runner.snapshot_solution("demo") == snapshot_id
+
+
+def test_pruning_drops_the_oldest_snapshots_and_their_own_objects(workdir, monkeypatch):
+    calculator = workdir / "solution" / "calculator.py"
+    notes = workdir / "solution" / "notes.txt"
+    notes.write_text("first " * 100)
+    old_id = runner.snapshot_solution("demo")
+    old_manifest = runner.load_snapshot_manifest(old_id)
+    os.utime(os.path.join(runner.SNAPSHOT_DIR, "manifests", f"{old_id}.json"), (1, 1))
+
+    notes.write_text("second " * 100)
+    monkeypatch.setattr(runner, "SNAPSHOT_DIR_MAX_BYTES", 1500)
+    new_id = runner.snapshot_solution("demo")
+
+    assert runner.load_snapshot_manifest(old_id) is None
+    assert runner.load_snapshot_manifest(new_id) is not None
+    assert not os.path.exists(runner._snapshot_object_path(old_manifest["files"]["notes.txt"]["sha256"]))
+    # The calculator is shared with the snapshot that is kept.
+    assert os.path.exists(runner._snapshot_object_path(runner._hash_file(str(calculator))))
+
+
+def test_reverify_rescores_in_a_session_of_its_own(workdir, capsys):
+    runner.evaluate_tasks(["demo"], jobs=1, use_cache=False)
+    (workdir / "solution" / "calculator.py").write_text(BROKEN)
+    runner.evaluate_tasks(["demo"], jobs=1, use_cache=False)
+    results_before = (workdir / "results.json").read_text()
+    session = current_session()
+    # The verifier no longer checks add(), so the broken solution now passes.
+    verifier = workdir / "verifier" / "test_calculator.py"
+    verifier.write_text(verifier.read_text().replace("assert add(1, 2) == 3", "pass"))
+    capsys.readouterr()
+
+    assert runner.reverify_runs([], None, jobs=1)
+
+    output = capsys.readouterr().out
+    assert "1 scores changed" in output
+    assert current_session() == session
+    assert (workdir / "results.json").read_text() == results_before
+    conn = runner.open_results_store()
+    try:
+        reverify_session, reverified = conn.execute(
+            "SELECT session_id, COUNT(*) FROM runs WHERE reverified_from IS NOT NULL GROUP BY session_id"
+        ).fetchone()
+    finally:
+        conn.close()
+    assert reverified == 2
+    assert f"report --session {reverify_session}" in output
+
+    runner.report_results(session_id=reverify_session)
+    row = next(line for line in capsys.readouterr().out.splitlines() if line.startswith("| `demo`"))
+    assert "80.00/80" in row
+    assert json.loads(results_before)["final_score_objective"] < 80
+
+
+def test_upgrade_keeps_earlier_reverify_sessions_out_of_the_way(workdir):
+    # A store from before 'reverify' sessions were told apart.
+    conn = sqlite3.connect(runner.RESULTS_DB)
+    with conn:
+        for migration in runner.RESULTS_DB_MIGRATIONS[:-1]:
+            conn.executescript(migration)
+        conn.execute(f"PRAGMA user_version = {len(runner.RESULTS_DB_MIGRATIONS) - 1}")
+        conn.execute("INSERT INTO sessions (started_at) VALUES ('2026-01-01T00:00:00+00:00')")
+        conn.execute("INSERT INTO sessions (started_at) VALUES ('2026-01-02T00:00:00+00:00')")
+        for session_id, reverified_from in ((1, None), (2, 1)):
+            conn.execute(
+                """INSERT INTO runs (session_id, task_name, timestamp, correctness, task_completion, final_score,
+                                     passed, failed, errors, skipped, xfailed, xpassed, reverified_from)
+                   VALUES (?, 'demo', '2026-01-01T00:00:00+00:00', 60, 20, 80, 2, 0, 0, 0, 0, 0, ?)""",
+                (session_id, reverified_from)
+            )
+    conn.close()
+
+    assert current_session() == 1
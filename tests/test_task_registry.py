@@ -0,0 +1,49 @@
+import os
+import shutil
+
+import runner
+from helpers import create_task
+
+
+def forget_registry(monkeypatch):
+    """Drops the in-process registry, as a new command would start without it."""
+    monkeypatch.setattr(runner, "_task_registry", None)
+
+
+def test_registry_rereads_only_added_tasks(workdir, tmp_path, monkeypatch):
+    create_task(tmp_path, "other", task_json={"expected_duration_seconds": 5})
+    assert runner.get_task_names() == ["demo", "other"]
+    assert (tmp_path / runner.TASK_REGISTRY).exists()
+
+    read = []
+    original = runner._read_task_json
+    monkeypatch.setattr(runner, "_read_task_json", lambda task_dir: read.append(os.path.basename(task_dir)) or original(task_dir))
+    forget_registry(monkeypatch)
+    assert runner.get_task_names() == ["demo", "other"]
+    assert read == []
+
+    create_task(tmp_path, "added")
+    forget_registry(monkeypatch)
+    assert runner.get_task_names() == ["added", "demo", "other"]
+    assert read == ["added"]
+    assert runner.load_task_config("other")["expected_duration_seconds"] == 5
+
+
+def test_registry_drops_removed_tasks(workdir, tmp_path):
+    create_task(tmp_path, "other")
+    runner.get_task_names()
+    shutil.rmtree(tmp_path / "tasks" / "other")
+    assert runner.get_task_names() == ["demo"]
+
+
+def test_task_json_edits_are_picked_up(workdir, monkeypatch):
+    config_path = workdir / "task.json"
+    config_path.write_text('{"limits": {"timeout_seconds": 10}}')
+    assert runner.load_task_config("demo")["limits"]["timeout_seconds"] == 10
+
+    config_path.write_text('{"limits": {"timeout_seconds": 20}}')
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert runner.load_task_config("demo")["limits"]["timeout_seconds"] == 20
+    forget_registry(monkeypatch)
+    assert runner.load_task_config("demo")["limits"]["timeout_seconds"] == 20
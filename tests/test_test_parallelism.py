@@ -0,0 +1,93 @@
+import runner
+from helpers import create_task, make_outcome, result
+
+
+# Each test fails if another test has already written to the solution directory it runs against.
+STATEFUL_VERIFIER = '''\
+import os
+
+STATE = os.path.join(os.path.dirname(__file__), "..", "solution", "state.log")
+
+
+def write_state(name):
+    assert not os.path.exists(STATE)
+    with open(STATE, "w") as f:
+        f.write(name)
+
+
+def test_first():
+    write_state("first")
+
+
+def test_second():
+    write_state("second")
+'''
+
+
+def worker_outcome(tests, duration, exit_code=0):
+    outcome = make_outcome(tests, duration, exit_code)
+    outcome.update({
+        "stdout": "ok", "stderr": "", "output": {"logs": [], "bytes": 2, "truncated": False},
+        "resources": {"user_cpu_seconds": 1.0, "system_cpu_seconds": 0.5, "max_rss_kb": 100},
+        "limits": None, "timed_out": False, "timings": {"pytest_startup": duration},
+    })
+    return outcome
+
+
+def test_merge_split_outcomes_restores_collection_order_and_totals():
+    collected = ["t::a", "t::b", "t::c"]
+    outcomes = [
+        worker_outcome([result("t::c", "failed", 2.0)], 2.5, exit_code=1),
+        worker_outcome([result("t::a", duration=1.0), result("t::b", duration=0.5)], 1.8),
+    ]
+    merged = runner.merge_split_outcomes(outcomes, collected, 2.6, {})
+
+    assert [t["nodeid"] for t in merged["tests"]] == collected
+    assert merged["exit_code"] == 1
+    assert merged["counts"]["passed"] == 2 and merged["counts"]["failed"] == 1
+    assert merged["duration"] == 2.6
+    assert merged["resources"] == {"user_cpu_seconds": 2.0, "system_cpu_seconds": 1.0, "max_rss_kb": 100}
+    assert merged["timings"] == {"pytest_startup": 2.5}
+    assert merged["test_parallelism"]["workers"] == 2
+    assert merged["test_parallelism"]["serial_seconds"] == 3.5
+    assert merged["test_parallelism"]["serial_source"] == "this run"
+
+
+def test_merge_split_outcomes_prefers_latest_serial_durations():
+    outcomes = [worker_outcome([result("t::a")], 1.0), worker_outcome([], 0.2, exit_code=5)]
+    merged = runner.merge_split_outcomes(outcomes, ["t::a"], 1.0, {"t::a": 4.0})
+    # A worker that collected nothing does not turn the run into "no tests collected".
+    assert merged["exit_code"] == 0
+    assert merged["test_parallelism"]["serial_seconds"] == 4.0
+    assert merged["test_parallelism"]["serial_source"] == "latest serial run"
+
+
+def test_plan_test_workers_falls_back_when_setup_outweighs_the_gain(workdir, monkeypatch):
+    monkeypatch.setattr(runner.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(runner, "latest_verifier_durations", lambda task_name: (10.0, None))
+    durations = {"a": 1.0, "b": 1.0}
+    workers, reason = runner.plan_test_workers("demo", ["a", "b"], 4, durations)
+    assert workers == 1 and "setup" in reason
+
+    durations = {"a": 9.0, "b": 9.0}
+    monkeypatch.setattr(runner, "latest_verifier_durations", lambda task_name: (20.0, None))
+    assert runner.plan_test_workers("demo", ["a", "b"], 4, durations) == (2, None)
+
+
+def test_plan_test_workers_never_repeats_a_slower_split(workdir, monkeypatch):
+    monkeypatch.setattr(runner.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(runner, "latest_verifier_durations", lambda task_name: (2.0, 3.0))
+    workers, reason = runner.plan_test_workers("demo", ["a", "b"], 2, {"a": 5.0, "b": 5.0})
+    assert workers == 1 and "no faster" in reason
+
+
+def test_split_workers_run_from_isolated_copies_of_the_solution(workdir, tmp_path, monkeypatch):
+    task_dir = create_task(tmp_path, "stateful", verifier=STATEFUL_VERIFIER)
+    monkeypatch.setattr(runner.os, "cpu_count", lambda: 2)
+
+    [(_, outcome)] = runner.iter_verifier_outcomes(["stateful"], 1, use_cache=False, test_workers=2)
+
+    assert outcome["counts"]["passed"] == 2
+    assert [test["nodeid"].rsplit("::", 1)[1] for test in outcome["tests"]] == ["test_first", "test_second"]
+    assert outcome["test_parallelism"]["workers"] == 2
+    assert not (task_dir / "solution" / "state.log").exists()
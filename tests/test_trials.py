@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+import runner
+from helpers import create_task
+
+
+# test_unstable fails on every other run of the verifier.
+FLAKY_VERIFIER = '''\
+import os
+
+COUNTER = os.path.join(os.path.dirname(__file__), "..", "runs.count")
+
+
+def test_stable():
+    pass
+
+
+def test_unstable():
+    runs = int(open(COUNTER).read()) + 1 if os.path.exists(COUNTER) else 1
+    with open(COUNTER, "w") as f:
+        f.write(str(runs))
+    assert runs % 2
+'''
+
+
+def test_duration_statistics():
+    stats = runner.duration_statistics([3.0, 1.0, 2.0, 4.0])
+    assert stats["count"] == 4
+    assert (stats["min"], stats["p50"], stats["max"]) == (1.0, 2.5, 4.0)
+    assert stats["mean"] == 2.5
+    assert stats["p95"] == 4.0
+    assert stats["stddev"] == pytest.approx(1.290994, abs=1e-6)
+    # t(0.975, 3) = 3.182
+    half_width = runner.T_CRITICAL_95[2] * stats["stddev"] / 2
+    assert stats["ci95_low"] == pytest.approx(2.5 - half_width, abs=1e-5)
+    assert stats["ci95_high"] == pytest.approx(2.5 + half_width, abs=1e-5)
+
+
+def test_duration_statistics_of_a_single_run_has_no_spread():
+    stats = runner.duration_statistics([1.5])
+    assert stats["stddev"] == 0.0
+    assert stats["ci95_low"] == stats["ci95_high"] == 1.5
+
+
+def test_repeated_trials_report_flaky_tests(workdir, tmp_path, capsys):
+    task_dir = create_task(tmp_path, "unstable", verifier=FLAKY_VERIFIER)
+    runner.evaluate_repeated(["unstable"], jobs=1, repeat=3)
+
+    data = json.loads((task_dir / "results.json").read_text())
+    trials = data["trials"]
+    assert trials["count"] == 3
+    assert [trial["failed"] for trial in trials["trials"]] == [0, 1, 0]
+    assert trials["verifier_duration"]["count"] == 3
+    assert trials["flaky_tests"] == [
+        {"nodeid": "tasks/unstable/verifier/test_calculator.py::test_unstable", "outcomes": {"passed": 2, "failed": 1}},
+    ]
+    # The first trial is the one that is scored.
+    assert data["test_counts"]["passed"] == 2
+    assert "Warning: Flaky test tasks/unstable/verifier/test_calculator.py::test_unstable (1 failed, 2 passed)" in capsys.readouterr().out
@@ -0,0 +1,75 @@
+import runner
+from helpers import create_task
+
+
+# Each test logs its name, so that it shows which tests actually ran.
+VERIFIER = '''\
+import os
+
+LOG = os.path.join(os.path.dirname(__file__), "..", "ran.log")
+
+
+def log(name):
+    with open(LOG, "a") as f:
+        f.write(name + "\\n")
+
+
+def test_correct():
+    log("test_correct")
+
+
+def test_speed(record_property):
+    log("test_speed")
+    record_property("metric:speed", float(os.environ.get("SPEED", "1")))
+'''
+
+
+def evaluate(task_name):
+    [(_, outcome)] = runner.iter_verifier_outcomes([task_name], 1, use_cache=True)
+    return outcome
+
+
+def test_cache_hit_reruns_only_the_metric_tests(workdir, tmp_path, monkeypatch):
+    task_dir = create_task(tmp_path, "measured", verifier=VERIFIER)
+    first = evaluate("measured")
+    monkeypatch.setenv("SPEED", "2")
+    second = evaluate("measured")
+
+    assert first["cache"] == "miss"
+    assert second["cache"] == "hit"
+    assert second["cache_rerun"] == 1
+    assert (task_dir / "ran.log").read_text().split() == ["test_correct", "test_speed", "test_speed"]
+    assert second["counts"]["passed"] == 2
+    speed = next(test for test in second["tests"] if test["nodeid"].endswith("::test_speed"))
+    assert speed["metrics"] == {"speed": 2.0}
+    assert {"cache_lookup", "test_execution"} <= set(second["timings"])
+
+
+def test_cache_hit_without_metric_tests_runs_nothing(workdir):
+    evaluate("demo")
+    hit = evaluate("demo")
+    assert hit["cache"] == "hit"
+    assert "cache_rerun" not in hit
+    assert list(hit["timings"]) == ["cache_lookup"]
+
+
+def test_failing_outcomes_are_not_cached(workdir):
+    (workdir / "solution" / "calculator.py").write_text("def add(a, b):\n    return 0\n\ndef multiply(a, b):\n    return a * b\n")
+    evaluate("demo")
+    assert evaluate("demo")["cache"] == "miss"
+
+
+def test_solution_change_misses_the_cache(workdir):
+    evaluate("demo")
+    (workdir / "solution" / "notes.txt").write_text("changed")
+    assert evaluate("demo")["cache"] == "miss"
+
+
+def test_cache_key_covers_the_listed_environment_only(workdir, monkeypatch):
+    (workdir / "task.json").write_text('{"environment": ["DEMO_SCALE"]}')
+    monkeypatch.setenv("DEMO_SCALE", "1")
+    small = runner.compute_verifier_cache_key("demo")
+    monkeypatch.setenv("UNLISTED", "1")
+    assert runner.compute_verifier_cache_key("demo") == small
+    monkeypatch.setenv("DEMO_SCALE", "2")
+    assert runner.compute_verifier_cache_key("demo") != small
@@ -0,0 +1,56 @@
+import time
+
+import runner
+from helpers import create_task
+
+
+# The test starts a grandchild that would outlive the verifier if only the worker were killed.
+HANGING_VERIFIER = '''\
+import os
+import subprocess
+import time
+
+
+def test_hangs():
+    child = subprocess.Popen(["sleep", "60"])
+    with open(os.path.join(os.path.dirname(__file__), "..", "child.pid"), "w") as f:
+        f.write(str(child.pid))
+    time.sleep(60)
+'''
+
+CPU_BOUND_VERIFIER = '''\
+def test_spins():
+    while True:
+        pass
+'''
+
+
+def is_running(pid):
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split(")")[-1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+def test_timeout_kills_the_verifier_and_everything_it_started(workdir, tmp_path):
+    task_dir = create_task(tmp_path, "hanging", verifier=HANGING_VERIFIER)
+    started = time.monotonic()
+    [(_, outcome)] = runner.iter_verifier_runs(["hanging"], 1, timeout=1)
+
+    assert time.monotonic() - started < 30
+    assert outcome["timed_out"] is True
+    assert outcome["counts"]["error"] == 1
+    assert "timed out after 1 seconds" in outcome["stderr"]
+    child = int((task_dir / "child.pid").read_text())
+    time.sleep(0.2)
+    assert not is_running(child)
+
+
+def test_cpu_limit_is_reported_as_an_error(workdir, tmp_path):
+    create_task(tmp_path, "spinning", verifier=CPU_BOUND_VERIFIER, task_json={"limits": {"cpu_seconds": 1}})
+    [(_, outcome)] = runner.iter_verifier_runs(["spinning"], 1)
+
+    assert outcome["timed_out"] is False
+    assert outcome["counts"]["error"] == 1
+    assert "CPU time limit of 1 seconds" in outcome["stderr"]
@@ -0,0 +1,63 @@
+import gzip
+import os
+
+import runner
+from helpers import create_task
+
+# Fails with far more captured output than the log keeps.
+NOISY_VERIFIER = '''\
+def test_noisy():
+    for number in range(20_000):
+        print(f"line {number:06d} of the noisy test's output")
+    assert False
+'''
+
+
+def test_output_log_is_compressed_and_capped(workdir, monkeypatch):
+    monkeypatch.setenv("RUNNER_VERIFIER_LOG_MAX_BYTES", "500")
+    echoed = []
+    log = runner.VerifierOutputLog("demo", lambda stream, text: echoed.append(text))
+    for number in range(100):
+        log.write("stdout", f"line {number:03d}\n")
+    log.write("stderr", "warning\n")
+
+    stdout, stderr, summary = log.close()
+
+    assert summary["bytes"] == 100 * 9 + 8
+    assert summary["truncated"] is True
+    with gzip.open(summary["logs"][0], "rb") as f:
+        content = f.read()
+    assert content.startswith(b"line 000\n")
+    assert content.endswith(b"\n[runner: log truncated at 500 bytes]\n")
+    # The echo and the tails still see everything.
+    assert len(echoed) == 101
+    assert stdout.endswith("line 099\n")
+    assert stderr == "warning\n"
+
+
+def test_verifier_output_spills_to_a_log(workdir, tmp_path, monkeypatch):
+    monkeypatch.setenv("RUNNER_VERIFIER_LOG_MAX_BYTES", "50000")
+    create_task(tmp_path, "noisy", verifier=NOISY_VERIFIER)
+
+    [(_, outcome)] = runner.iter_verifier_runs(["noisy"], 1)
+
+    assert outcome["counts"]["failed"] == 1
+    assert outcome["output"]["truncated"] is True
+    assert outcome["output"]["bytes"] > 20_000 * 30
+    assert os.path.getsize(outcome["output"]["logs"][0]) < 50_000
+    assert "1 failed" in outcome["stdout"]
+    assert len(outcome["stdout"]) <= runner.VERIFIER_OUTPUT_TAIL_CHARS
+
+
+def test_oldest_logs_are_pruned(workdir, tmp_path, monkeypatch):
+    monkeypatch.setattr(runner, "VERIFIER_LOG_DIR_MAX_BYTES", 250)
+    log_dir = tmp_path / runner.VERIFIER_LOG_DIR
+    log_dir.mkdir()
+    for age, name in enumerate(["newest", "middle", "oldest"]):
+        path = log_dir / f"{name}.log.gz"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (1_000_000 - age, 1_000_000 - age))
+
+    runner.prune_verifier_logs()
+
+    assert sorted(path.name for path in log_dir.iterdir()) == ["middle.log.gz", "newest.log.gz"]
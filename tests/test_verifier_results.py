@@ -0,0 +1,68 @@
+import runner
+from helpers import create_task
+
+
+VERIFIER = '''\
+import pytest
+
+
+@pytest.fixture
+def broken():
+    raise RuntimeError("fixture failed")
+
+
+def test_passes(record_property):
+    record_property("metric:speed", 2.5)
+
+
+def test_fails():
+    assert 1 == 2, "numbers differ"
+
+
+@pytest.mark.skip(reason="not today")
+def test_skipped():
+    pass
+
+
+@pytest.mark.xfail(reason="known bug")
+def test_xfailed():
+    assert False
+
+
+@pytest.mark.xfail(reason="fixed since")
+def test_xpassed():
+    pass
+
+
+def test_errors(broken):
+    pass
+'''
+
+
+def test_verifier_outcome_records_every_test(workdir, tmp_path):
+    create_task(tmp_path, "outcomes", verifier=VERIFIER)
+
+    [(task_name, outcome)] = runner.iter_verifier_runs(["outcomes"], 1)
+
+    assert task_name == "outcomes"
+    assert outcome["exit_code"] == 1
+    assert outcome["counts"] == {"passed": 1, "failed": 1, "error": 1, "skipped": 1, "xfailed": 1, "xpassed": 1}
+    tests = {test["nodeid"].split("::")[-1]: test for test in outcome["tests"]}
+    assert tests["test_passes"]["nodeid"] == "tasks/outcomes/verifier/test_calculator.py::test_passes"
+    assert tests["test_passes"]["metrics"] == {"speed": 2.5}
+    assert "numbers differ" in tests["test_fails"]["message"]
+    assert "fixture failed" in tests["test_errors"]["message"]
+    assert {name: test["outcome"] for name, test in tests.items()} == {
+        "test_passes": "passed", "test_fails": "failed", "test_skipped": "skipped",
+        "test_xfailed": "xfailed", "test_xpassed": "xpassed", "test_errors": "error",
+    }
+
+
+def test_collection_errors_are_scored_as_errors(workdir, tmp_path):
+    create_task(tmp_path, "unimportable", verifier="import missing_module_for_test\n")
+
+    [(_, outcome)] = runner.iter_verifier_runs(["unimportable"], 1)
+
+    assert outcome["counts"]["error"] == 1
+    assert outcome["counts"]["passed"] == 0
+    assert "missing_module_for_test" in outcome["tests"][0]["message"]
@@ -0,0 +1,26 @@
+import time
+
+import runner
+from helpers import CALCULATOR, create_task
+
+
+def test_solution_modules_do_not_leak_between_jobs(workdir):
+    [(_, first)] = runner.iter_verifier_runs(["demo"], 1)
+    (workdir / "solution" / "calculator.py").write_text(CALCULATOR.replace("return a + b", "return a - b"))
+    [(_, second)] = runner.iter_verifier_runs(["demo"], 1)
+
+    assert first["counts"]["passed"] == 2
+    # A worker that kept the first job's 'calculator' module would pass again.
+    assert second["counts"]["failed"] == 1
+
+
+def test_bench_startup_only_collects_the_tests(workdir, tmp_path, capsys):
+    create_task(tmp_path, "slow", verifier="import time\n\n\ndef test_slow():\n    time.sleep(5)\n")
+
+    started = time.monotonic()
+    runner.benchmark_verifier_startup(["slow"], 1)
+
+    assert time.monotonic() - started < 5
+    row = next(line for line in capsys.readouterr().out.splitlines() if line.startswith("| slow"))
+    cold, warm = (float(cell) for cell in row.split("|")[2:4])
+    assert 0 < warm < cold
@@ -0,0 +1,50 @@
+import runner
+
+# A second solution module, with tests of its own, next to the calculator.
+GREETING_TESTS = '''\
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "solution"))
+
+from greeting import greet
+
+
+def test_greet():
+    assert greet("x") == "hello x"
+'''
+
+
+def write_greeting(workdir, body):
+    (workdir / "solution" / "greeting.py").write_text(f"def greet(name):\n    return {body}\n")
+
+
+def test_watch_runs_the_affected_tests_before_the_full_verifier(workdir, tmp_path, capsys):
+    (workdir / "verifier" / "test_greeting.py").write_text(GREETING_TESTS)
+    write_greeting(workdir, '"bye " + name')
+    runner.record_start_time("demo", {})
+    workspace = str(tmp_path / "watch")
+    last_outcomes = {}
+
+    first = runner.run_watch_iteration("demo", workspace, [], last_outcomes, False, None)
+    assert first["focused"] is None
+    assert first["full"]["counts"]["failed"] == 1
+
+    write_greeting(workdir, '"hello " + name')
+    fixed = runner.run_watch_iteration("demo", workspace, ["solution/greeting.py"], last_outcomes, False, None)
+    assert (fixed["affected_tests"], fixed["failing_tests"]) == (1, 0)
+    assert fixed["focused"]["counts"]["passed"] == 1
+    assert fixed["full"]["counts"]["passed"] == 3
+
+    write_greeting(workdir, '"bye " + name')
+    broken = runner.run_watch_iteration("demo", workspace, ["solution/greeting.py"], last_outcomes, False, None)
+    assert broken["focused"]["counts"]["failed"] == 1
+    assert broken["full"] is None
+    assert "Skipping the full run until these pass." in capsys.readouterr().out
+    # Every iteration is timed from the same 'start'.
+    assert runner.read_start_record("demo") is not None
+
+
+def test_a_verifier_change_reruns_every_test(workdir):
+    last_outcomes = {"tasks/demo/verifier/test_calculator.py::test_add": "failed"}
+    assert runner.select_affected_tests("demo", ["verifier/test_calculator.py"], list(last_outcomes)) is None
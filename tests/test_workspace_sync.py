@@ -0,0 +1,70 @@
+import os
+import shutil
+
+import runner
+
+
+def synced_files(stats):
+    return {strategy: counts["files"] for strategy, counts in stats.items()}
+
+
+def test_sync_tree_only_touches_what_changed(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    (src / "pkg").mkdir(parents=True)
+    (src / "a.txt").write_text("a")
+    (src / "pkg" / "b.txt").write_text("bb")
+
+    first = runner.sync_tree(str(src), str(dst), runner.new_sync_stats())
+    assert first["copied"]["files"] + first["cloned"]["files"] == 2
+    assert first["unchanged"] == {"files": 0, "bytes": 0}
+
+    (src / "a.txt").write_text("changed")
+    (dst / "stale.txt").write_text("left over")
+    second = runner.sync_tree(str(src), str(dst), runner.new_sync_stats())
+    assert second["copied"]["files"] + second["cloned"]["files"] == 1
+    assert second["unchanged"] == {"files": 1, "bytes": 2}
+    assert (dst / "a.txt").read_text() == "changed"
+    assert not (dst / "stale.txt").exists()
+
+
+def test_sync_tree_never_shares_files_with_the_source(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    src.mkdir()
+    dst.mkdir()
+    (src / "fixture.txt").write_text("original")
+    # A hardlink left behind by an older runner is replaced by a copy.
+    os.link(src / "fixture.txt", dst / "fixture.txt")
+
+    runner.sync_tree(str(src), str(dst), runner.new_sync_stats())
+    (dst / "fixture.txt").write_text("edited by the agent")
+
+    assert (src / "fixture.txt").read_text() == "original"
+
+
+def test_start_reports_what_the_sync_did(workdir, capsys):
+    (workdir / "initial_code" / "calculator.py").write_text("def add(a, b):\n    pass\n")
+    (workdir / "initial_code" / "README").write_text("notes")
+    runner.prepare_workspace("demo")
+    capsys.readouterr()
+
+    (workdir / "initial_code" / "README").write_text("new notes")
+    runner.prepare_workspace("demo")
+
+    output = capsys.readouterr().out
+    assert "synced to" in output
+    stats = output.splitlines()[-1]
+    assert stats.endswith("1 already up to date (24 B).")
+    assert "1 files copied" in stats or "1 reflinked" in stats
+
+
+def test_run_workspaces_share_the_generated_inputs_of_the_task(workdir, tmp_path):
+    first, second = tmp_path / "run1", tmp_path / "run2"
+    runner.prepare_run_workspace("demo", str(first), str(workdir / "solution"))
+    (first / "tasks" / "demo" / ".generated" / "input.csv").write_text("rows")
+
+    runner.prepare_run_workspace("demo", str(second), str(workdir / "solution"))
+    runner.prepare_run_workspace("demo", str(second), str(workdir / "solution"))
+    shutil.rmtree(first)
+
+    assert (workdir / ".generated" / "input.csv").read_text() == "rows"
+    assert (second / "tasks" / "demo" / ".generated" / "input.csv").read_text() == "rows"
@@ -0,0 +1,34 @@
+"""
+Runs a Python script as __main__ and writes its own peak RSS in KB to the
+file named by $PEAK_RSS_FILE on exit:
+
+    python verifier_support/peak_rss.py <script> [args...]
+
+The peak must be read inside the child: on Linux, wait4() reports a maximum
+that includes the RSS the child inherited from the (much larger) pytest
+process that started it.
+"""
+import atexit
+import os
+import runpy
+import sys
+
+
+def report_peak_rss(path=os.environ["PEAK_RSS_FILE"]):
+    try:
+        with open("/proc/self/status") as f:
+            peak_kb = next(int(line.split()[1]) for line in f if line.startswith("VmHWM:"))
+    except (OSError, StopIteration):
+        import resource
+        peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak_kb //= 1024
+    with open(path, "w") as f:
+        f.write(str(peak_kb))
+
+
+if __name__ == "__main__":
+    atexit.register(report_peak_rss)
+    sys.argv = sys.argv[1:]
+    sys.path[0] = os.path.dirname(os.path.abspath(sys.argv[0]))
+    runpy.run_path(sys.argv[0], run_name="__main__")